@@ -0,0 +1,230 @@
+"""
+Benchmark de escalabilidade do emparelhamento.
+
+Gera entradas sintéticas (entidades/gerador.py) de vários tamanhos e mede,
+separadamente, cada fase da execução:
+
+    leitura, criar_grafo, fase1, fase2, estatisticas, visualizacao
+
+Cada tamanho roda em um processo novo, para que o pico de memória (RSS) de
+um caso não contamine o seguinte. Os resultados vão para
+benchmarks/resultados/<commit>.json e podem ser comparados entre commits:
+
+    python benchmarks/escalabilidade.py --tamanhos 1000 10000 100000
+    python benchmarks/escalabilidade.py --comparar benchmarks/resultados/abc123.json benchmarks/resultados/def456.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from entidades.gerador import escrever_entrada  # noqa: E402
+
+PASTA_BENCH = os.path.dirname(os.path.abspath(__file__))
+PASTA_ENTRADAS = os.path.join(PASTA_BENCH, ".entradas")
+PASTA_RESULTADOS = os.path.join(PASTA_BENCH, "resultados")
+
+FASES = ("leitura", "criar_grafo", "fase1", "fase2", "estatisticas", "visualizacao")
+
+
+# ---------------------------------------------------------
+# MEDIÇÃO
+# ---------------------------------------------------------
+class Cronometro:
+    """Acumula tempo por fase; envolver() troca um método da instância por uma versão cronometrada"""
+
+    def __init__(self):
+        self.tempos = dict.fromkeys(FASES + ("iniciar", "emparelhar", "aguardar"), 0.0)
+
+    @contextlib.contextmanager
+    def medir(self, fase):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tempos[fase] += time.perf_counter() - inicio
+
+    def envolver(self, objeto, metodo, fase):
+        original = getattr(objeto, metodo)
+
+        def cronometrado(*args, **kwargs):
+            with self.medir(fase):
+                return original(*args, **kwargs)
+
+        setattr(objeto, metodo, cronometrado)
+
+
+def _entrada(caso):
+    """Gera (ou reaproveita) os arquivos de entrada do caso"""
+    nome = "_".join(f"{k}-{caso[k]}" for k in ("alunos", "projetos", "prefs", "notas", "assimetria", "semente"))
+    pasta = os.path.join(PASTA_ENTRADAS, nome)
+    alunos, projetos = os.path.join(pasta, "alunos.txt"), os.path.join(pasta, "projetos.txt")
+    if not (os.path.exists(alunos) and os.path.exists(projetos)):
+        escrever_entrada(pasta, caso["alunos"], caso["projetos"], semente=caso["semente"],
+                         tamanho_prefs=tuple(caso["prefs"]), notas=caso["notas"],
+                         assimetria=caso["assimetria"])
+    return alunos, projetos
+
+
+def executar_caso(caso):
+    """Roda um caso completo (em um processo próprio) e devolve as medidas"""
+    from entidades.grafo import Grafo
+
+    caminho_alunos, caminho_projetos = _entrada(caso)
+
+    if caso["tracemalloc"]:
+        tracemalloc.start()
+
+    grafo = Grafo(visualizacoes=caso["visualizacoes"])
+    crono = Cronometro()
+    crono.envolver(grafo, "_criar_grafo", "criar_grafo")
+    crono.envolver(grafo, "_garantir_minimo_por_projeto", "fase2")
+    crono.envolver(grafo, "_imprimir_estatisticas", "estatisticas")
+    crono.envolver(grafo, "registrarVisualizacao", "visualizacao")
+    crono.envolver(grafo, "aguardar_visualizacoes", "aguardar")
+
+    cpu_inicio = time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with crono.medir("iniciar"):
+            grafo.iniciar(caminho_alunos, caminho_projetos, usar_cache=caso["cache"])
+        with crono.medir("emparelhar"):
+            grafo.emparelhar(motor=caso["motor"])
+        grafo.aguardar_visualizacoes()
+    cpu = time.process_time() - cpu_inicio
+
+    t = crono.tempos
+    t["leitura"] = t["iniciar"] - t["criar_grafo"]
+    # emparelhar inclui fase 2, estatísticas e o registro das visualizações;
+    # o que sobra é a fase 1 (mais a marcação final das arestas)
+    t["fase1"] = t["emparelhar"] - t["fase2"] - t["estatisticas"] - t["visualizacao"]
+    t["visualizacao"] += t["aguardar"]
+
+    resultado = {
+        "caso": caso,
+        "tempos_s": {fase: round(t[fase], 6) for fase in FASES},
+        "total_s": round(t["iniciar"] + t["emparelhar"] + t["aguardar"], 6),
+        "cpu_s": round(cpu, 6),
+        "pico_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "alunos_alocados": grafo.estatisticas.alunos_alocados,
+        "arestas": len(grafo.arestas),
+    }
+    if caso["tracemalloc"]:
+        resultado["pico_python_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+        tracemalloc.stop()
+    return resultado
+
+
+# ---------------------------------------------------------
+# RELATÓRIO
+# ---------------------------------------------------------
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "sem-git"
+
+
+def formatar(resultados):
+    cab = f"{'alunos':>9} " + " ".join(f"{f:>12}" for f in FASES) + f" {'total':>9} {'RSS MB':>8}"
+    linhas = [cab, "-" * len(cab)]
+    for r in resultados:
+        linhas.append(f"{r['caso']['alunos']:>9} "
+                      + " ".join(f"{r['tempos_s'][f]:>12.4f}" for f in FASES)
+                      + f" {r['total_s']:>9.3f} {r['pico_rss_mb']:>8.1f}")
+    return "\n".join(linhas)
+
+
+def comparar(caminho_a, caminho_b):
+    """Razão B/A dos tempos por fase para os tamanhos presentes nos dois arquivos"""
+    with open(caminho_a, encoding="utf-8") as arq:
+        a = {r["caso"]["alunos"]: r for r in json.load(arq)["resultados"]}
+    with open(caminho_b, encoding="utf-8") as arq:
+        b = {r["caso"]["alunos"]: r for r in json.load(arq)["resultados"]}
+
+    cab = f"{'alunos':>9} " + " ".join(f"{f:>12}" for f in FASES) + f" {'total':>9}"
+    linhas = [f"{caminho_b} / {caminho_a}", cab, "-" * len(cab)]
+    for n in sorted(a.keys() & b.keys()):
+        razoes = []
+        for f in FASES:
+            ta, tb = a[n]["tempos_s"][f], b[n]["tempos_s"][f]
+            razoes.append(f"{tb / ta:>11.2f}x" if ta else f"{'-':>12}")
+        linhas.append(f"{n:>9} " + " ".join(razoes) + f" {b[n]['total_s'] / a[n]['total_s']:>8.2f}x")
+    return "\n".join(linhas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade do emparelhamento")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="números de alunos (padrão: 10³, 10⁴, 10⁵)")
+    parser.add_argument("--projetos-por-aluno", type=float, default=0.25,
+                        help="projetos gerados por aluno (padrão: 0.25, como na entrada de exemplo)")
+    parser.add_argument("--prefs", type=int, nargs=2, default=[3, 3], metavar=("MIN", "MAX"),
+                        help="tamanho da lista de preferências")
+    parser.add_argument("--notas", default="amostra", help="distribuição de notas (ver gerador.py)")
+    parser.add_argument("--assimetria", type=float, default=1.0, help="expoente de Zipf da popularidade")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--motor", default="objetos", choices=["objetos", "vetorial"])
+    parser.add_argument("--cache", action="store_true", help="usa o cache binário na leitura")
+    parser.add_argument("--visualizacoes", type=int, default=2000, metavar="N",
+                        help="gera as imagens só para casos com até N alunos (padrão: 2000)")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="mede também o pico de memória Python (mais lento)")
+    parser.add_argument("--saida", help="arquivo JSON de resultados (padrão: resultados/<commit>.json)")
+    parser.add_argument("--comparar", nargs=2, metavar=("A.json", "B.json"),
+                        help="compara dois arquivos de resultados e sai")
+    args = parser.parse_args()
+
+    if args.comparar:
+        print(comparar(*args.comparar))
+        return
+
+    resultados = []
+    print("\n".join(formatar([]).splitlines()[:2]))
+    for n in args.tamanhos:
+        caso = {
+            "alunos": n,
+            "projetos": max(1, int(n * args.projetos_por_aluno)),
+            "prefs": args.prefs,
+            "notas": args.notas,
+            "assimetria": args.assimetria,
+            "semente": args.semente,
+            "motor": args.motor,
+            "cache": args.cache,
+            "visualizacoes": n <= args.visualizacoes,
+            "tracemalloc": args.tracemalloc,
+        }
+        # processo novo por caso: o pico de RSS é só deste caso
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            resultados.append(executor.submit(executar_caso, caso).result())
+        print(formatar(resultados[-1:]).splitlines()[-1])
+
+    commit = _commit()
+    saida = args.saida or os.path.join(PASTA_RESULTADOS, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as arq:
+        json.dump({
+            "commit": commit,
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "resultados": resultados,
+        }, arq, indent=2)
+    print(f"\nResultados salvos em {saida}")
+
+
+if __name__ == "__main__":
+    main()
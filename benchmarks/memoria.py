@@ -0,0 +1,92 @@
+"""
+Benchmark de memória por aluno.
+
+Lê uma entrada sintética (entidades/gerador.py) com ler_alunos e mede, com
+tracemalloc, quantos bytes a lista de Alunos mantém viva dividido pelo número
+de alunos. Para comparação, a mesma leitura é repetida com o layout antigo
+(objeto com __dict__, atributo tipo por instância e lista de códigos não
+internados), que é reproduzido aqui só para o benchmark.
+
+    python benchmarks/memoria.py --tamanhos 100000 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from entidades import leitor  # noqa: E402
+from entidades.gerador import escrever_entrada  # noqa: E402
+
+PASTA_ENTRADAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".entradas")
+
+LAYOUTS = ("atual", "legado")
+
+
+class AlunoLegado:
+    """Layout de Aluno antes dos __slots__ (só para comparação)"""
+
+    def __init__(self, codigo, preferencias_projetos, nota):
+        self.codigo = codigo
+        self.preferencias_projetos = preferencias_projetos
+        self.nota = nota
+        self.tipo = 'aluno'
+
+
+def _entrada(n_alunos, semente):
+    pasta = os.path.join(PASTA_ENTRADAS, f"memoria_alunos-{n_alunos}_semente-{semente}")
+    caminho = os.path.join(pasta, "alunos.txt")
+    if not os.path.exists(caminho):
+        escrever_entrada(pasta, n_alunos, semente=semente)
+    return caminho
+
+
+def medir(n_alunos, layout, semente=0):
+    """Bytes por aluno mantidos pela lista lida (em um processo próprio)"""
+    caminho = _entrada(n_alunos, semente)
+    if layout == "legado":
+        leitor.Aluno = AlunoLegado
+
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    alunos = list(leitor.ler_alunos(caminho))
+    tempo = time.perf_counter() - inicio
+    gc.collect()
+    atual = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "alunos": len(alunos),
+        "layout": layout,
+        "bytes_por_aluno": round(atual / max(1, len(alunos)), 1),
+        "leitura_s": round(tempo, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memória por aluno (layout atual vs. antigo)")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[100000, 1000000],
+                        help="números de alunos (padrão: 10⁵ e 10⁶)")
+    parser.add_argument("--layouts", nargs="+", default=list(LAYOUTS), choices=LAYOUTS)
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'alunos':>9} {'layout':>8} {'bytes/aluno':>12} {'leitura s':>10}")
+    print("-" * 42)
+    for n in args.tamanhos:
+        for layout in args.layouts:
+            # processo novo por medida: nada do caso anterior fica no heap
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                r = executor.submit(medir, n, layout, args.semente).result()
+            print(f"{r['alunos']:>9} {r['layout']:>8} {r['bytes_por_aluno']:>12.1f} {r['leitura_s']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
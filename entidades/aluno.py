@@ -1,21 +1,29 @@
+import sys
+
+
 class Aluno:
+    # sem __dict__ por instância: só os três campos abaixo
+    __slots__ = ("codigo", "preferencias_projetos", "nota")
+
+    tipo = 'aluno'  # compartilhado pela classe (flyweight), não copiado em cada objeto
+
     def __init__(self, codigo, preferencias_projetos: list, nota: int):
-        self.codigo = codigo
-        self.preferencias_projetos = preferencias_projetos
+        self.codigo = sys.intern(codigo)
+        # tupla de códigos internados: os mesmos objetos str dos códigos de Projeto
+        self.preferencias_projetos = tuple(map(sys.intern, preferencias_projetos))
         self.nota = nota
-        self.tipo = 'aluno'
 
     def getCodigo(self) -> str:
         return self.codigo
 
     def setCodigo(self, codigo: str):
-        self.codigo = codigo
+        self.codigo = sys.intern(codigo)
 
-    def getPreferenciasProjetos(self) -> list:
+    def getPreferenciasProjetos(self) -> tuple:
         return self.preferencias_projetos
 
     def setPreferenciasProjetos(self, preferencias_projetos: list):
-        self.preferencias_projetos = preferencias_projetos
+        self.preferencias_projetos = tuple(map(sys.intern, preferencias_projetos))
 
     def getNota(self) -> int:
         return self.nota
@@ -27,7 +35,8 @@ class Aluno:
         return self.tipo
 
     def setTipo(self, tipo: str):
-        self.tipo = tipo
+        if tipo != self.tipo:
+            raise ValueError(f"Tipo de Aluno é fixo ('{self.tipo}'), recebido '{tipo}'")
 
     def __str__(self):
-        return f"{self.getCodigo()} - {self.getPreferenciasProjetos()} - {self.getNota()}"
\ No newline at end of file
+        return f"{self.getCodigo()} - {list(self.getPreferenciasProjetos())} - {self.getNota()}"
@@ -0,0 +1,236 @@
+from array import array
+
+# códigos de status das arestas (1 byte por aresta)
+PREFERENCIA, PROPOSTA, TEMPORARIO, REJEICAO, FINAL = range(5)
+REMOVIDA = 255
+
+CORES = ("black", "blue", "green", "red", "orange")
+
+# status usado em Grafo._marcar_aresta -> código
+CODIGO_STATUS = {
+    "proposta": PROPOSTA,
+    "temporario": TEMPORARIO,
+    "rejeicao": REJEICAO,
+    "final": FINAL,
+}
+
+
+class EstadoArestas:
+    """
+    Arestas aluno → projeto em formato CSR, com o status de cada uma em um array tipado.
+
+    - offsets[i] .. offsets[i+1]: posições das arestas do i-ésimo aluno
+    - projeto[pos] (ID do projeto), peso[pos], ordem[pos], status[pos]
+
+    Arestas criadas fora das preferências (ex.: realocação forçada da fase 2)
+    ficam em um dicionário à parte, por aluno.
+
+    Remover um aluno só marca as posições dele como REMOVIDA; quando metade do
+    CSR vira lixo, ele é compactado (custo amortizado O(1) por remoção).
+    """
+
+    def __init__(self):
+        self.limpar()
+
+    def limpar(self):
+        self.id_aluno = {}
+        self.codigos_alunos = []
+        self.id_projeto = {}
+        self.codigos_projetos = []
+
+        self.offsets = array('l', [0])
+        self.projeto = array('l')
+        self.peso = array('H')
+        self.ordem = array('H')
+        self.status = array('B')
+
+        self.extras = {}  # cod_aluno -> {cod_projeto: [peso, ordem, status]}
+        self._total = 0
+        self._mortas = 0  # linhas e posições do CSR de alunos removidos
+
+    def construir(self, alunos, projetos, preferencias=None):
+        """
+        Monta o CSR a partir das preferências (só projetos existentes).
+        Com `preferencias` ({cod_aluno: tupla efetiva}) só essas viram arestas.
+        """
+        self.limpar()
+        for projeto in projetos:
+            self._id_projeto(projeto.getCodigo())
+        for aluno in alunos:
+            self.adicionar_aluno(aluno, None if preferencias is None else preferencias.get(aluno.getCodigo()))
+
+    def _id_projeto(self, cod):
+        i = self.id_projeto.get(cod)
+        if i is None:
+            i = self.id_projeto[cod] = len(self.codigos_projetos)
+            self.codigos_projetos.append(cod)
+        return i
+
+    # ---------------------------------------------------------
+    # INSERÇÃO / REMOÇÃO
+    # ---------------------------------------------------------
+    def adicionar_aluno(self, aluno, efetivas=None):
+        """
+        Acrescenta as arestas do aluno no fim do CSR. Com `efetivas`, preferências
+        fora dela são ignoradas; peso/ordem continuam os da lista original.
+        """
+        cod = aluno.getCodigo()
+        self.id_aluno[cod] = len(self.codigos_alunos)
+        self.codigos_alunos.append(cod)
+
+        inicio = len(self.projeto)
+        prefs = aluno.getPreferenciasProjetos()
+        for i, projeto_pref in enumerate(prefs):
+            pid = self.id_projeto.get(projeto_pref)
+            if pid is None or (efetivas is not None and projeto_pref not in efetivas):
+                continue
+            peso, ordem = len(prefs) - i, i + 1
+
+            # preferência repetida: mantém uma aresta, com peso/ordem da última ocorrência
+            pos = self._buscar(pid, inicio, len(self.projeto))
+            if pos is not None:
+                self.peso[pos] = peso
+                self.ordem[pos] = ordem
+                continue
+
+            self.projeto.append(pid)
+            self.peso.append(peso)
+            self.ordem.append(ordem)
+            self.status.append(PREFERENCIA)
+            self._total += 1
+
+        self.offsets.append(len(self.projeto))
+
+    def remover_aluno(self, cod_aluno):
+        """Marca as arestas do aluno como removidas (as posições do CSR não mudam)"""
+        i = self.id_aluno.pop(cod_aluno, None)
+        if i is None:
+            return
+        for pos in range(self.offsets[i], self.offsets[i + 1]):
+            self.status[pos] = REMOVIDA
+            self._total -= 1
+        self._total -= len(self.extras.pop(cod_aluno, ()))
+
+        self._mortas += 1 + self.offsets[i + 1] - self.offsets[i]
+        if 2 * self._mortas > len(self.codigos_alunos) + len(self.projeto):
+            self.compactar()
+
+    def compactar(self):
+        """Reescreve o CSR sem as linhas dos alunos removidos (ordem dos demais mantida)"""
+        offsets, projeto, peso, ordem, status = array('l', [0]), array('l'), array('H'), array('H'), array('B')
+        codigos = []
+        for i, cod in enumerate(self.codigos_alunos):
+            if self.id_aluno.get(cod) != i:
+                continue
+            inicio, fim = self.offsets[i], self.offsets[i + 1]
+            projeto.extend(self.projeto[inicio:fim])
+            peso.extend(self.peso[inicio:fim])
+            ordem.extend(self.ordem[inicio:fim])
+            status.extend(self.status[inicio:fim])
+            offsets.append(len(projeto))
+            self.id_aluno[cod] = len(codigos)
+            codigos.append(cod)
+
+        self.offsets, self.projeto, self.peso, self.ordem, self.status = offsets, projeto, peso, ordem, status
+        self.codigos_alunos = codigos
+        self._mortas = 0
+
+    def atualizar_aluno(self, aluno, efetivas=None):
+        """Refaz as arestas do aluno (ex.: preferências efetivas mudaram), mantendo o status das que continuam"""
+        cod = aluno.getCodigo()
+        i = self.id_aluno.get(cod)
+        status = {}
+        if i is not None:
+            status = {self.projeto[pos]: self.status[pos] for pos in range(self.offsets[i], self.offsets[i + 1])}
+        extras = self.extras.pop(cod, None)
+
+        self.remover_aluno(cod)
+        self.adicionar_aluno(aluno, efetivas)
+
+        # extras tirados antes de remover_aluno, então _total ainda os conta
+        extras = extras or {}
+        i = self.id_aluno[cod]
+        for pos in range(self.offsets[i], self.offsets[i + 1]):
+            pid = self.projeto[pos]
+            dados = extras.pop(self.codigos_projetos[pid], None)
+            if dados is not None:
+                # aresta extra que virou preferência: fica só a do CSR
+                self.status[pos] = dados[2]
+                self._total -= 1
+            else:
+                self.status[pos] = status.get(pid, PREFERENCIA)
+        if extras:
+            self.extras[cod] = extras
+
+    # ---------------------------------------------------------
+    # STATUS
+    # ---------------------------------------------------------
+    def _buscar(self, pid, inicio, fim):
+        projeto = self.projeto
+        for pos in range(inicio, fim):
+            if projeto[pos] == pid:
+                return pos
+        return None
+
+    def posicao(self, cod_aluno, cod_projeto):
+        """Posição da aresta no CSR (None se não estiver nas preferências)"""
+        i = self.id_aluno.get(cod_aluno)
+        pid = self.id_projeto.get(cod_projeto)
+        if i is None or pid is None:
+            return None
+        return self._buscar(pid, self.offsets[i], self.offsets[i + 1])
+
+    def marcar(self, cod_aluno, cod_projeto, codigo):
+        pos = self.posicao(cod_aluno, cod_projeto)
+        if pos is not None:
+            self.status[pos] = codigo
+            return
+
+        # aresta fora das preferências: cria na hora (peso 0, ordem 0)
+        extras = self.extras.setdefault(cod_aluno, {})
+        dados = extras.get(cod_projeto)
+        if dados is None:
+            extras[cod_projeto] = [0, 0, codigo]
+            self._total += 1
+        else:
+            dados[2] = codigo
+
+    def cor(self, cod_aluno, cod_projeto):
+        pos = self.posicao(cod_aluno, cod_projeto)
+        if pos is not None:
+            return CORES[self.status[pos]]
+        dados = self.extras.get(cod_aluno, {}).get(cod_projeto)
+        return None if dados is None else CORES[dados[2]]
+
+    # ---------------------------------------------------------
+    # LEITURA
+    # ---------------------------------------------------------
+    def __len__(self):
+        return self._total
+
+    def itens(self):
+        """Gera (cod_aluno, cod_projeto, peso, ordem, cor), alunos na ordem de entrada"""
+        codigos_projetos = self.codigos_projetos
+        for i, cod_aluno in enumerate(self.codigos_alunos):
+            for pos in range(self.offsets[i], self.offsets[i + 1]):
+                st = self.status[pos]
+                if st == REMOVIDA:
+                    continue
+                yield cod_aluno, codigos_projetos[self.projeto[pos]], self.peso[pos], self.ordem[pos], CORES[st]
+            if self.id_aluno.get(cod_aluno) != i:
+                continue  # aluno removido (o código pode ter sido reaproveitado)
+            for cod_projeto, (peso, ordem, st) in self.extras.get(cod_aluno, {}).items():
+                yield cod_aluno, cod_projeto, peso, ordem, CORES[st]
+
+    def pares(self):
+        """Gera (cod_aluno, cod_projeto) de todas as arestas"""
+        for u, v, _, _, _ in self.itens():
+            yield u, v
+
+    def pares_aluno(self, cod_aluno):
+        """Gera (cod_aluno, cod_projeto) das arestas de preferência do aluno"""
+        i = self.id_aluno.get(cod_aluno)
+        if i is None:
+            return
+        for pos in range(self.offsets[i], self.offsets[i + 1]):
+            yield cod_aluno, self.codigos_projetos[self.projeto[pos]]
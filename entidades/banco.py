@@ -0,0 +1,208 @@
+"""
+Histórico de execuções em SQLite.
+
+Cada execução grava, em uma única transação (executemany):
+  - execucoes: data, motor, impressões digitais das entradas e métricas
+  - projetos:  vagas, requisito, ocupação e interesse de cada projeto
+  - alunos:    nota e preferências de cada aluno
+  - alocacoes: projeto final de cada aluno alocado e a posição da escolha
+
+Consultas como "onde o aluno X ficou em cada execução" ou "taxa de
+ocupação do projeto P ao longo do tempo" não precisam reemparelhar.
+"""
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import sqlite3
+
+from entidades.cache import hash_arquivo
+from entidades.estatisticas import calcular_estatisticas
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    data             TEXT NOT NULL,
+    motor            TEXT,
+    arquivo_alunos   TEXT,
+    arquivo_projetos TEXT,
+    hash_alunos      TEXT,
+    hash_projetos    TEXT,
+    hash_dados       TEXT NOT NULL,
+    total_alunos     INTEGER,
+    alunos_alocados  INTEGER,
+    total_projetos   INTEGER,
+    projetos_vazios  INTEGER,
+    total_vagas      INTEGER,
+    vagas_ocupadas   INTEGER,
+    metricas         TEXT
+);
+CREATE TABLE IF NOT EXISTS projetos (
+    execucao_id  INTEGER NOT NULL REFERENCES execucoes(id),
+    codigo       TEXT NOT NULL,
+    vagas        INTEGER,
+    requisito    INTEGER,
+    ocupadas     INTEGER,
+    interessados INTEGER,
+    qualificados INTEGER
+);
+CREATE TABLE IF NOT EXISTS alunos (
+    execucao_id  INTEGER NOT NULL REFERENCES execucoes(id),
+    codigo       TEXT NOT NULL,
+    nota         INTEGER,
+    preferencias TEXT
+);
+CREATE TABLE IF NOT EXISTS alocacoes (
+    execucao_id  INTEGER NOT NULL REFERENCES execucoes(id),
+    aluno        TEXT NOT NULL,
+    projeto      TEXT NOT NULL,
+    escolha      INTEGER  -- posição do projeto nas preferências (NULL = fora delas)
+);
+CREATE INDEX IF NOT EXISTS idx_projetos_execucao ON projetos(execucao_id);
+CREATE INDEX IF NOT EXISTS idx_projetos_codigo ON projetos(codigo);
+CREATE INDEX IF NOT EXISTS idx_alunos_execucao ON alunos(execucao_id);
+CREATE INDEX IF NOT EXISTS idx_alunos_codigo ON alunos(codigo);
+CREATE INDEX IF NOT EXISTS idx_alocacoes_execucao ON alocacoes(execucao_id);
+CREATE INDEX IF NOT EXISTS idx_alocacoes_aluno ON alocacoes(aluno);
+CREATE INDEX IF NOT EXISTS idx_alocacoes_projeto ON alocacoes(projeto);
+"""
+
+
+def impressao_dados(alunos, projetos):
+    """Hash do conteúdo já lido (independe de formatação e comentários do arquivo)"""
+    h = hashlib.blake2b(digest_size=20)
+    for projeto in projetos:
+        h.update(f"P|{projeto.getCodigo()}|{projeto.getNumeroVagas()}|{projeto.getRequisitoNotas()}\n".encode())
+    for aluno in alunos:
+        prefs = ",".join(aluno.getPreferenciasProjetos())
+        h.update(f"A|{aluno.getCodigo()}|{prefs}|{aluno.getNota()}\n".encode())
+    return h.hexdigest()
+
+
+def _hash_entrada(caminho):
+    if isinstance(caminho, (str, os.PathLike)) and os.path.exists(caminho):
+        return hash_arquivo(caminho)
+    return None
+
+
+class BancoExecucoes:
+
+    def __init__(self, caminho="execucoes.db"):
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.executescript(ESQUEMA)
+
+    def fechar(self):
+        self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    # ---------------------------------------------------------
+    # GRAVAÇÃO
+    # ---------------------------------------------------------
+    def registrar(self, grafo, motor=None):
+        """
+        Grava a última execução do grafo (grafo.matches) e devolve o ID da execução.
+        Usa grafo.estatisticas se já calculadas.
+        """
+        if grafo.matches is None:
+            raise ValueError("Grafo sem emparelhamento: rode emparelhar() antes de registrar")
+
+        matches = grafo.matches
+        est = grafo.estatisticas or calcular_estatisticas(grafo.alunos, grafo.projetos, matches)
+        arquivo_alunos, arquivo_projetos = grafo.entradas or (None, None)
+
+        projeto_de = {}
+        for projeto_cod, alocados in matches.items():
+            for aluno in alocados:
+                projeto_de.setdefault(aluno.getCodigo(), projeto_cod)
+
+        def alocacoes():
+            for aluno in grafo.alunos:
+                projeto_cod = projeto_de.get(aluno.getCodigo())
+                if projeto_cod is None:
+                    continue
+                prefs = aluno.getPreferenciasProjetos()
+                escolha = prefs.index(projeto_cod) + 1 if projeto_cod in prefs else None
+                yield execucao_id, aluno.getCodigo(), projeto_cod, escolha
+
+        metricas = est.para_dict()
+        for detalhe in ("nao_alocados", "projetos", "emparelhamento"):
+            metricas.pop(detalhe)  # já estão nas tabelas
+
+        with self.conexao:  # uma transação para a execução inteira
+            cursor = self.conexao.execute(
+                "INSERT INTO execucoes (data, motor, arquivo_alunos, arquivo_projetos, hash_alunos, "
+                "hash_projetos, hash_dados, total_alunos, alunos_alocados, total_projetos, "
+                "projetos_vazios, total_vagas, vagas_ocupadas, metricas) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"), motor,
+                    str(arquivo_alunos) if arquivo_alunos is not None else None,
+                    str(arquivo_projetos) if arquivo_projetos is not None else None,
+                    _hash_entrada(arquivo_alunos), _hash_entrada(arquivo_projetos),
+                    impressao_dados(grafo.alunos, grafo.projetos),
+                    est.total_alunos, est.alunos_alocados, est.total_projetos,
+                    len(est.projetos_vazios), est.total_vagas, est.vagas_ocupadas,
+                    json.dumps(metricas, ensure_ascii=False),
+                )
+            )
+            execucao_id = cursor.lastrowid
+
+            self.conexao.executemany(
+                "INSERT INTO projetos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((execucao_id, p.codigo, p.vagas, p.requisito, p.ocupadas, p.interessados, p.qualificados)
+                 for p in est.projetos.values())
+            )
+            self.conexao.executemany(
+                "INSERT INTO alunos VALUES (?, ?, ?, ?)",
+                ((execucao_id, a.getCodigo(), a.getNota(), ",".join(a.getPreferenciasProjetos()))
+                 for a in grafo.alunos)
+            )
+            self.conexao.executemany("INSERT INTO alocacoes VALUES (?, ?, ?, ?)", alocacoes())
+
+        return execucao_id
+
+    # ---------------------------------------------------------
+    # CONSULTAS
+    # ---------------------------------------------------------
+    def execucoes(self):
+        """Resumo de todas as execuções (mais antiga primeiro)"""
+        return [dict(r) for r in self.conexao.execute(
+            "SELECT id, data, motor, hash_dados, total_alunos, alunos_alocados, "
+            "projetos_vazios, total_vagas, vagas_ocupadas FROM execucoes ORDER BY id"
+        )]
+
+    def historico_aluno(self, codigo):
+        """Onde o aluno ficou em cada execução em que aparece (projeto None = não alocado)"""
+        return [dict(r) for r in self.conexao.execute(
+            "SELECT e.id AS execucao_id, e.data, al.nota, c.projeto, c.escolha "
+            "FROM alunos al JOIN execucoes e ON e.id = al.execucao_id "
+            "LEFT JOIN alocacoes c ON c.execucao_id = al.execucao_id AND c.aluno = al.codigo "
+            "WHERE al.codigo = ? ORDER BY e.id",
+            (codigo,)
+        )]
+
+    def ocupacao_projeto(self, codigo):
+        """Vagas, ocupação e taxa de preenchimento do projeto em cada execução"""
+        return [dict(r) for r in self.conexao.execute(
+            "SELECT e.id AS execucao_id, e.data, p.vagas, p.ocupadas, p.interessados, "
+            "CASE WHEN p.vagas > 0 THEN 1.0 * p.ocupadas / p.vagas END AS taxa "
+            "FROM projetos p JOIN execucoes e ON e.id = p.execucao_id "
+            "WHERE p.codigo = ? ORDER BY e.id",
+            (codigo,)
+        )]
+
+    def alocacoes(self, execucao_id):
+        """{cod_projeto: [cod_aluno, ...]} de uma execução"""
+        resultado = {r["codigo"]: [] for r in self.conexao.execute(
+            "SELECT codigo FROM projetos WHERE execucao_id = ? ORDER BY rowid", (execucao_id,))}
+        for r in self.conexao.execute(
+                "SELECT aluno, projeto FROM alocacoes WHERE execucao_id = ? ORDER BY rowid", (execucao_id,)):
+            resultado.setdefault(r["projeto"], []).append(r["aluno"])
+        return resultado
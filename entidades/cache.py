@@ -0,0 +1,250 @@
+"""
+Cache em disco das entradas já lidas.
+
+Cada arquivo de entrada ganha uma pasta `.cache/<nome do arquivo>/` ao lado dele,
+com uma coluna por arquivo .npy e um meta.json com a chave do cache: tamanho,
+mtime e hash do conteúdo.
+
+Há dois jeitos de ler o cache:
+
+  - carregar_colunas_alunos / carregar_colunas_projetos: as colunas em mmap
+    (mmap_mode='r'), sem cópia e sem objetos; é o que MotorVetorial.de_colunas usa
+  - carregar_alunos / carregar_projetos: listas de Aluno/Projeto para o Grafo.
+    Evita reinterpretar o texto, mas não é sem cópia: cada coluna vira lista
+    Python e cada aluno vira um objeto
+
+Validade do cache:
+
+  - tamanho e mtime iguais      -> cache válido, sem reler o texto
+  - só o tamanho igual          -> confere o hash (ex.: arquivo tocado/copiado)
+  - qualquer outra diferença    -> relê o texto e regrava o cache
+"""
+import hashlib
+import json
+import os
+import warnings
+import numpy as np
+from entidades.aluno import Aluno
+from entidades.projeto import Projeto
+from entidades.leitor import ErroLeitura, ler_alunos, ler_projetos
+
+
+VERSAO = 1
+
+
+class AvisoCache(UserWarning):
+    """Cache não gravado: a leitura funcionou, só a próxima não terá o atalho"""
+
+
+def _pasta_cache(caminho):
+    pasta, nome = os.path.split(os.path.abspath(caminho))
+    return os.path.join(pasta, ".cache", nome)
+
+
+def hash_arquivo(caminho, bloco=1 << 20):
+    h = hashlib.blake2b(digest_size=20)
+    with open(caminho, "rb") as arq:
+        for pedaco in iter(lambda: arq.read(bloco), b""):
+            h.update(pedaco)
+    return h.hexdigest()
+
+
+def _ler_meta(pasta):
+    try:
+        with open(os.path.join(pasta, "meta.json"), "r", encoding="utf-8") as arq:
+            return json.load(arq)
+    except (OSError, ValueError):
+        return None
+
+
+def _meta_valida(pasta, caminho, tipo):
+    """Devolve o meta.json se o cache ainda corresponde ao arquivo de entrada"""
+    meta = _ler_meta(pasta)
+    if meta is None or meta.get("versao") != VERSAO or meta.get("tipo") != tipo:
+        return None
+
+    st = os.stat(caminho)
+    if meta["tamanho"] != st.st_size:
+        return None
+    if meta["mtime_ns"] == st.st_mtime_ns:
+        return meta
+
+    # mtime mudou mas o tamanho não: decide pelo conteúdo
+    if hash_arquivo(caminho) != meta["hash"]:
+        return None
+    meta["mtime_ns"] = st.st_mtime_ns
+    _gravar_meta(pasta, meta)
+    return meta
+
+
+def _gravar_meta(pasta, meta):
+    temporario = os.path.join(pasta, "meta.json.tmp")
+    with open(temporario, "w", encoding="utf-8") as arq:
+        json.dump(meta, arq)
+    os.replace(temporario, os.path.join(pasta, "meta.json"))
+
+
+def _gravar(pasta, caminho, tipo, colunas, erros):
+    """Grava as colunas e, por último, o meta.json (que marca o cache como completo)"""
+    st = os.stat(caminho)
+    os.makedirs(pasta, exist_ok=True)
+
+    # invalida o cache antigo antes de sobrescrever as colunas
+    try:
+        os.remove(os.path.join(pasta, "meta.json"))
+    except FileNotFoundError:
+        pass
+
+    for nome, valores in colunas.items():
+        np.save(os.path.join(pasta, nome + ".npy"), valores)
+
+    _gravar_meta(pasta, {
+        "versao": VERSAO,
+        "tipo": tipo,
+        "tamanho": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "hash": hash_arquivo(caminho),
+        "erros": [[e.numero_linha, e.linha, e.motivo] for e in erros],
+    })
+
+
+def _carregar_colunas(pasta, nomes):
+    return {nome: np.load(os.path.join(pasta, nome + ".npy"), mmap_mode="r") for nome in nomes}
+
+
+def _repassar_erros(caminho, meta, erros):
+    registrados = [ErroLeitura(caminho, n, linha, motivo) for n, linha, motivo in meta.get("erros", [])]
+    if erros is not None:
+        erros.extend(registrados)
+    elif registrados:
+        raise registrados[0]
+
+
+def _do_cache(caminho, tipo, nomes, erros):
+    """Colunas em mmap se o cache ainda vale para o arquivo (None caso contrário)"""
+    pasta = _pasta_cache(caminho)
+    meta = _meta_valida(pasta, caminho, tipo)
+    if meta is None:
+        return None
+    try:
+        colunas = _carregar_colunas(pasta, nomes)
+    except (OSError, ValueError):
+        return None
+    _repassar_erros(caminho, meta, erros)
+    return colunas
+
+
+def _reler(caminho, tipo, ler, colunas_de, usar_mmap, erros):
+    """Cache ausente ou inválido: lê o texto, regrava o cache e devolve os registros"""
+    erros_leitura = []
+    registros = list(ler(caminho, usar_mmap, erros_leitura))
+    if erros is not None:
+        erros.extend(erros_leitura)
+    elif erros_leitura:
+        raise erros_leitura[0]
+
+    try:
+        _gravar(_pasta_cache(caminho), caminho, tipo, colunas_de(registros), erros_leitura)
+    except OSError as e:
+        # vai junto com os erros de leitura (o Grafo decide se imprime); sem lista, warnings
+        aviso = AvisoCache(f"não foi possível gravar o cache de {caminho}: {e}")
+        if erros is not None:
+            erros.append(aviso)
+        else:
+            warnings.warn(aviso, stacklevel=4)  # aponta para quem chamou carregar_*
+
+    return registros
+
+
+def _carregar(caminho, tipo, nomes, ler, colunas_de, montar, usar_mmap, erros):
+    colunas = _do_cache(caminho, tipo, nomes, erros)
+    if colunas is not None:
+        return montar(colunas)
+    return _reler(caminho, tipo, ler, colunas_de, usar_mmap, erros)
+
+
+def _carregar_colunas_de(caminho, tipo, nomes, ler, colunas_de, usar_mmap, erros):
+    colunas = _do_cache(caminho, tipo, nomes, erros)
+    if colunas is not None:
+        return colunas
+    registros = _reler(caminho, tipo, ler, colunas_de, usar_mmap, erros)
+    try:
+        return _carregar_colunas(_pasta_cache(caminho), nomes)
+    except (OSError, ValueError):
+        return colunas_de(registros)  # cache não gravado: colunas em memória
+
+
+# ---------------------------------------------------------
+# ALUNOS
+# ---------------------------------------------------------
+def _colunas_alunos(alunos):
+    prefs = [a.getPreferenciasProjetos() for a in alunos]
+    offsets = np.zeros(len(alunos) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter((len(p) for p in prefs), dtype=np.int64, count=len(prefs)), out=offsets[1:])
+    return {
+        "codigos": np.array([a.getCodigo() for a in alunos], dtype=str),
+        "notas": np.array([a.getNota() for a in alunos], dtype=np.int32),
+        "pref_offsets": offsets,
+        "pref_codigos": np.array([cod for p in prefs for cod in p], dtype=str),
+    }
+
+
+def _montar_alunos(colunas):
+    codigos = colunas["codigos"].tolist()
+    notas = colunas["notas"].tolist()
+    offsets = colunas["pref_offsets"].tolist()
+    pref_codigos = colunas["pref_codigos"].tolist()
+    return [
+        Aluno(cod, pref_codigos[offsets[i]:offsets[i + 1]], notas[i])
+        for i, cod in enumerate(codigos)
+    ]
+
+
+COLUNAS_ALUNOS = ("codigos", "notas", "pref_offsets", "pref_codigos")
+
+
+def carregar_alunos(caminho, usar_mmap=False, erros=None):
+    """Lista de Aluno do arquivo, usando o cache binário quando ainda válido"""
+    return _carregar(caminho, "alunos", COLUNAS_ALUNOS,
+                     ler_alunos, _colunas_alunos, _montar_alunos, usar_mmap, erros)
+
+
+def carregar_colunas_alunos(caminho, usar_mmap=False, erros=None):
+    """Colunas dos alunos ({nome: np.ndarray em mmap}), sem criar objetos Aluno"""
+    return _carregar_colunas_de(caminho, "alunos", COLUNAS_ALUNOS,
+                                ler_alunos, _colunas_alunos, usar_mmap, erros)
+
+
+# ---------------------------------------------------------
+# PROJETOS
+# ---------------------------------------------------------
+def _colunas_projetos(projetos):
+    return {
+        "codigos": np.array([p.getCodigo() for p in projetos], dtype=str),
+        "vagas": np.array([p.getNumeroVagas() for p in projetos], dtype=np.int32),
+        "requisitos": np.array([p.getRequisitoNotas() for p in projetos], dtype=np.int32),
+    }
+
+
+def _montar_projetos(colunas):
+    return [
+        Projeto(cod, vagas, requisito)
+        for cod, vagas, requisito in zip(colunas["codigos"].tolist(),
+                                         colunas["vagas"].tolist(),
+                                         colunas["requisitos"].tolist())
+    ]
+
+
+COLUNAS_PROJETOS = ("codigos", "vagas", "requisitos")
+
+
+def carregar_projetos(caminho, usar_mmap=False, erros=None):
+    """Lista de Projeto do arquivo, usando o cache binário quando ainda válido"""
+    return _carregar(caminho, "projetos", COLUNAS_PROJETOS,
+                     ler_projetos, _colunas_projetos, _montar_projetos, usar_mmap, erros)
+
+
+def carregar_colunas_projetos(caminho, usar_mmap=False, erros=None):
+    """Colunas dos projetos ({nome: np.ndarray em mmap}), sem criar objetos Projeto"""
+    return _carregar_colunas_de(caminho, "projetos", COLUNAS_PROJETOS,
+                                ler_projetos, _colunas_projetos, usar_mmap, erros)
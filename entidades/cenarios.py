@@ -0,0 +1,147 @@
+"""
+Execução em lote de cenários "what-if" sobre a mesma entrada.
+
+Um cenário é um dicionário com um nome e uma lista de ajustes nos projetos:
+
+    {"nome": "+1 vaga nos projetos de requisito 5",
+     "ajustes": [{"onde": {"requisito_notas": 5}, "numero_vagas": "+1"}]}
+
+    {"nome": "requisitos -1", "ajustes": [{"requisito_notas": "-1"}]}
+
+  - "onde" filtra os projetos por codigo / numero_vagas / requisito_notas
+    (valor único ou lista); sem "onde" o ajuste vale para todos
+  - inteiro = valor absoluto; texto "+n"/"-n" = variação sobre o valor atual
+
+Cada cenário roda em um processo de um ProcessPoolExecutor. Os dados lidos da
+entrada base são enviados uma vez por processo (initializer), não por cenário.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from entidades.estatisticas import calcular_estatisticas
+from entidades.grafo import Grafo
+from entidades.projeto import Projeto
+
+CAMPOS_AJUSTAVEIS = ("numero_vagas", "requisito_notas")
+
+
+# ---------------------------------------------------------
+# AJUSTES
+# ---------------------------------------------------------
+def _casa(projeto, onde):
+    for campo, esperado in onde.items():
+        valor = getattr(projeto, campo)
+        if isinstance(esperado, (list, tuple, set)):
+            if valor not in esperado:
+                return False
+        elif valor != esperado:
+            return False
+    return True
+
+
+def _novo_valor(atual, ajuste):
+    if isinstance(ajuste, str):
+        return atual + int(ajuste)
+    return int(ajuste)
+
+
+def aplicar_ajustes(projetos, ajustes):
+    """Cópias dos projetos com os ajustes do cenário aplicados (a base não é alterada)"""
+    novos = [Projeto(p.getCodigo(), p.getNumeroVagas(), p.getRequisitoNotas()) for p in projetos]
+    for ajuste in ajustes:
+        onde = ajuste.get("onde", {})
+        desconhecidos = set(ajuste) - set(CAMPOS_AJUSTAVEIS) - {"onde"}
+        if desconhecidos:
+            raise ValueError(f"Campos de ajuste desconhecidos: {sorted(desconhecidos)}")
+        for projeto in novos:
+            if not _casa(projeto, onde):
+                continue
+            if "numero_vagas" in ajuste:
+                projeto.setNumeroVagas(max(0, _novo_valor(projeto.getNumeroVagas(), ajuste["numero_vagas"])))
+            if "requisito_notas" in ajuste:
+                projeto.setRequisitoNotas(_novo_valor(projeto.getRequisitoNotas(), ajuste["requisito_notas"]))
+    return novos
+
+
+# ---------------------------------------------------------
+# MÉTRICAS
+# ---------------------------------------------------------
+def resumir(grafo, matches=None):
+    """
+    Métricas principais de um resultado, para a tabela comparativa.
+    Usa as estatísticas que grafo.emparelhar() já calculou; só recalcula sem elas.
+    """
+    est = grafo.estatisticas
+    if est is None:
+        est = calcular_estatisticas(grafo.alunos, grafo.projetos, matches if matches is not None else grafo.matches)
+    return {
+        "alunos": est.total_alunos,
+        "alocados": est.alunos_alocados,
+        "vagas": est.total_vagas,
+        "vagas_ocupadas": est.vagas_ocupadas,
+        "projetos_vazios": len(est.projetos_vazios),
+        "escolha_1": est.escolhas["1"],
+        "escolha_2": est.escolhas["2"],
+        "escolha_3": est.escolhas["3"],
+        "escolha_4+": est.escolhas["4+"],
+    }
+
+
+# ---------------------------------------------------------
+# EXECUÇÃO
+# ---------------------------------------------------------
+_base = {}
+
+
+def _iniciar_trabalhador(alunos, projetos, motor):
+    _base["alunos"] = alunos
+    _base["projetos"] = projetos
+    _base["motor"] = motor
+
+
+def _executar_cenario(cenario):
+    grafo = Grafo(visualizacoes=False, silencioso=True)
+    grafo.carregar(_base["alunos"], aplicar_ajustes(_base["projetos"], cenario.get("ajustes", [])))
+    grafo.emparelhar(motor=_base["motor"])
+    return {"nome": cenario.get("nome", "?"), **resumir(grafo)}
+
+
+def executar_cenarios(alunos, projetos, cenarios, max_workers=None, motor="vetorial", incluir_base=True):
+    """
+    Roda cada cenário em paralelo e devolve uma linha de métricas por cenário
+    (a primeira é a entrada base, sem ajustes, se incluir_base=True).
+    """
+    cenarios = list(cenarios)
+    if incluir_base:
+        cenarios.insert(0, {"nome": "base", "ajustes": []})
+
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_iniciar_trabalhador,
+                             initargs=(alunos, projetos, motor)) as executor:
+        return list(executor.map(_executar_cenario, cenarios))
+
+
+def formatar_tabela(resultados):
+    """Tabela de texto com as métricas de cada cenário e a variação em relação ao primeiro"""
+    if not resultados:
+        return "(nenhum cenário)"
+
+    colunas = [c for c in resultados[0] if c != "nome"]
+    base = resultados[0]
+
+    linhas = [["cenário"] + colunas]
+    for i, r in enumerate(resultados):
+        linha = [r["nome"]]
+        for c in colunas:
+            celula = str(r[c])
+            if i > 0 and r[c] != base[c]:
+                celula += f" ({r[c] - base[c]:+d})"
+            linha.append(celula)
+        linhas.append(linha)
+
+    larguras = [max(len(l[j]) for l in linhas) for j in range(len(linhas[0]))]
+    texto = []
+    for i, linha in enumerate(linhas):
+        texto.append("  ".join(c.ljust(w) if j == 0 else c.rjust(w)
+                               for j, (c, w) in enumerate(zip(linha, larguras))))
+        if i == 0:
+            texto.append("  ".join("-" * w for w in larguras))
+    return "\n".join(texto)
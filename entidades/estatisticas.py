@@ -0,0 +1,177 @@
+"""
+Estatísticas do emparelhamento.
+
+calcular_estatisticas() percorre alunos, preferências e alocações uma única vez
+(O(A + E)) e devolve um objeto Estatisticas serializável em JSON (para_dict / para_json).
+formatar_estatisticas() gera o relatório em texto impresso pelo Grafo.
+"""
+from dataclasses import dataclass, field, asdict
+import json
+
+# faixas do histograma de escolhas (posição do projeto nas preferências)
+FAIXAS_ESCOLHA = ("1", "2", "3", "4+")
+
+
+@dataclass
+class AlunoNaoAlocado:
+    codigo: str
+    nota: int
+    preferencias: list
+
+
+@dataclass
+class EstatisticasProjeto:
+    codigo: str
+    vagas: int
+    requisito: int
+    ocupadas: int
+    interessados: int   # alunos que listaram o projeto
+    qualificados: int   # interessados com nota >= requisito
+
+
+@dataclass
+class Estatisticas:
+    total_alunos: int = 0
+    alunos_alocados: int = 0
+    nao_alocados: list = field(default_factory=list)         # [AlunoNaoAlocado] (ordem de entrada)
+    total_projetos: int = 0
+    projetos_preenchidos: int = 0
+    projetos_vazios: list = field(default_factory=list)      # códigos, na ordem do emparelhamento
+    total_vagas: int = 0
+    vagas_ocupadas: int = 0
+    escolhas: dict = field(default_factory=lambda: dict.fromkeys(FAIXAS_ESCOLHA, 0))
+    projetos: dict = field(default_factory=dict)             # código -> EstatisticasProjeto
+    emparelhamento: dict = field(default_factory=dict)       # código do projeto -> [códigos dos alunos]
+
+    @property
+    def vagas_disponiveis(self):
+        return self.total_vagas - self.vagas_ocupadas
+
+    def para_dict(self):
+        return asdict(self)
+
+    def para_json(self, **kwargs):
+        return json.dumps(self.para_dict(), ensure_ascii=False, **kwargs)
+
+
+def calcular_estatisticas(alunos, projetos, matches):
+    """
+    Args:
+        alunos / projetos: listas do Grafo
+        matches: dict {cod_projeto: [Aluno]} (resultado do emparelhamento)
+    """
+    est = Estatisticas(total_alunos=len(alunos), total_projetos=len(projetos))
+
+    por_codigo = {}
+    for projeto in projetos:
+        por_codigo.setdefault(projeto.getCodigo(), projeto)  # código repetido: vale o primeiro
+        est.total_vagas += projeto.getNumeroVagas()
+
+    # projeto de cada aluno (o primeiro em que aparece) e ocupação
+    projeto_de = {}
+    for projeto_cod, alocados in matches.items():
+        est.vagas_ocupadas += len(alocados)
+        if alocados:
+            est.projetos_preenchidos += 1
+        else:
+            est.projetos_vazios.append(projeto_cod)
+        est.emparelhamento[projeto_cod] = [a.getCodigo() for a in alocados]
+        for aluno in alocados:
+            projeto_de.setdefault(aluno.getCodigo(), projeto_cod)
+    est.alunos_alocados = len(projeto_de)
+
+    for projeto_cod, projeto in por_codigo.items():
+        est.projetos[projeto_cod] = EstatisticasProjeto(
+            projeto_cod, projeto.getNumeroVagas(), projeto.getRequisitoNotas(),
+            len(matches.get(projeto_cod, ())), 0, 0
+        )
+
+    # uma passada pelos alunos: interesse por projeto e posição da escolha atendida
+    for aluno in alunos:
+        cod = aluno.getCodigo()
+        nota = aluno.getNota()
+        prefs = aluno.getPreferenciasProjetos()
+
+        for projeto_cod in set(prefs):
+            info = est.projetos.get(projeto_cod)
+            if info is not None:
+                info.interessados += 1
+                if nota >= info.requisito:
+                    info.qualificados += 1
+
+        projeto_cod = projeto_de.get(cod)
+        if projeto_cod is None:
+            est.nao_alocados.append(AlunoNaoAlocado(cod, nota, list(prefs)))
+        elif projeto_cod in prefs:
+            pos = prefs.index(projeto_cod) + 1
+            est.escolhas[str(pos) if pos <= 3 else "4+"] += 1
+
+    return est
+
+
+# ---------------------------------------------------------
+# RELATÓRIO EM TEXTO
+# ---------------------------------------------------------
+def _pct(parte, total):
+    return parte / total * 100 if total else 0.0
+
+
+def formatar_estatisticas(est, limite=10):
+    """Relatório em texto (mesmo formato impresso ao fim do emparelhamento)"""
+    linhas = []
+    linhas.append("\n" + "="*60)
+    linhas.append("ESTATÍSTICAS DO EMPARELHAMENTO")
+    linhas.append("="*60)
+
+    nao_alocados = len(est.nao_alocados)
+    vazios = len(est.projetos_vazios)
+
+    linhas.append(f"\n📊 RESUMO GERAL:")
+    linhas.append(f"  • Total de alunos: {est.total_alunos}")
+    linhas.append(f"  • Alunos alocados: {est.alunos_alocados} ({_pct(est.alunos_alocados, est.total_alunos):.1f}%)")
+    linhas.append(f"  • Alunos não alocados: {nao_alocados} ({_pct(nao_alocados, est.total_alunos):.1f}%)")
+
+    linhas.append(f"\n  • Total de projetos: {est.total_projetos}")
+    linhas.append(f"  • Projetos preenchidos: {est.projetos_preenchidos} ({_pct(est.projetos_preenchidos, est.total_projetos):.1f}%)")
+    linhas.append(f"  • Projetos vazios: {vazios} ({_pct(vazios, est.total_projetos):.1f}%)")
+
+    linhas.append(f"\n  • Total de vagas: {est.total_vagas}")
+    linhas.append(f"  • Vagas ocupadas: {est.vagas_ocupadas} ({_pct(est.vagas_ocupadas, est.total_vagas):.1f}%)")
+    linhas.append(f"  • Vagas disponíveis: {est.vagas_disponiveis}")
+
+    # Análise de alunos não alocados
+    if est.nao_alocados:
+        linhas.append(f"\nALUNOS NÃO ALOCADOS ({nao_alocados}):")
+        for aluno in est.nao_alocados[:limite]:
+            linhas.append(f"  • {aluno.codigo} (Nota: {aluno.nota}) - Preferências: {aluno.preferencias[:3]}...")
+        if nao_alocados > limite:
+            linhas.append(f"  ... e mais {nao_alocados - limite} alunos")
+
+    # Análise de projetos vazios
+    if est.projetos_vazios:
+        linhas.append(f"\nPROJETOS VAZIOS ({vazios}):")
+        for proj_cod in est.projetos_vazios[:limite]:
+            info = est.projetos[proj_cod]
+            linhas.append(f"  • {proj_cod} (Vagas: {info.vagas}, Req: {info.requisito}) - "
+                          f"Interessados: {info.interessados}, Qualificados: {info.qualificados}")
+        if vazios > limite:
+            linhas.append(f"  ... e mais {vazios - limite} projetos")
+
+    # Distribuição de preferências
+    linhas.append(f"\nQUALIDADE DAS ALOCAÇÕES:")
+    if est.alunos_alocados > 0:
+        for faixa, rotulo in zip(FAIXAS_ESCOLHA, ("1ª", "2ª", "3ª", "4ª+")):
+            n = est.escolhas[faixa]
+            linhas.append(f"  • {rotulo} escolha: {n} ({_pct(n, est.alunos_alocados):.1f}%)")
+
+    linhas.append("\n" + "="*60)
+
+    # Resultado por projeto
+    linhas.append("\n=== EMPARELHAMENTO FINAL ===")
+    for projeto_cod, alocados in est.emparelhamento.items():
+        if alocados:
+            linhas.append(f"{projeto_cod}: {alocados}")
+        else:
+            linhas.append(f"{projeto_cod}: (vazio)")
+
+    return "\n".join(linhas)
@@ -0,0 +1,305 @@
+from collections import deque
+import heapq
+from entidades.perfil import novos_contadores
+from entidades.ranking import PoliticaRanking
+
+
+class GaleShapley:
+    """
+    Estado da fase 1 do emparelhamento (Gale–Shapley com alunos propondo).
+
+    - fila de alunos livres em deque (popleft O(1))
+    - cada projeto mantém um heap mínimo dos alocados, com chave (rank, ordem):
+      o topo é sempre o pior alocado, então a troca custa O(log vagas)
+    - rank: inteiro denso da PoliticaRanking (nota + desempate; padrão: com notas
+      iguais vence quem aparece antes na entrada), então cada decisão é uma
+      comparação de inteiros
+
+    O estado é mantido entre execuções, o que permite aplicar edições
+    (adicionar_aluno, remover_aluno, atualizar_projeto) e continuar de onde parou.
+
+    Com `preferencias` ({cod_aluno: tupla}, ver entidades/validacao.py) os alunos
+    propõem só para as preferências efetivas; sem ele, para a lista original.
+    """
+
+    def __init__(self, registro, alunos, marcar=None, ranking=None, preferencias=None):
+        self.registro = registro
+        self.marcar = marcar  # callback marcar(cod_aluno, cod_projeto, status)
+        self.politica = ranking if ranking is not None else PoliticaRanking()
+        self.preferencias = preferencias  # dicionário compartilhado com o Grafo (ou None)
+
+        self.ordem = {}
+        for i, aluno in enumerate(alunos):
+            self.ordem.setdefault(aluno.getCodigo(), i)
+        self._proxima_ordem = len(alunos)
+        self.ranks = self.politica.calcular(alunos, self.ordem)
+
+        self.proxima = {aluno.getCodigo(): 0 for aluno in alunos}
+        self.alocados = {cod: [] for cod in registro.projetos}
+        self.projeto_de = {}  # código do aluno -> projeto que o segura no momento
+        self.livres = deque(alunos)
+        self._removidos = {}  # id -> Aluno removido que ainda pode estar em livres (descartado ao sair da fila)
+
+        self.iteracao = 1
+        self.limite_atingido = False
+        self.contadores = novos_contadores()  # acumulados entre execuções
+
+    def _prefs(self, aluno):
+        if self.preferencias is None:
+            return aluno.getPreferenciasProjetos()
+        return self.preferencias[aluno.getCodigo()]
+
+    def chave(self, aluno, projeto_cod=None):
+        """Rank do aluno no projeto (maior = melhor; sem projeto, o rank geral)"""
+        return self.ranks.chave(projeto_cod, aluno.getCodigo())
+
+    def executar(self, max_iteracoes=None, ao_iterar=None):
+        """
+        Processa propostas até a fila esvaziar ou o orçamento de iterações acabar.
+
+        Args:
+            max_iteracoes: limite de iterações (None = até convergir)
+            ao_iterar: callback ao_iterar(iteracao, alocados) chamado a cada passo
+
+        Returns:
+            True se convergiu (fila vazia), False se o limite foi atingido
+        """
+        livres = self.livres
+        proxima = self.proxima
+        alocados = self.alocados
+        projeto_de = self.projeto_de
+        ordem = self.ordem
+        preferencias = self.preferencias
+        removidos = self._removidos
+        globais = self.ranks.globais
+        por_projeto = self.ranks.por_projeto
+        busca_projeto = self.registro.busca_projeto
+        marcar = self.marcar
+        iteracao = self.iteracao
+        self.limite_atingido = False
+
+        # contadores locais (copiados para self.contadores no fim)
+        propostas = rejeicoes_requisito = rejeicoes_capacidade = despejos = inexistentes = 0
+
+        while livres:
+
+            if ao_iterar is not None:
+                ao_iterar(iteracao, alocados)
+
+            aluno = livres.popleft()
+            if removidos and id(aluno) in removidos:
+                continue  # removido por remover_aluno: sai da fila só agora
+            cod_aluno = aluno.getCodigo()
+            prefs = aluno.getPreferenciasProjetos() if preferencias is None else preferencias[cod_aluno]
+
+            # já alocado (entrada repetida na fila após uma edição)
+            if cod_aluno in projeto_de:
+                continue
+
+            # Se já propôs para todos os projetos, desiste
+            pos = proxima[cod_aluno]
+            if pos >= len(prefs):
+                continue
+
+            projeto_cod = prefs[pos]
+            proxima[cod_aluno] = pos + 1
+
+            projeto = busca_projeto(projeto_cod)
+
+            # se projeto não existe, volta para a fila e tenta próxima preferência
+            if projeto is None:
+                inexistentes += 1
+                livres.append(aluno)
+                continue
+
+            propostas += 1
+            if marcar is not None:
+                marcar(cod_aluno, projeto_cod, "proposta")
+
+            # rejeitar se nota < requisito
+            nota = aluno.getNota()
+            if nota < projeto.getRequisitoNotas():
+                rejeicoes_requisito += 1
+                if marcar is not None:
+                    marcar(cod_aluno, projeto_cod, "rejeicao")
+                livres.append(aluno)
+                continue
+
+            heap = alocados[projeto_cod]
+            rank = (por_projeto[projeto_cod] if projeto_cod in por_projeto else globais)[cod_aluno]
+            entrada = (rank, ordem[cod_aluno], aluno)
+
+            if len(heap) < projeto.getNumeroVagas():
+                heapq.heappush(heap, entrada)
+                projeto_de[cod_aluno] = projeto_cod
+                if marcar is not None:
+                    marcar(cod_aluno, projeto_cod, "temporario")
+            elif heap and rank > heap[0][0]:
+                # projeto cheio → substitui o pior alocado (topo do heap)
+                pior = heapq.heapreplace(heap, entrada)[2]
+                despejos += 1
+                del projeto_de[pior.getCodigo()]
+                projeto_de[cod_aluno] = projeto_cod
+                if marcar is not None:
+                    marcar(cod_aluno, projeto_cod, "temporario")
+                    marcar(pior.getCodigo(), projeto_cod, "despejo")
+                livres.append(pior)
+            else:
+                rejeicoes_capacidade += 1
+                if marcar is not None:
+                    marcar(cod_aluno, projeto_cod, "rejeicao")
+                livres.append(aluno)
+
+            iteracao += 1
+
+            if max_iteracoes is not None and iteracao > max_iteracoes:
+                self.limite_atingido = True
+                break
+
+        self.iteracao = iteracao
+        if not livres:
+            removidos.clear()  # fila vazia: nenhuma cópia de removido sobrou
+        contadores = self.contadores
+        contadores["propostas"] += propostas
+        contadores["rejeicoes_requisito"] += rejeicoes_requisito
+        contadores["rejeicoes_capacidade"] += rejeicoes_capacidade
+        contadores["despejos"] += despejos
+        contadores["propostas_inexistentes"] += inexistentes
+        return not self.limite_atingido
+
+    def matches(self):
+        """Alocações atuais no formato {codigo_projeto: [Aluno, ...]} (ordem de entrada)"""
+        return {
+            projeto_cod: [e[2] for e in sorted(heap, key=lambda e: e[1])]
+            for projeto_cod, heap in self.alocados.items()
+        }
+
+    # ---------------------------------------------------------
+    # EDIÇÕES INCREMENTAIS
+    # ---------------------------------------------------------
+    def adicionar_aluno(self, aluno):
+        """Novo aluno entra no fim da ordem de desempate e na fila de livres"""
+        cod = aluno.getCodigo()
+        self.ordem[cod] = self._proxima_ordem
+        self._proxima_ordem += 1
+        self.proxima[cod] = 0
+        self._removidos.pop(id(aluno), None)
+        self.livres.append(aluno)
+        # rank só do novo aluno; se uma tabela foi renumerada, os heaps dela relêem os ranks
+        renumeradas = self.politica.inserir(self.ranks, aluno, self.registro.alunos.values(), self.ordem)
+        if renumeradas:
+            self._reler_ranks(renumeradas)
+
+    def _reler_ranks(self, tabelas):
+        """
+        Atualiza o rank guardado nas entradas dos heaps que usam as tabelas renumeradas.
+        A renumeração preserva a ordem, então cada heap continua válido sem heapify.
+        """
+        por_projeto = self.ranks.por_projeto
+        for projeto_cod, heap in self.alocados.items():
+            if (projeto_cod if projeto_cod in por_projeto else None) in tabelas:
+                tabela = self.ranks.tabela(projeto_cod)
+                heap[:] = [(tabela[aluno.getCodigo()], o, aluno) for _, o, aluno in heap]
+
+    def remover_aluno(self, aluno):
+        """Retira o aluno do estado; a vaga liberada reabre o projeto"""
+        cod = aluno.getCodigo()
+        projeto_cod = self.projeto_de.get(cod)
+        if projeto_cod is not None:
+            self._retirar(aluno, projeto_cod)
+        self.proxima.pop(cod, None)
+        self.ordem.pop(cod, None)
+        self._removidos[id(aluno)] = aluno
+        if projeto_cod is not None:
+            self._reabrir(projeto_cod)
+
+    def atualizar_projeto(self, projeto_cod, mais_permissivo):
+        """
+        Ajusta o estado após mudança de vagas/requisito do projeto.
+        Se o projeto ficou mais permissivo (mais vagas ou requisito menor), quem já
+        passou por ele volta a propor; depois os alocados que deixaram de caber saem.
+        """
+        if mais_permissivo:
+            self._reabrir(projeto_cod)
+
+        projeto = self.registro.busca_projeto(projeto_cod)
+        heap = self.alocados[projeto_cod]
+
+        abaixo = [e for e in heap if e[2].getNota() < projeto.getRequisitoNotas()]
+        for _, _, aluno in abaixo:
+            self._retirar(aluno, projeto_cod)
+            self.livres.append(aluno)
+
+        while len(heap) > projeto.getNumeroVagas():
+            aluno = heap[0][2]
+            self._retirar(aluno, projeto_cod)
+            self.livres.append(aluno)
+
+    def atualizar_preferencias(self, aluno, novas):
+        """
+        Troca as preferências efetivas do aluno (ex.: projeto que voltou a ser viável)
+        sem perder o ponto em que ele está: o ponteiro passa a indicar, na nova lista,
+        a mesma preferência que indicava na antiga. Projetos inseridos antes dele contam
+        como já visitados, e atualizar_projeto(mais_permissivo=True) os reabre.
+        """
+        cod = aluno.getCodigo()
+        antigas = self._prefs(aluno)
+        self.preferencias[cod] = novas
+        pos = self.proxima.get(cod)
+        if pos is None:
+            return
+        if pos < len(antigas) and antigas[pos] in novas:
+            self.proxima[cod] = novas.index(antigas[pos])
+        else:
+            # ponteiro no fim (ou em um projeto que saiu): depois de tudo que já foi visitado
+            visitadas = set(antigas[:pos])
+            self.proxima[cod] = max((i + 1 for i, p in enumerate(novas) if p in visitadas), default=0)
+        # quem tinha esgotado a lista (ou estava livre) volta à fila se ganhou preferências à frente
+        if cod not in self.projeto_de and self.proxima[cod] < len(novas):
+            self.livres.append(aluno)
+
+    def _retirar(self, aluno, projeto_cod):
+        """Remove o aluno do heap do projeto (O(vagas))"""
+        heap = self.alocados[projeto_cod]
+        for i, entrada in enumerate(heap):
+            if entrada[2] is aluno:
+                heap[i] = heap[-1]
+                heap.pop()
+                heapq.heapify(heap)
+                break
+        del self.projeto_de[aluno.getCodigo()]
+        if self.marcar is not None:
+            self.marcar(aluno.getCodigo(), projeto_cod, "remocao")
+
+    def _reabrir(self, projeto_cod):
+        """
+        Volta a fila dos interessados que já passaram pelo projeto.
+        Quem sai de outro projeto para repropor libera vaga lá, e o efeito
+        se propaga (lista de trabalho), preservando o resultado de uma execução do zero.
+        """
+        pendentes = [projeto_cod]
+        while pendentes:
+            p = pendentes.pop()
+            for aluno in self.registro.get_interessados(p):
+                cod = aluno.getCodigo()
+                pos = self.proxima.get(cod)
+                if pos is None:
+                    continue
+
+                prefs = self._prefs(aluno)
+                if p not in prefs:
+                    continue  # preferência podada (inexistente ou requisito acima da nota)
+                indice = prefs.index(p)
+                if pos <= indice:
+                    continue  # ainda não propôs para p
+
+                atual = self.projeto_de.get(cod)
+                if atual == p:
+                    continue
+
+                if atual is not None:
+                    self._retirar(aluno, atual)
+                    pendentes.append(atual)
+
+                self.proxima[cod] = indice
+                self.livres.append(aluno)
@@ -0,0 +1,110 @@
+"""
+Gerador de entradas sintéticas nos formatos de arquivos/.
+
+    (A1):(P1, P30, P50) (5)
+    (P1, 2, 5)
+
+Tudo vem de um random.Random com semente, então os mesmos parâmetros
+geram sempre os mesmos arquivos.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+import os
+import random
+
+# distribuições de notas (nota -> peso); "amostra" segue arquivos/alunoEntradaProj2.25TAG
+DISTRIBUICOES_NOTAS = {
+    "amostra": {3: 70, 4: 100, 5: 29},
+    "uniforme": {3: 1, 4: 1, 5: 1},
+    "alta": {3: 1, 4: 2, 5: 4},
+    "baixa": {3: 4, 4: 2, 5: 1},
+}
+
+# vagas e requisitos dos projetos (mesmas proporções da entrada de exemplo)
+DISTRIBUICAO_VAGAS = {1: 24, 2: 22, 3: 4}
+DISTRIBUICAO_REQUISITOS = {3: 6, 4: 25, 5: 19}
+
+
+def _sorteador(distribuicao, rng):
+    valores = list(distribuicao)
+    acumulado = list(accumulate(distribuicao.values()))
+    return lambda: rng.choices(valores, cum_weights=acumulado)[0]
+
+
+def gerar_projetos(n_projetos, rng):
+    """Gera tuplas (codigo, vagas, requisito)"""
+    vagas = _sorteador(DISTRIBUICAO_VAGAS, rng)
+    requisito = _sorteador(DISTRIBUICAO_REQUISITOS, rng)
+    for i in range(1, n_projetos + 1):
+        yield f"P{i}", vagas(), requisito()
+
+
+def gerar_alunos(n_alunos, n_projetos, rng, tamanho_prefs=3, notas="amostra",
+                 assimetria=1.0, prob_desconhecido=0.0):
+    """
+    Gera tuplas (codigo, [preferencias], nota).
+
+    Args:
+        tamanho_prefs: int (fixo) ou (mínimo, máximo) de projetos por aluno
+        notas: chave de DISTRIBUICOES_NOTAS
+        assimetria: expoente de Zipf da popularidade dos projetos
+            (0 = uniforme; quanto maior, mais concentrado nos primeiros projetos)
+        prob_desconhecido: chance de cada preferência citar um projeto inexistente
+    """
+    if isinstance(tamanho_prefs, int):
+        tamanho_prefs = (tamanho_prefs, tamanho_prefs)
+    minimo, maximo = tamanho_prefs
+    maximo = min(maximo, n_projetos)
+    minimo = max(1, min(minimo, maximo))  # o formato exige pelo menos uma preferência
+
+    nota = _sorteador(DISTRIBUICOES_NOTAS[notas], rng)
+
+    # popularidade de Zipf: projeto i (1-based) tem peso 1 / i^assimetria
+    acumulado = list(accumulate(1.0 / i ** assimetria for i in range(1, n_projetos + 1)))
+    total = acumulado[-1]
+    aleatorio = rng.random
+
+    for i in range(1, n_alunos + 1):
+        k = rng.randint(minimo, maximo)
+        prefs = []
+        escolhidos = set()
+        while len(prefs) < k:
+            if prob_desconhecido and aleatorio() < prob_desconhecido:
+                prefs.append(f"P{n_projetos + 1 + rng.randrange(n_projetos)}")
+                continue
+            p = bisect_right(acumulado, aleatorio() * total) + 1
+            if p > n_projetos or p in escolhidos:
+                continue
+            escolhidos.add(p)
+            prefs.append(f"P{p}")
+        yield f"A{i}", prefs, nota()
+
+
+def escrever_entrada(pasta, n_alunos, n_projetos=None, semente=0, **opcoes):
+    """
+    Escreve alunos.txt e projetos.txt em pasta e devolve os dois caminhos.
+
+    Args:
+        n_projetos: padrão n_alunos // 4 (mesma proporção da entrada de exemplo)
+        semente: semente do gerador
+        opcoes: repassadas para gerar_alunos (tamanho_prefs, notas, assimetria, prob_desconhecido)
+    """
+    if n_projetos is None:
+        n_projetos = max(1, n_alunos // 4)
+    rng = random.Random(semente)
+    os.makedirs(pasta, exist_ok=True)
+
+    caminho_projetos = os.path.join(pasta, "projetos.txt")
+    with open(caminho_projetos, "w", encoding="utf-8") as arq:
+        arq.write("// lista de projetos, vagas, requisitos e preferências dos alunos\n")
+        arq.write("// formato (código projeto, número de vagas, requisito mínimo de notas para vagas)\n\n")
+        arq.writelines(f"({cod}, {vagas}, {req})\n" for cod, vagas, req in gerar_projetos(n_projetos, rng))
+
+    caminho_alunos = os.path.join(pasta, "alunos.txt")
+    with open(caminho_alunos, "w", encoding="utf-8") as arq:
+        arq.write("// alunos, preferências de projetos e notas individuais dos alunos\n")
+        arq.write("// formato (código aluno):(projetos preferenciais na ordem) (Nota do aluno)\n")
+        arq.writelines(f"({cod}):({', '.join(prefs)}) ({nota})\n"
+                       for cod, prefs, nota in gerar_alunos(n_alunos, n_projetos, rng, **opcoes))
+
+    return caminho_alunos, caminho_projetos
@@ -1,113 +1,204 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 import os
-import re
-from entidades.aluno import Aluno
-from entidades.projeto import Projeto
+from entidades.leitor import ler_alunos, ler_projetos
+from entidades.registro import Registro
+from entidades.arestas import EstadoArestas, CODIGO_STATUS, PREFERENCIA
+from entidades.estatisticas import calcular_estatisticas, formatar_estatisticas
+from entidades.gale_shapley import GaleShapley
+from entidades.perfil import Perfil, SEM_PERFIL
+from entidades.ranking import PoliticaRanking
+from entidades.validacao import validar, preferencias_efetivas
+from entidades.hopcroft_karp import fase2_maxima
+from entidades.verificador import verificar
+
+FASES2 = ("gulosa", "hopcroft_karp")
 
 class Grafo:
 
-    def __init__(self):
-        self.G = nx.Graph()
-        self.alunos = []
+    def __init__(self, visualizacoes=True, rastro=False, perfil=False, ranking=None, validar=True,
+                 silencioso=False):
+        # networkx/matplotlib só são importados quando G ou visualizar() são usados;
+        # até lá as arestas ficam em EstadoArestas (CSR + status em array tipado)
+        self.arestas = EstadoArestas()
+        self._G = None
+        self.visualizacoes = visualizacoes  # False: registrarVisualizacao não gera imagens
+        self.fila_visualizacoes = None
+        self.gravar_rastro = rastro         # True: grava um Rastro de eventos a cada execução
+        self.rastro = None
+        self._iteracao = 0
+        self._alunos = []
+        self._removidos = {}      # id -> Aluno removido que ainda está em _alunos (compactado sob demanda)
         self.projetos = []
+        self.registro = Registro()
+        self.gale_shapley = None  # estado da fase 1 (para rematch incremental)
+        self.matches = None       # resultado final da última execução
+        self.estatisticas = None  # Estatisticas da última execução
+        self.entradas = None      # (caminho_alunos, caminho_projetos) lidos por iniciar()
+        self.perfil = Perfil() if perfil else None  # tempos por fase e contadores (opcional)
+        self.ranking = ranking if ranking is not None else PoliticaRanking()  # desempate do lado dos projetos
+        self.validar = validar    # poda preferências mortas antes da fase 1 (entidades/validacao.py)
+        self.preferencias = None  # {cod_aluno: tupla efetiva} usado pelos motores e arestas (None = listas originais)
+        self.validacao = None     # RelatorioValidacao da última montagem
+        self.silencioso = silencioso  # True: sem as mensagens de progresso e estatísticas (ex.: servidor)
+
+    @property
+    def alunos(self):
+        """Lista de alunos (ordem de entrada); remoções pendentes são aplicadas aqui, de uma vez"""
+        if self._removidos:
+            removidos = self._removidos
+            self._alunos = [a for a in self._alunos if id(a) not in removidos]
+            removidos.clear()
+        return self._alunos
+
+    def _fase(self, nome):
+        """Contexto que mede a fase no perfil (nulo quando o perfil está desligado)"""
+        return self.perfil.medir(nome) if self.perfil is not None else SEM_PERFIL
 
     # ---------------------------------------------------------
     # CRIAR GRAFO
     # ---------------------------------------------------------
-    def iniciar(self):
+    def iniciar(self, caminho_alunos=None, caminho_projetos=None, usar_mmap=False, usar_cache=True):
+        """
+        Lê os arquivos de entrada e monta o grafo.
+
+        Args:
+            caminho_alunos / caminho_projetos: caminhos ou objetos arquivo
+                (padrão: arquivos/alunoEntradaProj2.25TAG e arquivos/projetoEntradaProj2.25TAG)
+            usar_mmap: lê os arquivos via mmap
+            usar_cache: reaproveita o cache binário em arquivos/.cache (só para caminhos)
+        """
 
         self.alunos.clear()
         self.projetos.clear()
-        self.G.clear()
-
-        if not os.path.exists("arquivos"):
-            print("ERRO: Pasta 'arquivos' não encontrada!")
-            return
-
-        caminho_alunos = "arquivos/alunoEntradaProj2.25TAG"
-        caminho_projetos = "arquivos/projetoEntradaProj2.25TAG"
-
-        # fallback
-        if not os.path.exists(caminho_alunos):
-            caminho_alunos += ".txt"
-        if not os.path.exists(caminho_projetos):
-            caminho_projetos += ".txt"
-
-        # ------------------ Ler ALUNOS ------------------
-        try:
-            with open(caminho_alunos, "r", encoding="utf-8") as arq:
-                for linha in arq:
-                    linha = linha.strip()
-                    if not linha or linha.startswith("//"):
-                        continue
-
-                    match = re.match(r"\(([^)]+)\):\(([^)]+)\)\s+\((\d+)\)", linha)
-                    if match:
-                        cod = match.group(1)
-                        prefs = [x.strip() for x in match.group(2).split(",")]
-                        nota = int(match.group(3))
-                        aluno = Aluno(cod, prefs, nota)
-                        self.alunos.append(aluno)
-        except Exception as e:
-            print("Erro lendo alunos:", e)
-            return
-
-        # ------------------ Ler PROJETOS ------------------
-        try:
-            with open(caminho_projetos, "r", encoding="utf-8") as arq:
-                for linha in arq:
-                    linha = linha.strip()
-                    if not linha or linha.startswith("//"):
-                        continue
-
-                    match = re.match(r"\(([^,]+),\s*(\d+),\s*(\d+)\)", linha)
-                    if match:
-                        cod = match.group(1)
-                        vagas = int(match.group(2))
-                        requisito = int(match.group(3))
-                        projeto = Projeto(cod, vagas, requisito)
-                        self.projetos.append(projeto)
-        except Exception as e:
-            print("Erro lendo projetos:", e)
-            return
+        self.registro.limpar()
+        self._limpar_arestas()
+        self.gale_shapley = None
+        self.matches = None
+
+        if caminho_alunos is None or caminho_projetos is None:
+            if not os.path.exists("arquivos"):
+                self._print("ERRO: Pasta 'arquivos' não encontrada!")
+                return
+
+        if caminho_alunos is None:
+            caminho_alunos = "arquivos/alunoEntradaProj2.25TAG"
+            # fallback
+            if not os.path.exists(caminho_alunos):
+                caminho_alunos += ".txt"
+        if caminho_projetos is None:
+            caminho_projetos = "arquivos/projetoEntradaProj2.25TAG"
+            # fallback
+            if not os.path.exists(caminho_projetos):
+                caminho_projetos += ".txt"
+        self.entradas = (caminho_alunos, caminho_projetos)
+
+        erros = []
+        leitor_alunos, leitor_projetos = ler_alunos, ler_projetos
+        if usar_cache:
+            # numpy só é importado quando o cache é usado
+            from entidades.cache import carregar_alunos, carregar_projetos
+        if usar_cache and isinstance(caminho_alunos, (str, os.PathLike)):
+            leitor_alunos = carregar_alunos
+        if usar_cache and isinstance(caminho_projetos, (str, os.PathLike)):
+            leitor_projetos = carregar_projetos
+
+        with self._fase("leitura"):
+            # ------------------ Ler ALUNOS ------------------
+            try:
+                self.alunos.extend(leitor_alunos(caminho_alunos, usar_mmap, erros))
+            except (OSError, ValueError) as e:
+                self._print("Erro lendo alunos:", e)
+                return
+
+            # ------------------ Ler PROJETOS ------------------
+            try:
+                self.projetos.extend(leitor_projetos(caminho_projetos, usar_mmap, erros))
+            except (OSError, ValueError) as e:
+                self._print("Erro lendo projetos:", e)
+                return
+
+        for erro in erros:
+            self._print(f"AVISO: {erro}")
 
         # Criar grafo
         self._criar_grafo()
 
-    def _criar_grafo(self):
+    def carregar(self, alunos, projetos):
+        """Monta o grafo a partir de listas já lidas (sem reler os arquivos)"""
+        self.alunos[:] = alunos
+        self.projetos[:] = projetos
+        self.entradas = None
+        self._limpar_arestas()
+        self.gale_shapley = None
+        self.matches = None
+        self._criar_grafo()
 
-        # adicionar alunos
-        for aluno in self.alunos:
-            self.G.add_node(
-                aluno.getCodigo(),
-                tipo="aluno",
-                nota=aluno.getNota(),
-                preferencias=aluno.getPreferenciasProjetos()
-            )
-
-        # adicionar projetos
-        for projeto in self.projetos:
-            self.G.add_node(
-                projeto.getCodigo(),
-                tipo="projeto",
-                vagas=projeto.getNumeroVagas(),
-                requisito=projeto.getRequisitoNotas()
-            )
-
-        # arestas aluno → projeto preferido
-        for aluno in self.alunos:
-            prefs = aluno.getPreferenciasProjetos()
-            for i, projeto_pref in enumerate(prefs):
-                if any(p.getCodigo() == projeto_pref for p in self.projetos):
-                    peso = len(prefs) - i
-                    self.G.add_edge(
-                        aluno.getCodigo(),
-                        projeto_pref,
-                        peso=peso,
-                        ordem=i+1,
-                        cor="black"
-                    )
+    def _criar_grafo(self):
+        with self._fase("grafo"):
+            # índices por código (alunos, projetos e interessados por projeto)
+            self.registro.reconstruir(self.alunos, self.projetos)
+
+            # preferências efetivas: sem projetos inexistentes, repetidos ou com requisito acima da nota
+            self.preferencias = self.validacao = None
+            if self.validar:
+                with self._fase("validacao"):
+                    self.preferencias, self.validacao = validar(self.alunos, self.projetos)
+                if self.validacao.podadas:
+                    self._print(f"AVISO: {self.validacao.resumo()}")
+
+            self.rastro = None
+
+            # arestas aluno → projeto preferido (os nós vêm de self.alunos / self.projetos)
+            self.arestas.construir(self.alunos, self.projetos, self.preferencias)
+            self._G = None
+
+            if self.gravar_rastro:
+                from entidades.rastro import Rastro
+
+                self.rastro = Rastro(
+                    [a.getCodigo() for a in self.alunos],
+                    [p.getCodigo() for p in self.projetos],
+                    self.arestas.pares()
+                )
+
+    def _limpar_arestas(self):
+        self.arestas.limpar()
+        self._G = None
+
+    @property
+    def G(self):
+        """Grafo networkx equivalente, montado sob demanda (visualização/exportação)"""
+        if self._G is None:
+            import networkx as nx
+
+            G = nx.Graph()
+            for aluno in self.alunos:
+                G.add_node(
+                    aluno.getCodigo(),
+                    tipo="aluno",
+                    nota=aluno.getNota(),
+                    preferencias=list(aluno.getPreferenciasProjetos())
+                )
+            for projeto in self.projetos:
+                G.add_node(
+                    projeto.getCodigo(),
+                    tipo="projeto",
+                    vagas=projeto.getNumeroVagas(),
+                    requisito=projeto.getRequisitoNotas()
+                )
+            for u, v, peso, ordem, cor in self.arestas.itens():
+                G.add_edge(u, v, peso=peso, ordem=ordem, cor=cor)
+            self._G = G
+        return self._G
+
+    def _estado_atual(self):
+        """EstadoGrafo (imutável) com os nós e a cor atual de cada aresta"""
+        from entidades.renderizador import EstadoGrafo
+
+        return EstadoGrafo(
+            tuple(a.getCodigo() for a in self.alunos),
+            tuple(p.getCodigo() for p in self.projetos),
+            tuple((u, v, cor) for u, v, _, _, cor in self.arestas.itens())
+        )
 
     # ---------------------------------------------------------
     # ACESSO AOS NÓS
@@ -123,303 +214,360 @@ class Grafo:
         ]
 
     def _busca_projeto(self, codigo):
-        for p in self.projetos:
-            if p.getCodigo() == codigo:
-                return p
-        return None
+        return self.registro.busca_projeto(codigo)
 
     # ---------------------------------------------------------
     # EMPARELHAMENTO (Gale–Shapley)
     # ---------------------------------------------------------
-    def emparelhar(self):
-
-        livres = self.get_alunos().copy()
-
-        propostas = {
-            aluno.getCodigo(): 0
-            for aluno in self.alunos
-        }
-
-        matches = {
-            projeto.getCodigo(): []
-            for projeto in self.projetos
-        }
-
-        iteracao = 1
-
-        while livres:
-
-            # registrar visualização da iteração
-            self.registrarVisualizacao(iteracao, matches)
-
-            aluno = livres.pop(0)
-            prefs = aluno.getPreferenciasProjetos()
-            cod_aluno = aluno.getCodigo()
-
-            # Se já propôs para todos os projetos, desiste
-            if propostas[cod_aluno] >= len(prefs):
-                continue
-
-            projeto_cod = prefs[propostas[cod_aluno]]
-            propostas[cod_aluno] += 1
-
-            projeto = self._busca_projeto(projeto_cod)
-
-            # se projeto não existe, volta para a fila e tenta próxima preferência
-            if projeto is None:
-                livres.append(aluno)
-                continue
-
-            # marca aresta como proposta (azul)
-            self._marcar_aresta(cod_aluno, projeto_cod, "proposta")
-
-            # rejeitar se nota < requisito
-            if aluno.getNota() < projeto.getRequisitoNotas():
-                self._marcar_aresta(cod_aluno, projeto_cod, "rejeicao")
-                livres.append(aluno)  # volta para a fila e tenta próxima preferência
-                continue
-
-            alocados = matches[projeto_cod]
+    def emparelhar(self, motor="objetos", max_iteracoes=None, max_workers=None, fase2="gulosa"):
+        """
+        Executa o emparelhamento completo (fase 1 + fase 2) e imprime as estatísticas.
 
-            # se há vaga, insere
-            if len(alocados) < projeto.getNumeroVagas():
-                alocados.append(aluno)
-                self._marcar_aresta(cod_aluno, projeto_cod, "temporario")
+        Args:
+            motor: "objetos" (padrão) percorre os objetos Aluno/Projeto e marca as arestas
+                   a cada proposta; "vetorial" usa o MotorVetorial (IDs inteiros + NumPy);
+                   "particionado" roda o MotorVetorial por componente conexo em paralelo
+            max_iteracoes: orçamento de iterações da fase 1 (None = até convergir)
+            max_workers: processos do motor "particionado" (padrão: núcleos da máquina)
+            fase2: "gulosa" (padrão) cobre projetos vazios um a um, podendo forçar alocação
+                   ou relaxar o requisito; "hopcroft_karp" maximiza projetos cobertos e
+                   alunos alocados só com arestas qualificadas (entidades/hopcroft_karp.py)
+        """
+        if motor not in ("objetos", "vetorial", "particionado"):
+            raise ValueError(f"Motor de emparelhamento desconhecido: {motor}")
+        if fase2 not in FASES2:
+            raise ValueError(f"Fase 2 desconhecida: {fase2}")
+        if self.gravar_rastro and motor != "objetos":
+            # só o motor "objetos" marca as arestas a cada proposta da fase 1
+            raise ValueError(f"O rastro exige o motor 'objetos' (recebido: {motor})")
+
+        with self._fase("fase1"):
+            if motor == "objetos":
+                matches, iteracao = self._emparelhar_objetos(max_iteracoes)
+            elif motor == "particionado" and max_iteracoes is None:
+                matches, iteracao = self._emparelhar_particionado(max_workers)
             else:
-                # projeto está cheio → substituir pior aluno
-                pior = min(alocados, key=lambda a: a.getNota())
-
-                # se aluno atual é melhor que o pior
-                if aluno.getNota() > pior.getNota():
-                    alocados.remove(pior)
-                    alocados.append(aluno)
-                    self._marcar_aresta(cod_aluno, projeto_cod, "temporario")
-                    self._marcar_aresta(pior.getCodigo(), projeto_cod, "black")
-                    livres.append(pior)  # pior volta a propor
-                else:
-                    # rejeitado
-                    self._marcar_aresta(cod_aluno, projeto_cod, "rejeicao")
-                    livres.append(aluno)  # volta para a fila e tenta próxima preferência
+                # com orçamento de iterações o resultado depende da ordem global das propostas
+                matches, iteracao = self._emparelhar_vetorial(max_iteracoes)
 
-            iteracao += 1
+        return self._finalizar(matches, iteracao, fase2)
 
-            if iteracao > 10:  # proteção contra loop infinito
-                print("AVISO: Limite de iterações atingido!")
-                break
+    def _finalizar(self, matches, iteracao, fase2="gulosa"):
+        """Fase 2, marcação final, visualização e estatísticas sobre o resultado da fase 1"""
+        self._iteracao = iteracao
 
         # FASE 2: Garantir que cada projeto tenha pelo menos 1 aluno
-        self._garantir_minimo_por_projeto(matches)
+        with self._fase("fase2"):
+            if fase2 == "hopcroft_karp":
+                self._maximizar_emparelhamento(matches)
+            else:
+                self._garantir_minimo_por_projeto(matches)
 
         # Marcar alocações finais com cor laranja
         for projeto_cod, alocados in matches.items():
             for aluno in alocados:
                 self._marcar_aresta(aluno.getCodigo(), projeto_cod, "final")
 
-        # visualização final
+        # visualização final (a renderização continua em segundo plano)
         self.registrarVisualizacao(iteracao, matches)
+        if self.fila_visualizacoes is not None:
+            self.fila_visualizacoes.descarregar()
 
         # Calcular e imprimir estatísticas
-        self._imprimir_estatisticas(matches)
+        with self._fase("estatisticas"):
+            self._imprimir_estatisticas(matches)
 
+        self.matches = matches
         return matches
 
+    def _emparelhar_objetos(self, max_iteracoes=None):
+        """Fase 1 (Gale–Shapley) sobre os objetos, marcando as arestas a cada passo"""
+        self.gale_shapley = GaleShapley(self.registro, self.alunos, marcar=self._marcar_aresta,
+                                        ranking=self.ranking, preferencias=self.preferencias)
+        convergiu = self.gale_shapley.executar(max_iteracoes, ao_iterar=self._ao_iterar)
+        if not convergiu:
+            self._print("AVISO: Limite de iterações atingido!")
+        if self.perfil is not None:
+            self.perfil.somar(self.gale_shapley.contadores)
+        return self.gale_shapley.matches(), self.gale_shapley.iteracao
+
+    def _emparelhar_vetorial(self, max_iteracoes=None):
+        """Fase 1 (Gale–Shapley) no MotorVetorial; só a visualização final é registrada"""
+        from entidades.motor_vetorial import MotorVetorial
+
+        self.gale_shapley = None
+        motor = MotorVetorial(self.alunos, self.projetos, ranking=self.ranking, preferencias=self.preferencias)
+        matches = motor.emparelhar(max_iteracoes, alunos=self.alunos)
+        if motor.limite_atingido:
+            self._print("AVISO: Limite de iterações atingido!")
+        if self.perfil is not None:
+            self.perfil.somar(motor.contadores)
+        return matches, motor.iteracao
+
+    def _emparelhar_particionado(self, max_workers=None):
+        """Fase 1 por componentes conexos em um pool de processos (mesmo resultado do sequencial)"""
+        from entidades.particionado import emparelhar_particionado
+
+        self.gale_shapley = None
+        matches, iteracao, contadores = emparelhar_particionado(
+            self.alunos, self.projetos, ranking=self.ranking, max_workers=max_workers,
+            preferencias=self.preferencias
+        )
+        if self.perfil is not None:
+            self.perfil.somar(contadores)
+        return matches, iteracao
+
+    # ---------------------------------------------------------
+    # EDIÇÕES INCREMENTAIS
+    # ---------------------------------------------------------
+    def add_aluno(self, aluno):
+        """Adiciona (ou substitui, se o código já existir) um aluno; vale no próximo rematch()"""
+        if self.registro.busca_aluno(aluno.getCodigo()) is not None:
+            self.remove_aluno(aluno.getCodigo())
+
+        if id(aluno) in self._removidos:
+            self.alunos  # o mesmo objeto volta: aplica a remoção pendente antes
+        self._alunos.append(aluno)
+        self.registro.adicionar_aluno(aluno)
+        efetivas = None
+        if self.preferencias is not None:
+            efetivas, podadas = preferencias_efetivas(aluno, self.registro.projetos)
+            self.preferencias[aluno.getCodigo()] = efetivas
+            self.validacao.registrar(aluno, efetivas, podadas)
+        self.arestas.adicionar_aluno(aluno, efetivas)
+        if self.rastro is not None:
+            self.rastro.adicionar_arestas(self.arestas.pares_aluno(aluno.getCodigo()))
+        self._G = None
+
+        if self.gale_shapley is not None:
+            self.gale_shapley.adicionar_aluno(aluno)
+
+    def remove_aluno(self, codigo):
+        """Remove o aluno do grafo e do estado do emparelhamento; vale no próximo rematch()"""
+        aluno = self.registro.busca_aluno(codigo)
+        if aluno is None:
+            self._print(f"AVISO: Aluno {codigo} não encontrado.")
+            return None
+
+        if self.gale_shapley is not None:
+            self.gale_shapley.remover_aluno(aluno)
+        self.registro.remover_aluno(codigo)
+        if self.preferencias is not None:
+            self.validacao.descartar(aluno, self.preferencias.pop(codigo))
+        self._removidos[id(aluno)] = aluno  # sai da lista na próxima leitura de self.alunos
+        self.arestas.remover_aluno(codigo)
+        self._G = None
+        return aluno
+
+    def update_projeto(self, codigo, numero_vagas=None, requisito_notas=None):
+        """Altera vagas e/ou requisito de um projeto; vale no próximo rematch()"""
+        projeto = self._busca_projeto(codigo)
+        if projeto is None:
+            self._print(f"AVISO: Projeto {codigo} não encontrado.")
+            return None
+
+        mais_permissivo = False
+        if numero_vagas is not None:
+            mais_permissivo |= numero_vagas > projeto.getNumeroVagas()
+            projeto.setNumeroVagas(numero_vagas)
+        reabilitados = False
+        if requisito_notas is not None:
+            reabilitados = requisito_notas < projeto.getRequisitoNotas()
+            mais_permissivo |= reabilitados
+            projeto.setRequisitoNotas(requisito_notas)
+
+        # requisito menor: preferências podadas por requisito voltam a valer
+        # (requisito maior não precisa de poda: a fase 1 rejeita normalmente)
+        if reabilitados and self.preferencias is not None:
+            self._revalidar_interessados(codigo)
+
+        self._G = None
+        if self.gale_shapley is not None:
+            self.gale_shapley.atualizar_projeto(codigo, mais_permissivo)
+        return projeto
+
+    def _revalidar_interessados(self, projeto_cod):
+        """Recalcula as preferências efetivas de quem listou o projeto (arestas e fase 1 acompanham)"""
+        for aluno in self.registro.get_interessados(projeto_cod):
+            cod = aluno.getCodigo()
+            antigas = self.preferencias[cod]
+            novas, podadas = preferencias_efetivas(aluno, self.registro.projetos)
+            if novas == antigas:
+                continue
+            if self.gale_shapley is not None:
+                self.gale_shapley.atualizar_preferencias(aluno, novas)
+            else:
+                self.preferencias[cod] = novas
+            self.validacao.descartar(aluno, antigas)
+            self.validacao.registrar(aluno, novas, podadas)
+            self.arestas.atualizar_aluno(aluno, novas)
+            if self.rastro is not None:
+                self.rastro.adicionar_arestas((cod, p) for p in novas if p not in antigas)
+
+    def rematch(self, max_iteracoes=None, fase2="gulosa"):
+        """
+        Refaz o emparelhamento após edições partindo do último estado estável da fase 1:
+        só as cadeias de propostas afetadas são reprocessadas. A fase 2 e as estatísticas
+        rodam de novo sobre o resultado. Sem estado anterior, equivale a emparelhar().
+        """
+        if fase2 not in FASES2:
+            raise ValueError(f"Fase 2 desconhecida: {fase2}")
+        if self.gale_shapley is None:
+            return self.emparelhar(max_iteracoes=max_iteracoes, fase2=fase2)
+
+        # a fase 2 e as marcas finais não fazem parte do estado estável: desfaz
+        if self.matches is not None:
+            for projeto_cod, alocados in self.matches.items():
+                for aluno in alocados:
+                    if self.registro.busca_aluno(aluno.getCodigo()) is aluno:
+                        self._marcar_aresta(aluno.getCodigo(), projeto_cod, "remocao")
+        for projeto_cod, heap in self.gale_shapley.alocados.items():
+            for _, _, aluno in heap:
+                self._marcar_aresta(aluno.getCodigo(), projeto_cod, "temporario")
+
+        antes = dict(self.gale_shapley.contadores)
+        with self._fase("fase1"):
+            convergiu = self.gale_shapley.executar(max_iteracoes, ao_iterar=self._ao_iterar)
+        if not convergiu:
+            self._print("AVISO: Limite de iterações atingido!")
+        if self.perfil is not None:
+            self.perfil.somar({k: n - antes[k] for k, n in self.gale_shapley.contadores.items()})
+
+        return self._finalizar(self.gale_shapley.matches(), self.gale_shapley.iteracao, fase2)
+
     def _garantir_minimo_por_projeto(self, matches):
         """
         Garante que cada projeto tenha pelo menos 1 aluno alocado.
         Move alunos de projetos com múltiplas vagas para projetos vazios quando possível.
+
+        Usa índices mantidos durante a fase: aluno → projeto atual e uma fila
+        de alunos livres ordenada por nota (melhor primeiro, empate pela ordem de entrada).
         """
-        print("\n🔧 FASE 2: Garantindo mínimo de 1 aluno por projeto...")
+        self._print("\n🔧 FASE 2: Garantindo mínimo de 1 aluno por projeto...")
         
         projetos_vazios = [p_cod for p_cod, alocs in matches.items() if len(alocs) == 0]
         
         if not projetos_vazios:
-            print("  ✓ Todos os projetos já têm pelo menos 1 aluno.")
+            self._print("  ✓ Todos os projetos já têm pelo menos 1 aluno.")
             return
+
+        # aluno → projeto em que está alocado (primeiro projeto em matches, como na busca linear)
+        projeto_de = {}
+        for p_cod, alocs in matches.items():
+            for a in alocs:
+                projeto_de.setdefault(a.getCodigo(), p_cod)
+
+        # alunos livres, melhor nota primeiro (sort estável mantém a ordem de entrada no empate)
+        livres = sorted((a for a in self.alunos if a.getCodigo() not in projeto_de),
+                        key=lambda a: a.getNota(), reverse=True)
+        prox_livre = 0
         
         for projeto_vazio_cod in projetos_vazios:
             projeto_vazio = self._busca_projeto(projeto_vazio_cod)
+            requisito = projeto_vazio.getRequisitoNotas()
             
-            # Buscar alunos qualificados que listaram este projeto
-            candidatos = []
-            for aluno in self.alunos:
-                if projeto_vazio_cod in aluno.getPreferenciasProjetos():
-                    if aluno.getNota() >= projeto_vazio.getRequisitoNotas():
-                        candidatos.append(aluno)
-            
-            # Ordenar candidatos por nota (melhor primeiro)
-            if candidatos:
-                candidatos.sort(key=lambda a: a.getNota(), reverse=True)
+            # Alunos qualificados que listaram este projeto, melhor nota primeiro
+            candidatos = sorted((a for a in self.registro.get_interessados(projeto_vazio_cod)
+                                 if a.getNota() >= requisito),
+                                key=lambda a: a.getNota(), reverse=True)
             
             # Tentar realocar um candidato que já está em outro projeto
             realocado = False
             for candidato in candidatos:
                 cod_candidato = candidato.getCodigo()
-                
-                # Verificar se o candidato já está alocado em outro projeto
-                projeto_atual = None
-                for p_cod, alocs in matches.items():
-                    if any(a.getCodigo() == cod_candidato for a in alocs):
-                        projeto_atual = p_cod
-                        break
+                projeto_atual = projeto_de.get(cod_candidato)
                 
                 if projeto_atual:
                     # Candidato já está alocado
                     # Só realoca se o projeto atual tiver mais de 1 aluno
+                    # (independente da preferência: é obrigatório ter pelo menos 1)
                     if len(matches[projeto_atual]) > 1:
-                        # Verificar se este projeto vazio está nas preferências do candidato
-                        prefs = candidato.getPreferenciasProjetos()
-                        pos_atual = prefs.index(projeto_atual) if projeto_atual in prefs else float('inf')
-                        pos_vazio = prefs.index(projeto_vazio_cod) if projeto_vazio_cod in prefs else float('inf')
-                        
-                        # Realoca independente da preferência (obrigatório ter pelo menos 1)
-                        # Remover do projeto atual
                         matches[projeto_atual] = [a for a in matches[projeto_atual] 
                                                  if a.getCodigo() != cod_candidato]
-                        # Adicionar ao projeto vazio
                         matches[projeto_vazio_cod].append(candidato)
-                        self._marcar_aresta(cod_candidato, projeto_atual, "black")
+                        projeto_de[cod_candidato] = projeto_vazio_cod
+                        self._marcar_aresta(cod_candidato, projeto_atual, "realocacao")
                         self._marcar_aresta(cod_candidato, projeto_vazio_cod, "temporario")
-                        print(f"  ✓ {projeto_vazio_cod}: Realocado {cod_candidato} de {projeto_atual}")
+                        self._print(f"  ✓ {projeto_vazio_cod}: Realocado {cod_candidato} de {projeto_atual}")
                         realocado = True
                         break
                 else:
                     # Candidato não está alocado, podemos alocar diretamente
                     matches[projeto_vazio_cod].append(candidato)
+                    projeto_de[cod_candidato] = projeto_vazio_cod
                     self._marcar_aresta(cod_candidato, projeto_vazio_cod, "temporario")
-                    print(f"  ✓ {projeto_vazio_cod}: Alocado {cod_candidato} (não estava alocado)")
+                    self._print(f"  ✓ {projeto_vazio_cod}: Alocado {cod_candidato} (não estava alocado)")
                     realocado = True
                     break
             
-            if not realocado:
-                # Última tentativa: pegar qualquer aluno não alocado que atenda requisitos
-                alunos_nao_alocados = []
-                for aluno in self.alunos:
-                    cod = aluno.getCodigo()
-                    alocado = any(cod == a.getCodigo() for alocs in matches.values() for a in alocs)
-                    if not alocado and aluno.getNota() >= projeto_vazio.getRequisitoNotas():
-                        alunos_nao_alocados.append(aluno)
-                
-                if alunos_nao_alocados:
-                    # Pegar o melhor aluno não alocado
-                    melhor = max(alunos_nao_alocados, key=lambda a: a.getNota())
-                    matches[projeto_vazio_cod].append(melhor)
-                    self._marcar_aresta(melhor.getCodigo(), projeto_vazio_cod, "temporario")
-                    print(f"  ✓ {projeto_vazio_cod}: Alocado {melhor.getCodigo()} (forçado)")
-                else:
-                    # RELAXAMENTO: Se não há candidatos qualificados, pega o melhor não alocado
-                    # mesmo que não atenda o requisito mínimo
-                    todos_nao_alocados = []
-                    for aluno in self.alunos:
-                        cod = aluno.getCodigo()
-                        alocado = any(cod == a.getCodigo() for alocs in matches.values() for a in alocs)
-                        if not alocado:
-                            todos_nao_alocados.append(aluno)
-                    
-                    if todos_nao_alocados:
-                        melhor = max(todos_nao_alocados, key=lambda a: a.getNota())
-                        matches[projeto_vazio_cod].append(melhor)
-                        self._marcar_aresta(melhor.getCodigo(), projeto_vazio_cod, "temporario")
-                        print(f"  ⚠ {projeto_vazio_cod}: Alocado {melhor.getCodigo()} (REQUISITO RELAXADO - nota {melhor.getNota()} < {projeto_vazio.getRequisitoNotas()})")
-                    else:
-                        print(f"  ✗ {projeto_vazio_cod}: Impossível alocar (sem candidatos viáveis)")
+            if realocado:
+                continue
 
-    def _imprimir_estatisticas(self, matches):
-        """Imprime estatísticas detalhadas do emparelhamento"""
-        
-        # Alunos alocados
-        alunos_alocados = set()
-        for alocados in matches.values():
-            for aluno in alocados:
-                alunos_alocados.add(aluno.getCodigo())
-        
-        alunos_nao_alocados = [a for a in self.alunos if a.getCodigo() not in alunos_alocados]
-        
-        # Projetos com alocações
-        projetos_preenchidos = [p for p, alocs in matches.items() if len(alocs) > 0]
-        projetos_vazios = [p for p, alocs in matches.items() if len(alocs) == 0]
-        
-        # Total de vagas disponíveis e ocupadas
-        total_vagas = sum(p.getNumeroVagas() for p in self.projetos)
-        vagas_ocupadas = sum(len(alocs) for alocs in matches.values())
-        
-        # Análise de projetos vazios
-        print("\n" + "="*60)
-        print("ESTATÍSTICAS DO EMPARELHAMENTO")
-        print("="*60)
-        
-        print(f"\n📊 RESUMO GERAL:")
-        print(f"  • Total de alunos: {len(self.alunos)}")
-        print(f"  • Alunos alocados: {len(alunos_alocados)} ({len(alunos_alocados)/len(self.alunos)*100:.1f}%)")
-        print(f"  • Alunos não alocados: {len(alunos_nao_alocados)} ({len(alunos_nao_alocados)/len(self.alunos)*100:.1f}%)")
-        
-        print(f"\n  • Total de projetos: {len(self.projetos)}")
-        print(f"  • Projetos preenchidos: {len(projetos_preenchidos)} ({len(projetos_preenchidos)/len(self.projetos)*100:.1f}%)")
-        print(f"  • Projetos vazios: {len(projetos_vazios)} ({len(projetos_vazios)/len(self.projetos)*100:.1f}%)")
-        
-        print(f"\n  • Total de vagas: {total_vagas}")
-        print(f"  • Vagas ocupadas: {vagas_ocupadas} ({vagas_ocupadas/total_vagas*100:.1f}%)")
-        print(f"  • Vagas disponíveis: {total_vagas - vagas_ocupadas}")
-        
-        # Análise de alunos não alocados
-        if alunos_nao_alocados:
-            print(f"\nALUNOS NÃO ALOCADOS ({len(alunos_nao_alocados)}):")
-            for aluno in alunos_nao_alocados[:10]:  # mostra até 10
-                prefs = aluno.getPreferenciasProjetos()
-                nota = aluno.getNota()
-                print(f"  • {aluno.getCodigo()} (Nota: {nota}) - Preferências: {prefs[:3]}...")
-            if len(alunos_nao_alocados) > 10:
-                print(f"  ... e mais {len(alunos_nao_alocados) - 10} alunos")
-        
-        # Análise de projetos vazios
-        if projetos_vazios:
-            print(f"\nPROJETOS VAZIOS ({len(projetos_vazios)}):")
-            for proj_cod in projetos_vazios[:10]:  # mostra até 10
-                projeto = self._busca_projeto(proj_cod)
-                # Contar quantos alunos tinham interesse
-                interessados = sum(1 for a in self.alunos if proj_cod in a.getPreferenciasProjetos())
-                qualificados = sum(1 for a in self.alunos 
-                                 if proj_cod in a.getPreferenciasProjetos() 
-                                 and a.getNota() >= projeto.getRequisitoNotas())
-                
-                print(f"  • {proj_cod} (Vagas: {projeto.getNumeroVagas()}, Req: {projeto.getRequisitoNotas()}) - "
-                      f"Interessados: {interessados}, Qualificados: {qualificados}")
-            if len(projetos_vazios) > 10:
-                print(f"  ... e mais {len(projetos_vazios) - 10} projetos")
-        
-        # Distribuição de preferências
-        print(f"\nQUALIDADE DAS ALOCAÇÕES:")
-        preferencias_atendidas = {1: 0, 2: 0, 3: 0, '4+': 0}
-        for aluno in self.alunos:
-            if aluno.getCodigo() in alunos_alocados:
-                # Encontrar qual projeto o aluno foi alocado
-                for proj_cod, alocs in matches.items():
-                    if any(a.getCodigo() == aluno.getCodigo() for a in alocs):
-                        prefs = aluno.getPreferenciasProjetos()
-                        if proj_cod in prefs:
-                            pos = prefs.index(proj_cod) + 1
-                            if pos <= 3:
-                                preferencias_atendidas[pos] += 1
-                            else:
-                                preferencias_atendidas['4+'] += 1
-                        break
-        
-        total_alocados = len(alunos_alocados)
-        if total_alocados > 0:
-            print(f"  • 1ª escolha: {preferencias_atendidas[1]} ({preferencias_atendidas[1]/total_alocados*100:.1f}%)")
-            print(f"  • 2ª escolha: {preferencias_atendidas[2]} ({preferencias_atendidas[2]/total_alocados*100:.1f}%)")
-            print(f"  • 3ª escolha: {preferencias_atendidas[3]} ({preferencias_atendidas[3]/total_alocados*100:.1f}%)")
-            print(f"  • 4ª+ escolha: {preferencias_atendidas['4+']} ({preferencias_atendidas['4+']/total_alocados*100:.1f}%)")
-        
-        print("\n" + "="*60)
-        
-        # Imprimir resultado por projeto
-        print("\n=== EMPARELHAMENTO FINAL ===")
-        for projeto_cod, alocados in matches.items():
-            if alocados:
-                nomes_alunos = [a.getCodigo() for a in alocados]
-                print(f"{projeto_cod}: {nomes_alunos}")
+            # Última tentativa: o melhor aluno ainda livre
+            while prox_livre < len(livres) and livres[prox_livre].getCodigo() in projeto_de:
+                prox_livre += 1
+
+            if prox_livre == len(livres):
+                self._print(f"  ✗ {projeto_vazio_cod}: Impossível alocar (sem candidatos viáveis)")
+                continue
+
+            melhor = livres[prox_livre]
+            matches[projeto_vazio_cod].append(melhor)
+            projeto_de[melhor.getCodigo()] = projeto_vazio_cod
+            self._marcar_aresta(melhor.getCodigo(), projeto_vazio_cod, "temporario")
+            if melhor.getNota() >= requisito:
+                self._print(f"  ✓ {projeto_vazio_cod}: Alocado {melhor.getCodigo()} (forçado)")
             else:
-                print(f"{projeto_cod}: (vazio)")
+                # RELAXAMENTO: nenhum livre atende o requisito mínimo
+                self._print(f"  ⚠ {projeto_vazio_cod}: Alocado {melhor.getCodigo()} (REQUISITO RELAXADO - nota {melhor.getNota()} < {requisito})")
+
+    def _maximizar_emparelhamento(self, matches):
+        """
+        Fase 2 alternativa (Hopcroft–Karp): a partir da fase 1, cobre o maior número
+        possível de projetos e depois aloca o maior número possível de alunos, só com
+        arestas qualificadas e sem passar das vagas. Altera `matches` no lugar.
+        """
+        self._print("\n🔧 FASE 2: Hopcroft–Karp (máximo de projetos cobertos e de alunos alocados)...")
+
+        vazios_antes = [p_cod for p_cod, alocs in matches.items() if not alocs]
+        alocados_antes = sum(len(alocs) for alocs in matches.values())
+
+        novos, movimentos = fase2_maxima(self.alunos, self.registro.projetos, matches, self.preferencias)
+        matches.update(novos)
+
+        for aluno, anterior, novo in movimentos:
+            cod = aluno.getCodigo()
+            if anterior is not None:
+                self._marcar_aresta(cod, anterior, "realocacao")
+            self._marcar_aresta(cod, novo, "temporario")
+
+        for p_cod in vazios_antes:
+            if matches[p_cod]:
+                self._print(f"  ✓ {p_cod}: Coberto por {matches[p_cod][0].getCodigo()}")
+            else:
+                self._print(f"  ✗ {p_cod}: Impossível alocar (sem candidatos qualificados)")
+
+        alocados = sum(len(alocs) for alocs in matches.values())
+        realocados = sum(1 for _, anterior, _ in movimentos if anterior is not None)
+        self._print(f"  ✓ {alocados - alocados_antes} aluno(s) a mais alocado(s), {realocados} realocado(s)")
+
+    def verificar(self, matches=None):
+        """
+        Verifica restrições e pares bloqueantes do resultado (padrão: o da última execução)
+        com os mesmos ranks da fase 1. Devolve um RelatorioVerificacao.
+        """
+        if matches is None:
+            matches = self.matches
+        if matches is None:
+            raise ValueError("Grafo sem emparelhamento: rode emparelhar() antes de verificar")
+        ranks = self.gale_shapley.ranks if self.gale_shapley is not None else None
+        with self._fase("verificacao"):
+            return verificar(self.alunos, self.registro.projetos, matches, ranking=self.ranking, ranks=ranks)
+
+    def _imprimir_estatisticas(self, matches):
+        """Calcula (em self.estatisticas) e imprime estatísticas detalhadas do emparelhamento"""
+        self.estatisticas = calcular_estatisticas(self.alunos, self.projetos, matches)
+        self._print(formatar_estatisticas(self.estatisticas))
 
         return matches
 
@@ -427,132 +575,94 @@ class Grafo:
     # GERAR VISUALIZAÇÕES
     # ---------------------------------------------------------
     def registrarVisualizacao(self, iteracao, matches):
-        """Salva visualizações do estado do grafo em cada iteração"""
+        """
+        Registra o estado do grafo nas iterações escolhidas. A renderização dos PNGs
+        acontece em segundo plano (FilaVisualizacoes); use aguardar_visualizacoes() no fim.
+        """
+        if not self.visualizacoes:
+            return
         if iteracao not in [1, 3, 5, 7, 10]:  # Só salva em iterações específicas
             return
-            
-        import os
-        if not os.path.exists("visualizacoes"):
-            os.makedirs("visualizacoes")
-        
-        # Criar 4 visualizações separadas
-        cores_grupos = {
-            'propostas': (['blue'], 'Propostas (Azul)'),
-            'rejeicoes': (['red'], 'Rejeições (Vermelho)'),
-            'temporarios': (['green'], 'Alocações Temporárias (Verde)'),
-            'todas': (['blue', 'green', 'red'], 'Estado Completo')
-        }
-        
-        for nome, (cores, titulo) in cores_grupos.items():
-            self._salvar_visualizacao_cores(iteracao, cores, f"{titulo} - Iteração {iteracao}", 
-                                           f"visualizacoes/iter{iteracao:02d}_{nome}.png")
-    
+
+        with self._fase("renderizacao"):
+            if self.fila_visualizacoes is None:
+                from entidades.renderizador import FilaVisualizacoes
+
+                self.fila_visualizacoes = FilaVisualizacoes()
+            self.fila_visualizacoes.registrar(iteracao, self._estado_atual())
+
+    def _ao_iterar(self, iteracao, alocados):
+        self._iteracao = iteracao
+        self.registrarVisualizacao(iteracao, alocados)
+
+    def aguardar_visualizacoes(self):
+        """Espera a renderização de todas as visualizações registradas e fecha o pool de processos"""
+        if self.fila_visualizacoes is None:
+            return []
+        with self._fase("renderizacao"):
+            arquivos = self.fila_visualizacoes.encerrar()
+        if self.perfil is not None:
+            self.perfil.contar("pngs_gravados", len(arquivos))
+        return arquivos
+
+    def fechar(self):
+        """Termina as visualizações pendentes e libera o pool de processos"""
+        self.aguardar_visualizacoes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
     def _salvar_visualizacao_cores(self, iteracao, mostrar_cores, titulo, arquivo):
-        """Salva uma visualização mostrando apenas cores específicas"""
-        fig = plt.figure(figsize=(16, 12))
-        
-        # Separar nós por tipo
-        alunos_nodes = [n for n, d in self.G.nodes(data=True) if d.get('tipo') == 'aluno']
-        projetos_nodes = [n for n, d in self.G.nodes(data=True) if d.get('tipo') == 'projeto']
-        
-        # Criar layout bipartido
-        pos = {}
-        y_spacing_alunos = 1.0 / (len(alunos_nodes) + 1) if alunos_nodes else 1
-        for i, aluno in enumerate(alunos_nodes):
-            pos[aluno] = (0, 1 - (i + 1) * y_spacing_alunos)
-        
-        y_spacing_projetos = 1.0 / (len(projetos_nodes) + 1) if projetos_nodes else 1
-        for i, projeto in enumerate(projetos_nodes):
-            pos[projeto] = (2, 1 - (i + 1) * y_spacing_projetos)
-        
-        # Desenhar nós
-        nx.draw_networkx_nodes(self.G, pos, nodelist=alunos_nodes,
-                              node_color='lightblue', node_shape='o', 
-                              node_size=600, label='Alunos')
-        nx.draw_networkx_nodes(self.G, pos, nodelist=projetos_nodes,
-                              node_color='lightgreen', node_shape='s', 
-                              node_size=600, label='Projetos')
-        
-        # Agrupar e desenhar arestas por cor
-        cores_arestas = {}
-        for u, v, data in self.G.edges(data=True):
-            cor = data.get('cor', 'black')
-            if cor not in cores_arestas:
-                cores_arestas[cor] = []
-            cores_arestas[cor].append((u, v))
-        
-        mapa_labels = {
-            'black': 'Preferência',
-            'blue': 'Proposta',
-            'green': 'Temporário',
-            'red': 'Rejeitado',
-            'orange': 'Final'
-        }
-        
-        contador = {}
-        for cor, arestas in cores_arestas.items():
-            if cor in mostrar_cores:
-                contador[cor] = len(arestas)
-                label = f"{mapa_labels.get(cor, cor)} ({len(arestas)})"
-                nx.draw_networkx_edges(self.G, pos, edgelist=arestas,
-                                      edge_color=cor, width=3, alpha=0.7, label=label)
-        
-        # Labels dos nós (só código)
-        labels = {node: node for node in self.G.nodes()}
-        nx.draw_networkx_labels(self.G, pos, labels, font_size=7)
-        
-        # Título e informações
-        info_cores = " | ".join([f"{mapa_labels.get(c, c)}: {contador.get(c, 0)}" 
-                                 for c in mostrar_cores if c in contador])
-        plt.title(f"{titulo}\n{info_cores}", fontsize=14, fontweight='bold')
-        plt.legend(loc='upper left', fontsize=10)
-        plt.axis('off')
-        plt.tight_layout()
-        plt.savefig(arquivo, dpi=150, bbox_inches='tight')
-        plt.close(fig)
-        print(f"  -> Salva: {arquivo}")
+        """Salva (de forma síncrona) uma visualização mostrando apenas cores específicas"""
+        from entidades.renderizador import desenhar_estado
+
+        with self._fase("renderizacao"):
+            desenhar_estado(self._estado_atual(), mostrar_cores, titulo, arquivo)
+        if self.perfil is not None:
+            self.perfil.contar("pngs_gravados")
 
     # ---------------------------------------------------------
     # MARCAR CORES NAS ARESTAS
     # ---------------------------------------------------------
     def _marcar_aresta(self, aluno_cod, projeto_cod, status):
 
-        # Se a aresta não existe, cria ela
-        if not self.G.has_edge(aluno_cod, projeto_cod):
-            self.G.add_edge(aluno_cod, projeto_cod, peso=0, ordem=0, cor="black")
+        if self.rastro is not None:
+            from entidades.rastro import EVENTO_STATUS
 
-        cor = {
-            "proposta": "blue",
-            "temporario": "green",
-            "rejeicao": "red",
-            "final": "orange"
-        }.get(status, "black")
+            self.rastro.registrar(self._iteracao, aluno_cod, projeto_cod, EVENTO_STATUS[status])
 
-        self.G[aluno_cod][projeto_cod]["cor"] = cor
+        # cria a aresta se ela não existir (ex.: realocação da fase 2)
+        self.arestas.marcar(aluno_cod, projeto_cod, CODIGO_STATUS.get(status, PREFERENCIA))
+        self._G = None
 
     # ---------------------------------------------------------
     # IMPRIMIR INFORMAÇÕES DO GRAFO
     # ---------------------------------------------------------
+    def _print(self, *args, **kwargs):
+        """print das mensagens de execução; não troca sys.stdout, então é seguro entre threads"""
+        if not self.silencioso:
+            print(*args, **kwargs)
+
     def imprimir(self):
         """Imprime informações sobre os nós do grafo"""
         print("\n=== ALUNOS ===")
         for aluno in self.alunos:
-            print(f"Código: {aluno.getCodigo()}, Nota: {aluno.getNota()}, Preferências: {aluno.getPreferenciasProjetos()}")
+            print(f"Código: {aluno.getCodigo()}, Nota: {aluno.getNota()}, Preferências: {list(aluno.getPreferenciasProjetos())}")
         
         print("\n=== PROJETOS ===")
         for projeto in self.projetos:
             print(f"Código: {projeto.getCodigo()}, Vagas: {projeto.getNumeroVagas()}, Requisito: {projeto.getRequisitoNotas()}")
         
-        print(f"\nTotal de nós: {self.G.number_of_nodes()}")
-        print(f"Total de arestas: {self.G.number_of_edges()}")
+        print(f"\nTotal de nós: {len(self.registro.alunos) + len(self.registro.projetos)}")
+        print(f"Total de arestas: {len(self.arestas)}")
 
     def imprimir_arestas(self):
         """Imprime informações sobre as arestas do grafo"""
         print("\n=== ARESTAS ===")
-        for u, v, data in self.G.edges(data=True):
-            peso = data.get('peso', 'N/A')
-            ordem = data.get('ordem', 'N/A')
-            cor = data.get('cor', 'black')
+        for u, v, peso, ordem, cor in self.arestas.itens():
             print(f"{u} -> {v} | Peso: {peso}, Ordem: {ordem}, Cor: {cor}")
 
     def visualizar(self, titulo="Grafo de Emparelhamento", mostrar_cores=None):
@@ -565,97 +675,23 @@ class Grafo:
                           Se None, mostra todas as arestas
                           Cores disponíveis: 'black', 'blue', 'green', 'red', 'orange'
         """
-        if self.G.number_of_nodes() == 0:
+        if not self.alunos and not self.projetos:
             print("Grafo vazio, nada para visualizar.")
             return
 
-        plt.figure(figsize=(14, 10))
-        
-        # Separar nós por tipo
-        alunos_nodes = [n for n, d in self.G.nodes(data=True) if d.get('tipo') == 'aluno']
-        projetos_nodes = [n for n, d in self.G.nodes(data=True) if d.get('tipo') == 'projeto']
-        
-        # Criar layout bipartido
-        pos = {}
-        
-        # Posicionar alunos à esquerda
-        y_spacing_alunos = 1.0 / (len(alunos_nodes) + 1) if alunos_nodes else 1
-        for i, aluno in enumerate(alunos_nodes):
-            pos[aluno] = (0, 1 - (i + 1) * y_spacing_alunos)
-        
-        # Posicionar projetos à direita
-        y_spacing_projetos = 1.0 / (len(projetos_nodes) + 1) if projetos_nodes else 1
-        for i, projeto in enumerate(projetos_nodes):
-            pos[projeto] = (2, 1 - (i + 1) * y_spacing_projetos)
-        
-        # Desenhar nós de alunos (círculos azuis)
-        nx.draw_networkx_nodes(
-            self.G, pos,
-            nodelist=alunos_nodes,
-            node_color='lightblue',
-            node_shape='o',
-            node_size=800,
-            label='Alunos'
-        )
-        
-        # Desenhar nós de projetos (quadrados verdes)
-        nx.draw_networkx_nodes(
-            self.G, pos,
-            nodelist=projetos_nodes,
-            node_color='lightgreen',
-            node_shape='s',
-            node_size=800,
-            label='Projetos'
+        import matplotlib.pyplot as plt
+        from entidades.renderizador import Desenhista, MAPA_LABELS
+
+        # rótulos com nota (alunos) e vagas/requisito (projetos)
+        rotulos = {a.getCodigo(): f"{a.getCodigo()}\n(Nota: {a.getNota()})" for a in self.alunos}
+        rotulos.update((p.getCodigo(), f"{p.getCodigo()}\n(V:{p.getNumeroVagas()}, R:{p.getRequisitoNotas()})")
+                       for p in self.projetos)
+
+        desenhista = Desenhista(
+            plt.figure(figsize=(14, 10)), tamanho_no=800, largura=2, alpha=0.6,
+            fonte_rotulos=8, fonte_titulo=16, contar=False,
+            labels={**MAPA_LABELS, 'green': 'Alocado'}
         )
-        
-        # Agrupar arestas por cor
-        cores_arestas = {}
-        for u, v, data in self.G.edges(data=True):
-            cor = data.get('cor', 'black')
-            if cor not in cores_arestas:
-                cores_arestas[cor] = []
-            cores_arestas[cor].append((u, v))
-        
-        # Desenhar arestas com suas respectivas cores
-        mapa_labels_cores = {
-            'black': 'Preferência',
-            'blue': 'Proposta',
-            'green': 'Alocado',
-            'red': 'Rejeitado',
-            'orange': 'Final'
-        }
-        
-        for cor, arestas in cores_arestas.items():
-            # Se mostrar_cores foi especificado, filtra apenas as cores desejadas
-            if mostrar_cores is not None and cor not in mostrar_cores:
-                continue
-                
-            label = mapa_labels_cores.get(cor, cor)
-            nx.draw_networkx_edges(
-                self.G, pos,
-                edgelist=arestas,
-                edge_color=cor,
-                width=2,
-                alpha=0.6,
-                label=label
-            )
-        
-        # Adicionar labels dos nós
-        labels = {}
-        for node in self.G.nodes():
-            data = self.G.nodes[node]
-            if data.get('tipo') == 'aluno':
-                nota = data.get('nota', '?')
-                labels[node] = f"{node}\n(Nota: {nota})"
-            else:
-                vagas = data.get('vagas', '?')
-                req = data.get('requisito', '?')
-                labels[node] = f"{node}\n(V:{vagas}, R:{req})"
-        
-        nx.draw_networkx_labels(self.G, pos, labels, font_size=8)
-        
-        plt.title(titulo, fontsize=16, fontweight='bold')
-        plt.legend(loc='upper left', fontsize=10)
-        plt.axis('off')
+        desenhista.desenhar(self._estado_atual(), mostrar_cores, titulo, rotulos=rotulos)
         plt.tight_layout()
         plt.show()
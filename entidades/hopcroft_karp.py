@@ -0,0 +1,203 @@
+"""
+Fase 2 alternativa: emparelhamento de cardinalidade máxima (Hopcroft–Karp).
+
+Parte do resultado da fase 1 e usa só arestas qualificadas (projeto listado nas
+preferências efetivas, existente, com vaga e requisito <= nota). Em duas etapas,
+cada uma um Hopcroft–Karp com capacidades (equivalente a expandir cada vaga em
+um vértice), O(E·√V) sobre o grafo expandido:
+
+  1. cobertura: projetos × "representante" (um aluno por projeto). Caminhos
+     aumentantes a partir de projetos vazios trocam representantes de lugar até
+     chegar a um aluno livre ou a um aluno que sobra em um projeto com mais de um.
+     Resultado: o maior número possível de projetos com pelo menos 1 aluno.
+  2. alocação: alunos × vagas. Caminhos aumentantes a partir de alunos livres
+     preenchem vagas ociosas, remanejando alunos entre projetos.
+
+Caminhos aumentantes nunca desalocam ninguém: cada projeto intermediário recebe
+um aluno e perde outro, então a etapa 2 não desfaz a cobertura da etapa 1 e
+nenhum aluno alocado na fase 1 volta a ficar livre. Ao contrário da fase 2
+gulosa, não há alocação forçada fora das preferências nem requisito relaxado.
+"""
+INF = float("inf")
+
+
+def hopcroft_karp(adj, cap, par, ocupantes):
+    """
+    Hopcroft–Karp com capacidades do lado direito (b-emparelhamento).
+
+    Args:
+        adj: adj[u] = vértices da direita vizinhos de u (esquerda)
+        cap: cap[v] = capacidade de v (direita)
+        par: par[u] = vértice da direita de u ou -1 (alterado no lugar)
+        ocupantes: ocupantes[v] = lista dos u em v (alterada no lugar)
+
+    Returns:
+        número de caminhos aumentantes aplicados
+    """
+    n = len(adj)
+    total = 0
+
+    while True:
+        # BFS em camadas a partir dos livres; `limite` = comprimento do menor caminho aumentante
+        dist = [INF] * n
+        fila = [u for u in range(n) if par[u] == -1 and adj[u]]
+        for u in fila:
+            dist[u] = 0
+        limite = INF
+        i = 0
+        while i < len(fila):
+            u = fila[i]
+            i += 1
+            if dist[u] >= limite:
+                break
+            for v in adj[u]:
+                if v == par[u]:
+                    continue
+                if len(ocupantes[v]) < cap[v]:
+                    limite = min(limite, dist[u] + 1)
+                    continue
+                for w in ocupantes[v]:
+                    if dist[w] == INF:
+                        dist[w] = dist[u] + 1
+                        fila.append(w)
+        if limite == INF:
+            return total
+
+        # DFS iterativa por caminhos de comprimento `limite`
+        for raiz in range(n):
+            if par[raiz] != -1 or dist[raiz] != 0:
+                continue
+            caminho = []  # [(u, v)]: u passa para v
+            pilha = [(raiz, _vizinhos(adj, par, ocupantes, raiz))]
+            while pilha:
+                u, vizinhos = pilha[-1]
+                avancou = False
+                for v, w in vizinhos:
+                    if w is None:
+                        if len(ocupantes[v]) < cap[v] and dist[u] + 1 == limite:
+                            caminho.append((u, v))
+                            _aplicar(caminho, par, ocupantes)
+                            total += 1
+                            pilha.clear()
+                            avancou = True
+                            break
+                    elif par[w] == v and dist[w] == dist[u] + 1:
+                        caminho.append((u, v))
+                        pilha.append((w, _vizinhos(adj, par, ocupantes, w)))
+                        avancou = True
+                        break
+                if not avancou:
+                    # beco sem saída: u não serve mais nesta fase
+                    dist[u] = INF
+                    pilha.pop()
+                    if caminho:
+                        caminho.pop()
+
+
+def _vizinhos(adj, par, ocupantes, u):
+    """(v, None) = vaga livre em v; (v, w) = w ocupa v e pode ser empurrado adiante"""
+    for v in adj[u]:
+        if v == par[u]:
+            continue
+        yield v, None
+        yield from ((v, w) for w in tuple(ocupantes[v]))
+
+
+def _aplicar(caminho, par, ocupantes):
+    # do fim para o começo: quem chega na vaga livre sai primeiro do lugar antigo
+    for u, v in reversed(caminho):
+        antigo = par[u]
+        if antigo != -1:
+            ocupantes[antigo].remove(u)
+        par[u] = v
+        ocupantes[v].append(u)
+
+
+# ---------------------------------------------------------
+# FASE 2
+# ---------------------------------------------------------
+def fase2_maxima(alunos, projetos, matches, preferencias=None):
+    """
+    Args:
+        alunos: lista de Aluno (ordem de entrada)
+        projetos: {cod_projeto: Projeto} (ex.: Registro.projetos)
+        matches: {cod_projeto: [Aluno]} resultado da fase 1
+        preferencias: {cod_aluno: tupla efetiva} (None = listas originais)
+
+    Returns:
+        (novos matches, movimentos): movimentos = [(Aluno, projeto_antigo ou None, projeto_novo)]
+    """
+    codigos = list(matches)
+    id_projeto = {cod: j for j, cod in enumerate(codigos)}
+    cap = [projetos[cod].getNumeroVagas() if cod in projetos else 0 for cod in codigos]
+    requisito = [projetos[cod].getRequisitoNotas() if cod in projetos else 0 for cod in codigos]
+
+    indice = {id(aluno): i for i, aluno in enumerate(alunos)}
+    projeto_de = [-1] * len(alunos)
+    membros = [[] for _ in codigos]
+    for cod, alocados in matches.items():
+        j = id_projeto[cod]
+        for aluno in alocados:
+            i = indice[id(aluno)]
+            if projeto_de[i] == -1:
+                projeto_de[i] = j
+                membros[j].append(i)
+
+    # arestas qualificadas aluno -> projeto (na ordem de preferência, sem repetição)
+    adj = []
+    for i, aluno in enumerate(alunos):
+        prefs = aluno.getPreferenciasProjetos() if preferencias is None else preferencias[aluno.getCodigo()]
+        nota = aluno.getNota()
+        vizinhos = []
+        for cod in prefs:
+            j = id_projeto.get(cod)
+            if j is not None and cap[j] > 0 and nota >= requisito[j] and j not in vizinhos:
+                vizinhos.append(j)
+        if projeto_de[i] != -1 and projeto_de[i] not in vizinhos:
+            vizinhos.append(projeto_de[i])  # o lugar atual sempre é uma aresta válida
+        adj.append(vizinhos)
+
+    # etapa 1: cobertura (esquerda = projetos, direita = alunos com capacidade 1)
+    representante = [membros[j][0] if membros[j] else -1 for j in range(len(codigos))]
+    representa = [[] for _ in alunos]
+    for j, i in enumerate(representante):
+        if i != -1:
+            representa[i].append(j)
+    interessados = [[] for _ in codigos]
+    for i, vizinhos in enumerate(adj):
+        for j in vizinhos:
+            interessados[j].append(i)
+    hopcroft_karp(interessados, [1] * len(alunos), representante, representa)
+
+    for j, i in enumerate(representante):
+        if i != -1 and projeto_de[i] != j:
+            if projeto_de[i] != -1:
+                membros[projeto_de[i]].remove(i)
+            projeto_de[i] = j
+            membros[j].append(i)
+
+    # etapa 2: alocação máxima (esquerda = alunos, direita = projetos com as vagas)
+    hopcroft_karp(adj, cap, projeto_de, membros)
+
+    # mesmo formato de matches: quem já estava mantém a ordem, quem chegou vem depois (ordem de entrada)
+    novos = {}
+    movimentos = []
+    for cod, alocados in matches.items():
+        j = id_projeto[cod]
+        ficaram = [a for a in alocados if projeto_de[indice[id(a)]] == j]
+        presentes = {id(a) for a in ficaram}
+        chegaram = sorted((i for i in membros[j] if id(alunos[i]) not in presentes))
+        novos[cod] = ficaram + [alunos[i] for i in chegaram]
+
+    antes = {}
+    for cod, alocados in matches.items():
+        for aluno in alocados:
+            antes.setdefault(id(aluno), cod)
+    for i, j in enumerate(projeto_de):
+        if j == -1:
+            continue
+        anterior = antes.get(id(alunos[i]))
+        if anterior != codigos[j]:
+            movimentos.append((alunos[i], anterior, codigos[j]))
+
+    return novos, movimentos
@@ -0,0 +1,124 @@
+import mmap
+import os
+import re
+from entidades.aluno import Aluno
+from entidades.projeto import Projeto
+
+# formato: (A1):(P1, P30, P50) (5)
+PADRAO_ALUNO = re.compile(r"\(([^)]+)\):\(([^)]+)\)\s+\((\d+)\)")
+# formato: (P1, 2, 5)
+PADRAO_PROJETO = re.compile(r"\(([^,]+),\s*(\d+),\s*(\d+)\)")
+
+
+class ErroLeitura(ValueError):
+    """Linha malformada em um arquivo de entrada (com número da linha)"""
+
+    def __init__(self, arquivo, numero_linha, linha, motivo="linha malformada"):
+        self.arquivo = arquivo
+        self.numero_linha = numero_linha
+        self.linha = linha
+        self.motivo = motivo
+        super().__init__(f"{arquivo}:{numero_linha}: {motivo}: {linha!r}")
+
+
+# ---------------------------------------------------------
+# LEITURA DE LINHAS
+# ---------------------------------------------------------
+def _nome_fonte(fonte):
+    if isinstance(fonte, (str, bytes, os.PathLike)):
+        return os.fsdecode(fonte)
+    return getattr(fonte, "name", "<arquivo>")
+
+
+def _linhas_mmap(arq):
+    try:
+        mapa = mmap.mmap(arq.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # arquivo vazio não pode ser mapeado
+        return
+    with mapa:
+        for linha in iter(mapa.readline, b""):
+            yield linha
+
+
+def linhas_numeradas(fonte, usar_mmap=False):
+    """
+    Gera (numero_linha, linha) sem carregar o arquivo inteiro.
+
+    Args:
+        fonte: caminho ou objeto arquivo (texto ou binário)
+        usar_mmap: lê o arquivo via mmap (apenas para caminhos ou arquivos com fileno)
+    """
+    if isinstance(fonte, (str, bytes, os.PathLike)):
+        with open(fonte, "rb") as arq:
+            linhas = _linhas_mmap(arq) if usar_mmap else arq
+            yield from _numerar(linhas)
+        return
+
+    if usar_mmap:
+        yield from _numerar(_linhas_mmap(fonte))
+    else:
+        yield from _numerar(fonte)
+
+
+def _numerar(linhas):
+    for numero, linha in enumerate(linhas, start=1):
+        if isinstance(linha, bytes):
+            linha = linha.decode("utf-8")
+        yield numero, linha
+
+
+def _linhas_uteis(fonte, usar_mmap):
+    """Ignora linhas vazias e comentários (//)"""
+    for numero, linha in linhas_numeradas(fonte, usar_mmap):
+        linha = linha.strip()
+        if not linha or linha.startswith("//"):
+            continue
+        yield numero, linha
+
+
+def _reportar(erro, erros):
+    if erros is None:
+        raise erro
+    erros.append(erro)
+
+
+# ---------------------------------------------------------
+# LEITORES
+# ---------------------------------------------------------
+def ler_alunos(fonte, usar_mmap=False, erros=None):
+    """
+    Gera objetos Aluno a partir do arquivo de alunos, sob demanda.
+
+    Linhas malformadas levantam ErroLeitura; se `erros` for uma lista, os erros
+    são acumulados nela e a leitura continua.
+    """
+    nome = _nome_fonte(fonte)
+    casar = PADRAO_ALUNO.match
+    for numero, linha in _linhas_uteis(fonte, usar_mmap):
+        match = casar(linha)
+        if match is None:
+            _reportar(ErroLeitura(nome, numero, linha), erros)
+            continue
+        cod = match.group(1)
+        prefs = [x.strip() for x in match.group(2).split(",")]
+        nota = int(match.group(3))
+        yield Aluno(cod, prefs, nota)
+
+
+def ler_projetos(fonte, usar_mmap=False, erros=None):
+    """
+    Gera objetos Projeto a partir do arquivo de projetos, sob demanda.
+    Mesmo tratamento de erros de ler_alunos.
+    """
+    nome = _nome_fonte(fonte)
+    casar = PADRAO_PROJETO.match
+    for numero, linha in _linhas_uteis(fonte, usar_mmap):
+        match = casar(linha)
+        if match is None:
+            _reportar(ErroLeitura(nome, numero, linha), erros)
+            continue
+        cod = match.group(1)
+        vagas = int(match.group(2))
+        requisito = int(match.group(3))
+        yield Projeto(cod, vagas, requisito)
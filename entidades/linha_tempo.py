@@ -0,0 +1,136 @@
+"""
+Exportação da linha do tempo do emparelhamento (alternativa aos PNGs).
+
+A partir de um Rastro grava, em um único JSON (ou .json.gz):
+
+    {
+      "versao": 1,
+      "alunos": [...], "projetos": [...],          códigos na ordem dos IDs
+      "layout": {"alunos": [y...], "projetos": [y...]},   x = 0 (alunos) / 2 (projetos)
+      "arestas": [a0, p0, a1, p1, ...],            pares (ID aluno, ID projeto), plano
+      "iniciais": n,                               as n primeiras existem desde o início (pretas)
+      "cores": ["blue", "red", "green", "black", "orange", "black", "black"],
+      "nomes": ["proposta", ..., "realocacao", "remocao"],   tipo de evento -> nome
+      "iteracoes": [k0, k1, ...],
+      "deltas": [[aresta, evento, aresta, evento, ...], ...]   um por iteração
+    }
+
+Cada delta guarda só o último evento de cada aresta na iteração, então o
+estado em k é o estado inicial com os deltas até k aplicados em ordem
+(o mesmo que Rastro.estado_em(k)). O visualizador HTML (linha_tempo.html)
+embute esses dados e reproduz qualquer iteração sem rede e sem matplotlib.
+"""
+import gzip
+import html
+import json
+import os
+import re
+
+from entidades.rastro import COR_EVENTO, NOMES_EVENTOS
+
+MODELO_HTML = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linha_tempo.html")
+
+
+def _layout(n):
+    espaco = 1.0 / (n + 1) if n else 1
+    return [round(1 - (i + 1) * espaco, 6) for i in range(n)]
+
+
+def montar_linha_tempo(rastro):
+    """Dicionário da linha do tempo (formato descrito no módulo)"""
+    indice = {}
+    arestas = []
+    for a, p in rastro.arestas.tolist():
+        if (a, p) not in indice:
+            indice[(a, p)] = len(arestas) // 2
+            arestas += (a, p)
+    iniciais = len(arestas) // 2
+
+    iteracoes = []
+    deltas = []
+    eventos = rastro.eventos
+    atual = None
+    ultimo = {}
+    for k, a, p, e in zip(eventos["iteracao"].tolist(), eventos["aluno"].tolist(),
+                          eventos["projeto"].tolist(), eventos["evento"].tolist()):
+        if k != atual:
+            if atual is not None:
+                iteracoes.append(atual)
+                deltas.append([x for par in ultimo.items() for x in par])
+            atual, ultimo = k, {}
+
+        i = indice.get((a, p))
+        if i is None:
+            # aresta criada durante a execução (ex.: fase 2)
+            i = indice[(a, p)] = len(arestas) // 2
+            arestas += (a, p)
+        ultimo.pop(i, None)  # reinsere no fim: mantém a ordem do último evento
+        ultimo[i] = e
+
+    if atual is not None:
+        iteracoes.append(atual)
+        deltas.append([x for par in ultimo.items() for x in par])
+
+    return {
+        "versao": 1,
+        "alunos": list(rastro.alunos),
+        "projetos": list(rastro.projetos),
+        "layout": {"alunos": _layout(len(rastro.alunos)), "projetos": _layout(len(rastro.projetos))},
+        "arestas": arestas,
+        "iniciais": iniciais,
+        "cores": list(COR_EVENTO),
+        "nomes": list(NOMES_EVENTOS),
+        "iteracoes": iteracoes,
+        "deltas": deltas,
+    }
+
+
+def _json_compacto(dados):
+    return json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+
+
+def exportar_linha_tempo(rastro, caminho):
+    """Grava a linha do tempo em JSON (.json.gz grava comprimido) e devolve o caminho"""
+    texto = _json_compacto(montar_linha_tempo(rastro))
+    if str(caminho).endswith(".gz"):
+        with gzip.open(caminho, "wt", encoding="utf-8") as arq:
+            arq.write(texto)
+    else:
+        with open(caminho, "w", encoding="utf-8") as arq:
+            arq.write(texto)
+    return caminho
+
+
+def carregar_linha_tempo(caminho):
+    abrir = gzip.open if str(caminho).endswith(".gz") else open
+    with abrir(caminho, "rt", encoding="utf-8") as arq:
+        return json.load(arq)
+
+
+def exportar_html(rastro, caminho, titulo="Emparelhamento"):
+    """Grava o visualizador HTML com a linha do tempo embutida (arquivo único, sem rede)"""
+    with open(MODELO_HTML, "r", encoding="utf-8") as arq:
+        modelo = arq.read()
+    # "</" escapado para o JSON não fechar a tag <script>
+    dados = _json_compacto(montar_linha_tempo(rastro)).replace("</", "<\\/")
+    # uma passada só: um código ou título contendo "__DADOS__" não é substituído de novo
+    valores = {"TITULO": html.escape(titulo), "DADOS": dados}
+    pagina = re.sub(r"__(TITULO|DADOS)__", lambda m: valores[m.group(1)], modelo)
+    with open(caminho, "w", encoding="utf-8") as arq:
+        arq.write(pagina)
+    return caminho
+
+
+def estado_em(linha_tempo, iteracao=None):
+    """Cores das arestas ao fim da iteração: {(cod_aluno, cod_projeto): cor} (referência do visualizador)"""
+    alunos, projetos, arestas = linha_tempo["alunos"], linha_tempo["projetos"], linha_tempo["arestas"]
+    cores = [COR_EVENTO[3]] * linha_tempo["iniciais"] + [None] * (len(arestas) // 2 - linha_tempo["iniciais"])
+    for k, delta in zip(linha_tempo["iteracoes"], linha_tempo["deltas"]):
+        if iteracao is not None and k > iteracao:
+            break
+        for i in range(0, len(delta), 2):
+            cores[delta[i]] = linha_tempo["cores"][delta[i + 1]]
+    return {
+        (alunos[arestas[2 * i]], projetos[arestas[2 * i + 1]]): cor
+        for i, cor in enumerate(cores) if cor is not None
+    }
@@ -0,0 +1,203 @@
+from collections import deque
+import heapq
+import numpy as np
+from entidades.perfil import novos_contadores
+from entidades.ranking import PoliticaRanking
+
+
+class MotorVetorial:
+    """
+    Motor alternativo de emparelhamento (Gale–Shapley) sobre vetores NumPy.
+
+    Os códigos de alunos e projetos são convertidos em IDs inteiros densos:
+      - notas[aluno_id], vagas[projeto_id], requisitos[projeto_id]  -> np.int32
+      - preferências em CSR: pref_offsets (np.int64, tamanho A+1) e
+        pref_projetos (np.int32, vetor plano de IDs de projetos; -1 = projeto inexistente)
+      - ranks[aluno_id] -> np.int64 (PoliticaRanking; projetos com lista própria
+        têm um vetor em ranks_projeto[projeto_id])
+
+    Cada entrada dos heaps é um único inteiro, rank << 32 | (~aluno_id), então
+    toda decisão do lado do projeto é uma comparação de inteiros.
+
+    O motor não guarda objetos Aluno: só os códigos e os vetores. Ele pode ser
+    montado a partir dos objetos (construtor) ou direto das colunas do cache
+    (MotorVetorial.de_colunas, entidades/cache.py), sem criar nenhum Aluno.
+    emparelhar() devolve o mesmo formato do Grafo.emparelhar, {codigo_projeto: [Aluno, ...]},
+    quando recebe a lista de alunos; sem ela, os alunos aparecem pelo código.
+
+    `preferencias` ({cod_aluno: tupla}, ver entidades/validacao.py) substitui as
+    listas originais pelas preferências efetivas.
+    """
+
+    def __init__(self, alunos, projetos, ranking=None, preferencias=None):
+        alunos = alunos if isinstance(alunos, list) else list(alunos)  # só durante a montagem
+        codigos = [a.getCodigo() for a in alunos]
+        notas = np.fromiter((a.getNota() for a in alunos), dtype=np.int32, count=len(codigos))
+
+        # preferências em CSR
+        if preferencias is None:
+            listas = [a.getPreferenciasProjetos() for a in alunos]
+        else:
+            listas = [preferencias[cod] for cod in codigos]
+        tamanhos = np.fromiter(map(len, listas), dtype=np.int64, count=len(codigos))
+        pref_offsets = np.zeros(len(codigos) + 1, dtype=np.int64)
+        np.cumsum(tamanhos, out=pref_offsets[1:])
+
+        self._iniciar_projetos([p.getCodigo() for p in projetos],
+                               np.fromiter((p.getNumeroVagas() for p in projetos), dtype=np.int32, count=len(projetos)),
+                               np.fromiter((p.getRequisitoNotas() for p in projetos), dtype=np.int32, count=len(projetos)))
+
+        id_projeto = self.id_projeto
+        pref_projetos = np.fromiter(
+            (id_projeto.get(cod, -1) for prefs in listas for cod in prefs),
+            dtype=np.int32, count=int(pref_offsets[-1])
+        )
+        originais = (lambda i: alunos[i].getPreferenciasProjetos())
+        self._iniciar_alunos(codigos, notas, pref_offsets, pref_projetos, ranking, originais)
+
+    @classmethod
+    def de_colunas(cls, alunos, projetos, ranking=None):
+        """
+        Monta o motor direto das colunas (ex.: cache.carregar_colunas_alunos/_projetos),
+        sem objetos Aluno/Projeto; colunas em mmap são usadas sem cópia.
+
+        Args:
+            alunos: {"codigos", "notas", "pref_offsets", "pref_codigos"}
+            projetos: {"codigos", "vagas", "requisitos"}
+        """
+        motor = cls.__new__(cls)
+        motor._iniciar_projetos(projetos["codigos"].tolist(),
+                                np.asarray(projetos["vagas"], dtype=np.int32),
+                                np.asarray(projetos["requisitos"], dtype=np.int32))
+
+        # códigos de projeto -> IDs: um dicionário por código distinto, o resto vetorizado
+        pref_codigos = alunos["pref_codigos"]
+        distintos, inverso = np.unique(pref_codigos, return_inverse=True)
+        mapa = np.fromiter((motor.id_projeto.get(cod, -1) for cod in distintos.tolist()),
+                           dtype=np.int32, count=len(distintos))
+        pref_projetos = mapa[inverso] if len(pref_codigos) else np.zeros(0, dtype=np.int32)
+
+        offsets = alunos["pref_offsets"]
+        originais = (lambda i: pref_codigos[offsets[i]:offsets[i + 1]].tolist())
+        motor._iniciar_alunos(alunos["codigos"], np.asarray(alunos["notas"], dtype=np.int32),
+                              np.asarray(offsets, dtype=np.int64), pref_projetos, ranking, originais)
+        return motor
+
+    def _iniciar_projetos(self, codigos_projetos, vagas, requisitos):
+        self.codigos_projetos = codigos_projetos
+        # código -> ID denso (em caso de código repetido vale o primeiro, como no _busca_projeto)
+        self.id_projeto = {}
+        for i, cod in enumerate(codigos_projetos):
+            self.id_projeto.setdefault(cod, i)
+        self.vagas = vagas
+        self.requisitos = requisitos
+
+    def _iniciar_alunos(self, codigos, notas, pref_offsets, pref_projetos, ranking, originais):
+        self.codigos_alunos = codigos  # lista ou vetor de códigos (aluno_id -> código)
+        self.notas = notas
+        self.pref_offsets = pref_offsets
+        self.pref_projetos = pref_projetos
+
+        # ranks densos (maior = melhor) por aluno_id
+        politica = ranking if ranking is not None else PoliticaRanking()
+        self.ranks, por_projeto = politica.calcular_vetor(codigos, notas, originais)
+        self.ranks_projeto = {}
+        for projeto_cod, ranks in por_projeto.items():
+            pid = self.id_projeto.get(projeto_cod)
+            if pid is not None:
+                self.ranks_projeto[pid] = ranks
+
+        self.iteracao = 1
+        self.limite_atingido = False
+        self.contadores = novos_contadores()
+
+    def emparelhar(self, max_iteracoes=None, alunos=None):
+        """
+        Executa a fase 1 e devolve `matches`: {codigo_projeto: [alunos[id], ...]} com a
+        sequência `alunos` indexada por aluno_id (ex.: a lista passada ao construtor) ou,
+        sem ela, {codigo_projeto: [codigo_aluno, ...]}. Ordem de entrada em cada projeto.
+        """
+        alocados = self.emparelhar_ids(max_iteracoes)
+        if alunos is None:
+            codigos = self.codigos_alunos
+            alunos = codigos if isinstance(codigos, list) else [str(c) for c in codigos]
+        return {cod: [alunos[a] for a in alocados[i]] for i, cod in enumerate(self.codigos_projetos)}
+
+    def emparelhar_ids(self, max_iteracoes=None):
+        """
+        Executa a fase 1 (Gale–Shapley, alunos propõem) e devolve, por projeto_id,
+        a lista ordenada dos aluno_id alocados.
+        Segue as mesmas regras do GaleShapley: rejeita por requisito de nota e,
+        com o projeto cheio, troca o pior alocado (topo do heap mínimo) se o
+        proponente tiver rank maior.
+        """
+        # memoryview: leitura escalar rápida sem copiar os vetores
+        notas = memoryview(self.notas)
+        vagas = memoryview(self.vagas)
+        requisitos = memoryview(self.requisitos)
+        offsets = memoryview(self.pref_offsets)
+        prefs = memoryview(self.pref_projetos)
+        ranks = self.ranks.tolist()
+        ranks_projeto = {pid: r.tolist() for pid, r in self.ranks_projeto.items()}
+        MASCARA = 0xFFFFFFFF
+
+        n_alunos = len(self.notas)
+        proxima = offsets.tolist()[:n_alunos]  # posição da próxima proposta no vetor plano
+        alocados = [[] for _ in range(len(self.codigos_projetos))]
+        livres = deque(range(n_alunos))
+
+        iteracao = 1
+        self.limite_atingido = False
+        propostas = rejeicoes_requisito = rejeicoes_capacidade = despejos = inexistentes = 0
+
+        while livres:
+            aluno = livres.popleft()
+
+            # Se já propôs para todos os projetos, desiste
+            pos = proxima[aluno]
+            if pos >= offsets[aluno + 1]:
+                continue
+            proxima[aluno] = pos + 1
+
+            projeto = prefs[pos]
+
+            # projeto inexistente: volta para a fila e tenta a próxima preferência
+            if projeto < 0:
+                inexistentes += 1
+                livres.append(aluno)
+                continue
+
+            propostas += 1
+            if notas[aluno] < requisitos[projeto]:
+                rejeicoes_requisito += 1
+                livres.append(aluno)
+                continue
+
+            heap = alocados[projeto]
+            rank = ranks_projeto[projeto][aluno] if projeto in ranks_projeto else ranks[aluno]
+            entrada = (rank << 32) | (MASCARA - aluno)
+            if len(heap) < vagas[projeto]:
+                heapq.heappush(heap, entrada)
+            elif heap and entrada > heap[0]:
+                despejos += 1
+                livres.append(MASCARA - (heapq.heapreplace(heap, entrada) & MASCARA))
+            else:
+                rejeicoes_capacidade += 1
+                livres.append(aluno)
+
+            iteracao += 1
+
+            if max_iteracoes is not None and iteracao > max_iteracoes:
+                self.limite_atingido = True
+                break
+
+        self.iteracao = iteracao
+        self.contadores = {
+            "propostas": propostas,
+            "rejeicoes_requisito": rejeicoes_requisito,
+            "rejeicoes_capacidade": rejeicoes_capacidade,
+            "despejos": despejos,
+            "propostas_inexistentes": inexistentes,
+        }
+
+        return [sorted(MASCARA - (e & MASCARA) for e in heap) for heap in alocados]
@@ -0,0 +1,127 @@
+"""
+Fase 1 particionada por componentes conexos, em paralelo.
+
+Cada aluno só lista poucos projetos, então o grafo aluno–projeto costuma se
+dividir em muitos componentes independentes. Uma union-find sobre as arestas
+de preferência encontra os componentes, que são agrupados em fatias de
+tamanho parecido; cada fatia roda o MotorVetorial em um processo do pool.
+
+O Gale–Shapley com alunos propondo chega ao mesmo emparelhamento estável
+(o ótimo para os alunos) independente da ordem das propostas, e componentes
+diferentes não interagem, então juntar os resultados parciais dá exatamente
+o resultado do motor sequencial. Cada fatia mantém os alunos na ordem de
+entrada, o que preserva os desempates da PoliticaRanking.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import os
+
+from entidades.motor_vetorial import MotorVetorial
+from entidades.perfil import novos_contadores
+
+
+def _listas(alunos, preferencias):
+    if preferencias is None:
+        return [a.getPreferenciasProjetos() for a in alunos]
+    return [preferencias[a.getCodigo()] for a in alunos]
+
+
+def componentes(alunos, projetos, preferencias=None):
+    """
+    Componentes conexos do grafo de preferências (union-find com compressão de caminho).
+    Com `preferencias` (efetivas, ver entidades/validacao.py) usa só essas arestas.
+
+    Returns:
+        lista de (índices dos alunos, índices dos projetos), cada lista em ordem crescente
+    """
+    n_alunos = len(alunos)
+    id_projeto = {}
+    for i, projeto in enumerate(projetos):
+        id_projeto.setdefault(projeto.getCodigo(), n_alunos + i)
+
+    pai = list(range(n_alunos + len(projetos)))
+
+    def raiz(x):
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    for i, prefs in enumerate(_listas(alunos, preferencias)):
+        for projeto_cod in prefs:
+            j = id_projeto.get(projeto_cod)
+            if j is None:
+                continue
+            ri, rj = raiz(i), raiz(j)
+            if ri != rj:
+                pai[rj] = ri
+
+    grupos = {}
+    for x in range(len(pai)):
+        grupo = grupos.setdefault(raiz(x), ([], []))
+        if x < n_alunos:
+            grupo[0].append(x)
+        else:
+            grupo[1].append(x - n_alunos)
+    return list(grupos.values())
+
+
+def fatiar(comps, alunos, n_fatias, preferencias=None):
+    """Agrupa componentes em até n_fatias fatias com número de arestas parecido (maior primeiro)"""
+    listas = _listas(alunos, preferencias)
+    peso = [sum(len(listas[i]) for i in a) + len(p) for a, p in comps]
+    fatias = [([], []) for _ in range(max(1, n_fatias))]
+    cargas = [(0, k) for k in range(len(fatias))]  # heap (peso acumulado, fatia)
+    for c in sorted(range(len(comps)), key=lambda c: -peso[c]):
+        carga, k = heapq.heappop(cargas)
+        fatias[k][0].extend(comps[c][0])
+        fatias[k][1].extend(comps[c][1])
+        heapq.heappush(cargas, (carga + peso[c], k))
+    return [(sorted(a), sorted(p)) for a, p in fatias if a or p]
+
+
+def _emparelhar_fatia(alunos, projetos, ranking, preferencias=None):
+    """Roda o MotorVetorial em uma fatia; devolve {cod_projeto: [índice local]} e os contadores"""
+    motor = MotorVetorial(alunos, projetos, ranking=ranking, preferencias=preferencias)
+    alocados = motor.emparelhar_ids()
+    return (
+        {cod: alocados[i] for i, cod in enumerate(motor.codigos_projetos) if alocados[i]},
+        motor.iteracao - 1,
+        motor.contadores,
+    )
+
+
+def emparelhar_particionado(alunos, projetos, ranking=None, max_workers=None, preferencias=None):
+    """
+    Fase 1 por componentes. Devolve (matches, iteracao, contadores) no mesmo
+    formato do MotorVetorial: matches = {cod_projeto: [Aluno, ...]} (ordem de entrada).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    comps = componentes(alunos, projetos, preferencias)
+    # algumas fatias por processo equilibram componentes de tamanhos muito diferentes
+    fatias = fatiar(comps, alunos, max_workers * 4 if max_workers > 1 else 1, preferencias)
+
+    tarefas = []
+    for a, p in fatias:
+        alunos_fatia = [alunos[i] for i in a]
+        prefs_fatia = None
+        if preferencias is not None:
+            prefs_fatia = {aluno.getCodigo(): preferencias[aluno.getCodigo()] for aluno in alunos_fatia}
+        tarefas.append((alunos_fatia, [projetos[j] for j in p], prefs_fatia))
+    if max_workers > 1 and len(tarefas) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futuros = [executor.submit(_emparelhar_fatia, a, p, ranking, pr) for a, p, pr in tarefas]
+            resultados = [f.result() for f in futuros]
+    else:
+        resultados = [_emparelhar_fatia(a, p, ranking, pr) for a, p, pr in tarefas]
+
+    matches = {projeto.getCodigo(): [] for projeto in projetos}
+    iteracao = 1
+    contadores = novos_contadores()
+    for (indices, _), (parcial, iteracoes, cont) in zip(fatias, resultados):
+        for cod, locais in parcial.items():
+            matches[cod] = [alunos[indices[i]] for i in locais]
+        iteracao += iteracoes
+        for nome, n in cont.items():
+            contadores[nome] += n
+    return matches, iteracao, contadores
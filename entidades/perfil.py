@@ -0,0 +1,103 @@
+"""
+Perfil de execução: tempo por fase e contadores de trabalho do emparelhamento.
+
+O Grafo só cria um Perfil quando pedido (Grafo(perfil=True)); sem ele as fases
+usam um contexto nulo e os motores mantêm apenas contadores locais.
+
+Os tempos são exclusivos: uma fase aberta dentro de outra (ex.: a captura de
+uma visualização durante a fase 1) é descontada da fase de fora. O tempo de CPU
+é o do processo principal; a renderização dos PNGs nos processos do pool
+aparece só como espera (parede) em "renderizacao".
+"""
+from contextlib import contextmanager, nullcontext
+import json
+import time
+
+FASES = ("leitura", "grafo", "validacao", "fase1", "fase2", "estatisticas", "verificacao", "renderizacao")
+
+CONTADORES = (
+    "propostas",
+    "rejeicoes_requisito",
+    "rejeicoes_capacidade",
+    "despejos",
+    "propostas_inexistentes",
+    "pngs_gravados",
+)
+
+# usado pelo Grafo quando não há perfil (nullcontext pode ser reaproveitado)
+SEM_PERFIL = nullcontext()
+
+
+def novos_contadores():
+    """Contadores zerados, no formato usado pelos motores de emparelhamento"""
+    return dict.fromkeys(CONTADORES[:-1], 0)
+
+
+class Perfil:
+
+    def __init__(self):
+        self.fases = {fase: {"parede_s": 0.0, "cpu_s": 0.0, "chamadas": 0} for fase in FASES}
+        self.contadores = dict.fromkeys(CONTADORES, 0)
+        self._pilha = []  # [inicio_parede, inicio_cpu, filhos_parede, filhos_cpu]
+
+    # ---------------------------------------------------------
+    # MEDIÇÃO
+    # ---------------------------------------------------------
+    @contextmanager
+    def medir(self, fase):
+        quadro = [time.perf_counter(), time.process_time(), 0.0, 0.0]
+        self._pilha.append(quadro)
+        try:
+            yield self
+        finally:
+            self._pilha.pop()
+            parede = time.perf_counter() - quadro[0]
+            cpu = time.process_time() - quadro[1]
+
+            dados = self.fases.setdefault(fase, {"parede_s": 0.0, "cpu_s": 0.0, "chamadas": 0})
+            dados["parede_s"] += parede - quadro[2]
+            dados["cpu_s"] += cpu - quadro[3]
+            dados["chamadas"] += 1
+
+            if self._pilha:
+                self._pilha[-1][2] += parede
+                self._pilha[-1][3] += cpu
+
+    def contar(self, nome, n=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + n
+
+    def somar(self, contadores):
+        """Acumula um dicionário de contadores (ex.: os de um motor de emparelhamento)"""
+        for nome, n in contadores.items():
+            self.contar(nome, n)
+
+    # ---------------------------------------------------------
+    # SAÍDA
+    # ---------------------------------------------------------
+    def para_dict(self):
+        return {
+            "fases": {fase: dict(dados) for fase, dados in self.fases.items()},
+            "total_parede_s": sum(d["parede_s"] for d in self.fases.values()),
+            "total_cpu_s": sum(d["cpu_s"] for d in self.fases.values()),
+            "contadores": dict(self.contadores),
+        }
+
+    def para_json(self, **kwargs):
+        return json.dumps(self.para_dict(), ensure_ascii=False, **kwargs)
+
+    def formatar(self):
+        dados = self.para_dict()
+        total = dados["total_parede_s"]
+
+        linhas = ["\n" + "="*60, "PERFIL DA EXECUÇÃO", "="*60]
+        linhas.append(f"\n{'fase':<14}{'parede (s)':>12}{'cpu (s)':>12}{'%':>8}{'chamadas':>10}")
+        for fase, d in dados["fases"].items():
+            pct = d["parede_s"] / total * 100 if total else 0.0
+            linhas.append(f"{fase:<14}{d['parede_s']:>12.4f}{d['cpu_s']:>12.4f}{pct:>7.1f}%{d['chamadas']:>10}")
+        linhas.append(f"{'total':<14}{total:>12.4f}{dados['total_cpu_s']:>12.4f}")
+
+        linhas.append("\nCONTADORES:")
+        for nome, n in dados["contadores"].items():
+            linhas.append(f"  • {nome}: {n}")
+        linhas.append("="*60)
+        return "\n".join(linhas)
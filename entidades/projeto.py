@@ -1,15 +1,22 @@
+import sys
+
+
 class Projeto:
+    # sem __dict__ por instância: só os três campos abaixo
+    __slots__ = ("codigo", "numero_vagas", "requisito_notas")
+
+    tipo = 'projeto'  # compartilhado pela classe (flyweight), não copiado em cada objeto
+
     def __init__(self, codigo: str, numero_vagas: int, requisito_notas: int):
-        self.codigo = codigo
+        self.codigo = sys.intern(codigo)
         self.numero_vagas = numero_vagas
         self.requisito_notas = requisito_notas
-        self.tipo = 'projeto'
 
     def getCodigo(self) -> str:
         return self.codigo
 
     def setCodigo(self, codigo: str):
-        self.codigo = codigo
+        self.codigo = sys.intern(codigo)
 
     def getNumeroVagas(self) -> int:
         return self.numero_vagas
@@ -27,7 +34,8 @@ class Projeto:
         return self.tipo
 
     def setTipo(self, tipo: str):
-        self.tipo = tipo
+        if tipo != self.tipo:
+            raise ValueError(f"Tipo de Projeto é fixo ('{self.tipo}'), recebido '{tipo}'")
 
     def __str__(self):
-        return f"{self.getCodigo()} - {self.getNumeroVagas()} - {self.getRequisitoNotas()}"
\ No newline at end of file
+        return f"{self.getCodigo()} - {self.getNumeroVagas()} - {self.getRequisitoNotas()}"
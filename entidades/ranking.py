@@ -0,0 +1,302 @@
+"""
+Política de ranking do lado dos projetos.
+
+A comparação entre dois alunos em um projeto é: maior nota primeiro e, no empate,
+um critério de desempate configurável:
+
+    "ordem"      quem aparece antes na entrada (padrão, comportamento original)
+    "codigo"     menor código (ordem natural: A2 antes de A10)
+    "aleatorio"  sorteio com semente; cada aluno recebe um valor próprio
+                 (hash da semente com o código), então incluir ou remover
+                 alunos não muda a ordem relativa dos demais
+
+Opcionalmente um projeto pode ter a sua própria lista de ranking
+({cod_projeto: [cod_aluno, ...]}, melhor primeiro); ela desempata
+antes do critério geral, e quem não está na lista fica depois dos listados.
+
+PoliticaRanking.calcular() transforma tudo isso em inteiros densos
+(maior = melhor), de modo que o motor compara só um inteiro por decisão.
+Alunos acrescentados depois (PoliticaRanking.inserir) recebem um inteiro entre
+os vizinhos na ordem. Quando não há inteiro livre entre eles, a tabela é
+renumerada com intervalos de ESPACO (a ordem não muda) e quem guarda ranks
+(ex.: os heaps do GaleShapley) atualiza os valores.
+"""
+from bisect import bisect_left
+from hashlib import blake2b
+import re
+
+DESEMPATES = ("ordem", "codigo", "aleatorio")
+
+ESPACO = 1 << 32  # intervalo entre ranks vizinhos após uma renumeração
+
+_DIGITOS = re.compile(r"(\d+)")
+
+
+def _chave_codigo(cod):
+    """Ordem natural de códigos: A2 < A10"""
+    return tuple(int(parte) if parte.isdigit() else parte for parte in _DIGITOS.split(cod))
+
+
+def _sorteio(semente, cod):
+    return blake2b(f"{semente}:{cod}".encode(), digest_size=8).digest()
+
+
+class Ranks:
+    """
+    Ranks densos calculados por uma PoliticaRanking.
+
+    - globais: código do aluno -> rank (0 = pior)
+    - por_projeto: código do projeto -> {código do aluno -> rank}, só para
+      projetos com lista própria (e só para os alunos interessados nele)
+
+    Os ranks só precisam ser comparáveis: quem entra por PoliticaRanking.inserir
+    recebe um inteiro entre os ranks dos vizinhos (ou provoca uma renumeração).
+    """
+
+    def __init__(self, globais, por_projeto):
+        self.globais = globais
+        self.por_projeto = por_projeto
+        # índices ordenados para inserção, montados só na primeira inserção:
+        # tabela (None = globais) -> ([(chave, cod)] melhor primeiro, {cod: chave})
+        self.indices = None
+
+    def tabela(self, projeto_cod):
+        """Dicionário código do aluno -> rank usado pelo projeto"""
+        return self.por_projeto.get(projeto_cod, self.globais)
+
+    def chave(self, projeto_cod, cod_aluno):
+        return self.tabela(projeto_cod)[cod_aluno]
+
+
+class PoliticaRanking:
+
+    def __init__(self, desempate="ordem", semente=0, listas=None):
+        """
+        Args:
+            desempate: um de DESEMPATES
+            semente: usada pelo desempate "aleatorio"
+            listas: {cod_projeto: [cod_aluno, ...]} ranking próprio por projeto (opcional)
+        """
+        if desempate not in DESEMPATES:
+            raise ValueError(f"Desempate desconhecido: {desempate} (opções: {', '.join(DESEMPATES)})")
+        self.desempate = desempate
+        self.semente = semente
+        self.listas = listas or {}
+
+    def _criterio(self, ordem):
+        """Chave de desempate por código (menor = melhor)"""
+        if self.desempate == "ordem":
+            return ordem.__getitem__
+        if self.desempate == "codigo":
+            return _chave_codigo
+        semente = self.semente
+        return lambda cod: (_sorteio(semente, cod), ordem[cod])
+
+    @staticmethod
+    def _chave(criterio, cod, nota):
+        """Ordenação geral (menor = melhor)"""
+        return (-nota, criterio(cod))
+
+    @staticmethod
+    def _chave_lista(criterio, posicao, fim, cod, nota):
+        """Ordenação em um projeto com lista própria (menor = melhor)"""
+        return (-nota, posicao.get(cod, fim), criterio(cod))
+
+    def _posicoes(self, projeto_cod):
+        posicao = {}
+        for i, cod in enumerate(self.listas[projeto_cod]):
+            posicao.setdefault(cod, i)
+        return posicao
+
+    def calcular(self, alunos, ordem=None):
+        """
+        Args:
+            alunos: Alunos a ranquear (com código repetido vale o primeiro)
+            ordem: código -> posição na entrada (padrão: a posição em alunos)
+
+        Returns:
+            Ranks
+        """
+        unicos = {}
+        for aluno in alunos:
+            unicos.setdefault(aluno.getCodigo(), aluno)
+        if ordem is None:
+            ordem = {cod: i for i, cod in enumerate(unicos)}
+        criterio = self._criterio(ordem)
+
+        melhor_primeiro = sorted(unicos.values(), key=lambda a: self._chave(criterio, a.getCodigo(), a.getNota()))
+        n = len(melhor_primeiro)
+        globais = {a.getCodigo(): n - 1 - i for i, a in enumerate(melhor_primeiro)}
+
+        por_projeto = {}
+        if self.listas:
+            interessados = {projeto_cod: [] for projeto_cod in self.listas}
+            for aluno in unicos.values():
+                for projeto_cod in set(aluno.getPreferenciasProjetos()):
+                    if projeto_cod in interessados:
+                        interessados[projeto_cod].append(aluno)
+
+            for projeto_cod, lista in self.listas.items():
+                posicao, fim = self._posicoes(projeto_cod), len(lista)
+                candidatos = sorted(
+                    interessados[projeto_cod],
+                    key=lambda a: self._chave_lista(criterio, posicao, fim, a.getCodigo(), a.getNota())
+                )
+                n = len(candidatos)
+                por_projeto[projeto_cod] = {a.getCodigo(): n - 1 - i for i, a in enumerate(candidatos)}
+
+        return Ranks(globais, por_projeto)
+
+    def calcular_vetor(self, codigos, notas, preferencias_de=None):
+        """
+        Mesmo resultado de calcular(), por índice e sem objetos Aluno (ex.: colunas do cache).
+
+        Args:
+            codigos: códigos dos alunos, na ordem de entrada (com código repetido vale o primeiro)
+            notas: notas, alinhadas com codigos
+            preferencias_de: preferencias_de(i) = lista original do i-ésimo aluno
+                (só usada por projetos com lista própria)
+
+        Returns:
+            (ranks, por_projeto): np.int64 por índice; por_projeto = {cod_projeto: np.int64}
+            com -1 para quem não se interessa pelo projeto
+        """
+        import numpy as np
+
+        if self.desempate == "ordem" and not self.listas:
+            # caso padrão todo em NumPy: nota decrescente, depois a primeira ocorrência do código
+            _, primeiro, inverso = np.unique(np.asarray(codigos), return_index=True, return_inverse=True)
+            melhor_primeiro = np.lexsort((primeiro, -np.asarray(notas, dtype=np.int64)[primeiro]))
+            rank_unico = np.empty(len(primeiro), dtype=np.int64)
+            rank_unico[melhor_primeiro] = np.arange(len(primeiro) - 1, -1, -1)
+            return rank_unico[inverso.reshape(-1)], {}
+
+        if isinstance(codigos, np.ndarray):
+            codigos = codigos.tolist()
+        if isinstance(notas, np.ndarray):
+            notas = notas.tolist()
+        primeiro = {}
+        for i, cod in enumerate(codigos):
+            primeiro.setdefault(cod, i)
+        ordem = {cod: k for k, cod in enumerate(primeiro)}
+        criterio = self._criterio(ordem)
+
+        melhor_primeiro = sorted(primeiro.items(), key=lambda item: self._chave(criterio, item[0], notas[item[1]]))
+        n = len(melhor_primeiro)
+        globais = {cod: n - 1 - k for k, (cod, _) in enumerate(melhor_primeiro)}
+        ranks = np.fromiter((globais[cod] for cod in codigos), dtype=np.int64, count=len(codigos))
+
+        por_projeto = {}
+        if self.listas:
+            interessados = {projeto_cod: [] for projeto_cod in self.listas}
+            for cod, i in primeiro.items():
+                for projeto_cod in set(preferencias_de(i)):
+                    if projeto_cod in interessados:
+                        interessados[projeto_cod].append((cod, i))
+
+            for projeto_cod, lista in self.listas.items():
+                posicao, fim = self._posicoes(projeto_cod), len(lista)
+                candidatos = sorted(
+                    interessados[projeto_cod],
+                    key=lambda item: self._chave_lista(criterio, posicao, fim, item[0], notas[item[1]])
+                )
+                n = len(candidatos)
+                tabela = {cod: n - 1 - k for k, (cod, _) in enumerate(candidatos)}
+                por_projeto[projeto_cod] = np.fromiter((tabela.get(cod, -1) for cod in codigos),
+                                                       dtype=np.int64, count=len(codigos))
+
+        return ranks, por_projeto
+
+    # ---------------------------------------------------------
+    # INSERÇÃO INCREMENTAL
+    # ---------------------------------------------------------
+    def inserir(self, ranks, aluno, alunos, ordem):
+        """
+        Dá rank a um aluno novo (ou substitui o de um código já ranqueado) sem recalcular
+        os demais: busca binária no índice ordenado e um inteiro entre os ranks dos vizinhos.
+        A ordem resultante é a mesma de um calcular() com todos os alunos.
+
+        Args:
+            ranks: Ranks a atualizar (no lugar)
+            aluno: o Aluno novo (com ordem[cod] já definida)
+            alunos: Alunos atuais; só usados para montar o índice na primeira inserção
+            ordem: código -> posição na ordem de desempate
+
+        Returns:
+            set das tabelas renumeradas (None = globais, senão o código do projeto);
+            os ranks guardados dessas tabelas precisam ser relidos
+        """
+        criterio = self._criterio(ordem)
+        if ranks.indices is None:
+            ranks.indices = self._montar_indices(ranks, alunos, criterio)
+
+        renumeradas = set()
+        cod = aluno.getCodigo()
+        if _inserir(ranks.globais, ranks.indices[None], cod, self._chave(criterio, cod, aluno.getNota())):
+            renumeradas.add(None)
+        interesses = set(aluno.getPreferenciasProjetos())
+        for projeto_cod, tabela in ranks.por_projeto.items():
+            if projeto_cod not in interesses:
+                if cod in tabela:
+                    _remover(tabela, ranks.indices[projeto_cod], cod)  # substituto deixou de listar o projeto
+                continue
+            posicao = self._posicoes(projeto_cod)
+            chave = self._chave_lista(criterio, posicao, len(self.listas[projeto_cod]), cod, aluno.getNota())
+            if _inserir(tabela, ranks.indices[projeto_cod], cod, chave):
+                renumeradas.add(projeto_cod)
+        return renumeradas
+
+    def _montar_indices(self, ranks, alunos, criterio):
+        unicos = {}
+        for aluno in alunos:
+            unicos.setdefault(aluno.getCodigo(), aluno)
+
+        def indice(tabela, chave):
+            chaves = {cod: chave(unicos[cod]) for cod in tabela if cod in unicos}
+            return sorted((c, cod) for cod, c in chaves.items()), chaves
+
+        indices = {None: indice(ranks.globais, lambda a: self._chave(criterio, a.getCodigo(), a.getNota()))}
+        for projeto_cod, tabela in ranks.por_projeto.items():
+            posicao, fim = self._posicoes(projeto_cod), len(self.listas[projeto_cod])
+            indices[projeto_cod] = indice(tabela, lambda a: self._chave_lista(criterio, posicao, fim, a.getCodigo(), a.getNota()))
+        return indices
+
+
+def _remover(tabela, indice, cod):
+    ordenados, chaves = indice
+    antiga = chaves.pop(cod, None)
+    if antiga is not None:
+        del ordenados[bisect_left(ordenados, (antiga, cod))]
+    tabela.pop(cod, None)
+
+
+def _renumerar(tabela, ordenados):
+    """Ranks espaçados de ESPACO na ordem do índice (melhor primeiro)"""
+    n = len(ordenados)
+    for i, (_, cod) in enumerate(ordenados):
+        tabela[cod] = (n - 1 - i) * ESPACO
+
+
+def _inserir(tabela, indice, cod, chave):
+    """Insere cod na tabela e no índice; devolve True se a tabela foi renumerada"""
+    _remover(tabela, indice, cod)
+    ordenados = indice[0]
+
+    i = bisect_left(ordenados, (chave, cod))
+    melhor = tabela[ordenados[i - 1][1]] if i > 0 else None
+    pior = tabela[ordenados[i][1]] if i < len(ordenados) else None
+    ordenados.insert(i, (chave, cod))
+    indice[1][cod] = chave
+
+    if melhor is None and pior is None:
+        tabela[cod] = 0
+    elif melhor is None:
+        tabela[cod] = pior + ESPACO
+    elif pior is None:
+        tabela[cod] = melhor - ESPACO
+    elif melhor - pior > 1:
+        tabela[cod] = (melhor + pior) // 2
+    else:
+        _renumerar(tabela, ordenados)  # sem inteiro livre entre os vizinhos
+        return True
+    return False
@@ -0,0 +1,172 @@
+"""
+Rastro compacto do emparelhamento e reprodução posterior.
+
+Cada mudança de cor de aresta vira um registro de tamanho fixo
+(iteração, ID do aluno, ID do projeto, tipo de evento) em um buffer NumPy
+pré-alocado. O arquivo .npz salvo permite reconstruir o estado do grafo em
+qualquer iteração e gerar as imagens de visualizacoes/ depois da execução.
+"""
+import numpy as np
+from entidades.renderizador import EstadoGrafo, FilaVisualizacoes
+
+# a aresta volta a ser preta em três situações diferentes:
+#   DESPEJO     o projeto cheio trocou o aluno por um de rank maior (fase 1)
+#   REALOCACAO  a fase 2 moveu o aluno para outro projeto
+#   REMOCAO     o aluno saiu do projeto sem disputa de vaga (requisito ou vagas
+#               alterados, aluno removido, resultado anterior desfeito no rematch)
+PROPOSTA, REJEICAO, TEMPORARIO, DESPEJO, FINAL, REALOCACAO, REMOCAO = range(7)
+
+# status usado em Grafo._marcar_aresta -> tipo de evento
+EVENTO_STATUS = {
+    "proposta": PROPOSTA,
+    "rejeicao": REJEICAO,
+    "temporario": TEMPORARIO,
+    "despejo": DESPEJO,
+    "final": FINAL,
+    "realocacao": REALOCACAO,
+    "remocao": REMOCAO,
+}
+
+# tipo de evento -> cor da aresta depois dele
+COR_EVENTO = ("blue", "red", "green", "black", "orange", "black", "black")
+
+NOMES_EVENTOS = ("proposta", "rejeicao", "temporario", "despejo", "final", "realocacao", "remocao")
+
+DTYPE_EVENTO = np.dtype([
+    ("iteracao", "<u4"),
+    ("aluno", "<i4"),
+    ("projeto", "<i4"),
+    ("evento", "u1"),
+])
+
+
+class Rastro:
+
+    def __init__(self, alunos=(), projetos=(), arestas=(), capacidade=1 << 16):
+        """
+        Args:
+            alunos / projetos: códigos na ordem dos IDs
+            arestas: pares (cod_aluno, cod_projeto) do grafo inicial (todas pretas)
+            capacidade: tamanho inicial do buffer (dobra quando enche)
+        """
+        self.alunos = []
+        self.projetos = []
+        self.id_aluno = {}
+        self.id_projeto = {}
+        for cod in alunos:
+            self._id(cod, self.alunos, self.id_aluno)
+        for cod in projetos:
+            self._id(cod, self.projetos, self.id_projeto)
+
+        self._arestas = np.array(
+            [(self._id(a, self.alunos, self.id_aluno), self._id(p, self.projetos, self.id_projeto))
+             for a, p in arestas],
+            dtype=np.int32
+        ).reshape(-1, 2)
+        self._novas = []  # pares de IDs acrescentados por adicionar_arestas (juntados sob demanda)
+
+        self._buffer = np.empty(capacidade, dtype=DTYPE_EVENTO)
+        self.tamanho = 0
+
+    @staticmethod
+    def _id(cod, codigos, ids):
+        i = ids.get(cod)
+        if i is None:
+            i = ids[cod] = len(codigos)
+            codigos.append(cod)
+        return i
+
+    @property
+    def arestas(self):
+        """Pares (ID aluno, ID projeto) das arestas pretas sem evento, np.int32 (n, 2)"""
+        if self._novas:
+            self._arestas = np.concatenate([self._arestas, np.array(self._novas, dtype=np.int32)])
+            self._novas = []
+        return self._arestas
+
+    @arestas.setter
+    def arestas(self, valor):
+        self._arestas = valor
+        self._novas = []
+
+    # ---------------------------------------------------------
+    # GRAVAÇÃO
+    # ---------------------------------------------------------
+    def adicionar_arestas(self, pares):
+        """Arestas que surgem depois do início (ex.: aluno acrescentado): entram pretas, como as iniciais"""
+        for a, p in pares:
+            self._novas.append((self._id(a, self.alunos, self.id_aluno), self._id(p, self.projetos, self.id_projeto)))
+
+    def registrar(self, iteracao, cod_aluno, cod_projeto, evento):
+        if self.tamanho == len(self._buffer):
+            novo = np.empty(2 * len(self._buffer), dtype=DTYPE_EVENTO)
+            novo[:self.tamanho] = self._buffer
+            self._buffer = novo
+        self._buffer[self.tamanho] = (
+            iteracao,
+            self._id(cod_aluno, self.alunos, self.id_aluno),
+            self._id(cod_projeto, self.projetos, self.id_projeto),
+            evento
+        )
+        self.tamanho += 1
+
+    @property
+    def eventos(self):
+        return self._buffer[:self.tamanho]
+
+    def salvar(self, caminho):
+        np.savez_compressed(
+            caminho,
+            eventos=self.eventos,
+            alunos=np.array(self.alunos, dtype=str),
+            projetos=np.array(self.projetos, dtype=str),
+            arestas=self.arestas,
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        with np.load(caminho) as dados:
+            rastro = cls(dados["alunos"].tolist(), dados["projetos"].tolist(), capacidade=1)
+            rastro.arestas = dados["arestas"]
+            rastro._buffer = dados["eventos"]
+        rastro.tamanho = len(rastro._buffer)
+        return rastro
+
+    # ---------------------------------------------------------
+    # REPRODUÇÃO
+    # ---------------------------------------------------------
+    def iteracoes(self):
+        """Iterações presentes no rastro (ordenadas)"""
+        return np.unique(self.eventos["iteracao"]).tolist()
+
+    def estado_em(self, iteracao):
+        """
+        Reconstrói o EstadoGrafo ao fim da iteração pedida
+        (todos os eventos com iteracao <= pedida aplicados em ordem).
+        """
+        eventos = self.eventos
+        fim = len(eventos) if iteracao is None else int(np.searchsorted(eventos["iteracao"], iteracao, side="right"))
+
+        cores = {(int(a), int(p)): "black" for a, p in self.arestas}
+        for a, p, e in zip(eventos["aluno"][:fim].tolist(),
+                           eventos["projeto"][:fim].tolist(),
+                           eventos["evento"][:fim].tolist()):
+            cores[(a, p)] = COR_EVENTO[e]
+
+        return EstadoGrafo(
+            tuple(self.alunos),
+            tuple(self.projetos),
+            tuple((self.alunos[a], self.projetos[p], cor) for (a, p), cor in cores.items())
+        )
+
+    def gerar_visualizacoes(self, iteracoes=None, pasta="visualizacoes"):
+        """Gera os PNGs das iterações pedidas (padrão: todas) a partir do rastro"""
+        if iteracoes is None:
+            iteracoes = self.iteracoes()
+        fila = FilaVisualizacoes(pasta=pasta)
+        for iteracao in iteracoes:
+            fila.registrar(iteracao, self.estado_em(iteracao))
+        try:
+            return fila.aguardar()
+        finally:
+            fila.encerrar()
@@ -0,0 +1,69 @@
+class Registro:
+    """
+    Índices por código para alunos e projetos.
+    Evita as buscas lineares em listas durante a construção do grafo e o emparelhamento.
+    """
+
+    def __init__(self):
+        self.alunos = {}        # código do aluno -> Aluno
+        self.projetos = {}      # código do projeto -> Projeto
+        # código do projeto -> {id(aluno): Aluno} (ordem de entrada, sem repetição);
+        # o dicionário permite remover um aluno em O(1), mesmo em projetos populares
+        self.interessados = {}
+
+    def limpar(self):
+        self.alunos.clear()
+        self.projetos.clear()
+        self.interessados.clear()
+
+    def reconstruir(self, alunos, projetos):
+        """Refaz todos os índices a partir das listas de alunos e projetos"""
+        self.limpar()
+        for projeto in projetos:
+            self.adicionar_projeto(projeto)
+        for aluno in alunos:
+            self.adicionar_aluno(aluno)
+
+    # ---------------------------------------------------------
+    # INSERÇÃO / REMOÇÃO
+    # ---------------------------------------------------------
+    def adicionar_projeto(self, projeto):
+        # código repetido: vale o primeiro (como o antigo _busca_projeto e os motores)
+        self.projetos.setdefault(projeto.getCodigo(), projeto)
+
+    def adicionar_aluno(self, aluno):
+        self.alunos[aluno.getCodigo()] = aluno
+        vistos = set()
+        for projeto_cod in aluno.getPreferenciasProjetos():
+            if projeto_cod in vistos:
+                continue
+            vistos.add(projeto_cod)
+            self.interessados.setdefault(projeto_cod, {})[id(aluno)] = aluno
+
+    def remover_aluno(self, codigo):
+        """Remove o aluno de todos os índices e o devolve (None se não existir); O(preferências)"""
+        aluno = self.alunos.pop(codigo, None)
+        if aluno is None:
+            return None
+        for projeto_cod in set(aluno.getPreferenciasProjetos()):
+            interessados = self.interessados.get(projeto_cod)
+            if interessados is not None:
+                interessados.pop(id(aluno), None)
+        return aluno
+
+    # ---------------------------------------------------------
+    # CONSULTAS
+    # ---------------------------------------------------------
+    def busca_aluno(self, codigo):
+        return self.alunos.get(codigo)
+
+    def busca_projeto(self, codigo):
+        return self.projetos.get(codigo)
+
+    def existe_projeto(self, codigo) -> bool:
+        return codigo in self.projetos
+
+    def get_interessados(self, projeto_cod):
+        """Alunos que listaram o projeto nas preferências (iterável, na ordem de entrada)"""
+        interessados = self.interessados.get(projeto_cod)
+        return interessados.values() if interessados is not None else ()
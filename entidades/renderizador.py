@@ -0,0 +1,253 @@
+"""
+Renderização das visualizações fora do laço do emparelhamento.
+
+O Grafo captura um EstadoGrafo (tupla imutável com nós e cor de cada aresta)
+e a FilaVisualizacoes desenha e salva os PNGs em processos separados. Cada
+processo mantém um Desenhista, que reaproveita figura, layout e artistas.
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+# estado imutável do grafo em um instante: nós por tipo e (aluno, projeto, cor) por aresta
+EstadoGrafo = namedtuple("EstadoGrafo", ["alunos", "projetos", "arestas"])
+
+# grupos de cores salvos a cada iteração registrada
+GRUPOS_CORES = {
+    'propostas': (['blue'], 'Propostas (Azul)'),
+    'rejeicoes': (['red'], 'Rejeições (Vermelho)'),
+    'temporarios': (['green'], 'Alocações Temporárias (Verde)'),
+    'todas': (['blue', 'green', 'red'], 'Estado Completo')
+}
+
+MAPA_LABELS = {
+    'black': 'Preferência',
+    'blue': 'Proposta',
+    'green': 'Temporário',
+    'red': 'Rejeitado',
+    'orange': 'Final'
+}
+
+
+class Desenhista:
+    """
+    Desenha EstadoGrafo reaproveitando a figura entre quadros.
+
+    - o layout bipartido (alunos à esquerda, projetos à direita), os nós e os
+      rótulos só são refeitos quando o conjunto de nós muda
+    - todas as arestas ficam em uma única LineCollection; a cada quadro só os
+      segmentos visíveis e as cores são atualizados (e título/legenda)
+    """
+
+    def __init__(self, figura=None, tamanho=(16, 12), tamanho_no=600, largura=3, alpha=0.7,
+                 fonte_rotulos=7, fonte_titulo=14, labels=MAPA_LABELS, contar=True):
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self.fig = figura if figura is not None else Figure(figsize=tamanho)
+        self.ax = self.fig.add_subplot()
+        self.ax.axis('off')
+
+        self.tamanho_no = tamanho_no
+        self.alpha = alpha
+        self.fonte_rotulos = fonte_rotulos
+        self.fonte_titulo = fonte_titulo
+        self.labels = labels
+        self.contar = contar
+
+        self._linhas = LineCollection([], linewidths=largura, zorder=1)
+        self.ax.add_collection(self._linhas)
+
+        self._nos = None        # (alunos, projetos) do layout atual
+        self._pos = {}          # nó -> (x, y)
+        self._artistas_nos = []
+        self._legenda_nos = []  # scatter de alunos/projetos (entram na legenda)
+        self._pares = None      # (u, v) de cada aresta, na ordem do estado
+        self._segmentos = None  # np.array (E, 2, 2)
+        self._rgba = {}         # cor -> RGBA com alpha
+        self._ajustar = True    # tight_layout pendente
+
+    # ---------------------------------------------------------
+    # LAYOUT E ARTISTAS
+    # ---------------------------------------------------------
+    def _montar_nos(self, alunos, projetos, rotulos):
+        for artista in self._artistas_nos:
+            artista.remove()
+        self._artistas_nos = []
+        self._legenda_nos = []
+
+        pos = {}
+        y_spacing_alunos = 1.0 / (len(alunos) + 1) if alunos else 1
+        for i, aluno in enumerate(alunos):
+            pos[aluno] = (0, 1 - (i + 1) * y_spacing_alunos)
+        y_spacing_projetos = 1.0 / (len(projetos) + 1) if projetos else 1
+        for i, projeto in enumerate(projetos):
+            pos[projeto] = (2, 1 - (i + 1) * y_spacing_projetos)
+        self._pos = pos
+
+        ax = self.ax
+        for nos, cor, forma, label in ((alunos, 'lightblue', 'o', 'Alunos'),
+                                       (projetos, 'lightgreen', 's', 'Projetos')):
+            if nos:
+                pontos = ax.scatter(
+                    [pos[n][0] for n in nos], [pos[n][1] for n in nos],
+                    s=self.tamanho_no, c=cor, marker=forma, label=label, zorder=2
+                )
+                self._artistas_nos.append(pontos)
+                self._legenda_nos.append(pontos)
+        for no, (x, y) in pos.items():
+            self._artistas_nos.append(ax.text(
+                x, y, rotulos.get(no, no) if rotulos else no, fontsize=self.fonte_rotulos,
+                ha='center', va='center', zorder=3
+            ))
+
+        ax.update_datalim(list(pos.values()) or [(0, 0)])
+        ax.autoscale_view()
+        self._nos = (alunos, projetos)
+        self._pares = None
+        self._ajustar = True
+
+    def _montar_arestas(self, pares):
+        import numpy as np
+
+        pos = self._pos
+        self._segmentos = np.array([(pos[u], pos[v]) for u, v in pares], dtype=float).reshape(-1, 2, 2)
+        self._pares = pares
+
+    def _cor(self, cor):
+        rgba = self._rgba.get(cor)
+        if rgba is None:
+            from matplotlib.colors import to_rgba
+            rgba = self._rgba[cor] = to_rgba(cor, self.alpha)
+        return rgba
+
+    # ---------------------------------------------------------
+    # QUADRO
+    # ---------------------------------------------------------
+    def desenhar(self, estado, mostrar_cores=None, titulo="", rotulos=None):
+        """Atualiza a figura para o estado; mostrar_cores=None mostra todas as arestas"""
+        import numpy as np
+        from matplotlib.lines import Line2D
+
+        if self._nos != (estado.alunos, estado.projetos):
+            self._montar_nos(estado.alunos, estado.projetos, rotulos)
+
+        pares = [(u, v) for u, v, _ in estado.arestas]
+        if pares != self._pares:
+            self._montar_arestas(pares)
+
+        # só os segmentos das cores pedidas entram na coleção
+        visiveis = [i for i, (_, _, cor) in enumerate(estado.arestas)
+                    if mostrar_cores is None or cor in mostrar_cores]
+        cores = [estado.arestas[i][2] for i in visiveis]
+        self._linhas.set_segments(self._segmentos[np.array(visiveis, dtype=int)])
+        self._linhas.set_color([self._cor(cor) for cor in cores])
+
+        contador = {}
+        for cor in cores:
+            contador[cor] = contador.get(cor, 0) + 1
+
+        # legenda: nós + uma entrada por cor visível (ordem de primeira aparição)
+        handles = list(self._legenda_nos)
+        for cor, n in contador.items():
+            label = self.labels.get(cor, cor)
+            if self.contar:
+                label = f"{label} ({n})"
+            handles.append(Line2D([], [], color=cor, linewidth=self._linhas.get_linewidth()[0],
+                                  alpha=self.alpha, label=label))
+
+        if self.contar and mostrar_cores is not None:
+            info_cores = " | ".join([f"{self.labels.get(c, c)}: {contador.get(c, 0)}"
+                                     for c in mostrar_cores if c in contador])
+            titulo = f"{titulo}\n{info_cores}"
+        self.ax.set_title(titulo, fontsize=self.fonte_titulo, fontweight='bold')
+        self.ax.legend(handles=handles, loc='upper left', fontsize=10)
+
+    def salvar(self, arquivo):
+        # tight_layout custa um desenho completo: só quando o layout mudou
+        if self._ajustar:
+            self.fig.tight_layout()
+            self._ajustar = False
+        # compressão PNG rápida: a codificação zlib era metade do tempo de cada imagem
+        opcoes = {"pil_kwargs": {"compress_level": 1}} if str(arquivo).endswith(".png") else {}
+        self.fig.savefig(arquivo, dpi=150, **opcoes)
+        print(f"  -> Salva: {arquivo}")
+        return arquivo
+
+
+# um Desenhista por processo (reaproveitado entre as tarefas do pool)
+_desenhista = None
+
+
+def _desenhista_do_processo():
+    global _desenhista
+    if _desenhista is None:
+        _desenhista = Desenhista()
+    return _desenhista
+
+
+def desenhar_estado(estado, mostrar_cores, titulo, arquivo):
+    """Salva uma visualização do estado mostrando apenas as cores pedidas"""
+    desenhista = _desenhista_do_processo()
+    desenhista.desenhar(estado, mostrar_cores, titulo)
+    return desenhista.salvar(arquivo)
+
+
+def desenhar_grupos(estado, iteracao, pasta):
+    """Salva os PNGs de todos os GRUPOS_CORES de uma iteração (mesma figura e layout)"""
+    return [
+        desenhar_estado(estado, cores, f"{titulo} - Iteração {iteracao}",
+                        os.path.join(pasta, f"iter{iteracao:02d}_{nome}.png"))
+        for nome, (cores, titulo) in GRUPOS_CORES.items()
+    ]
+
+
+class FilaVisualizacoes:
+    """
+    Fila assíncrona de visualizações.
+
+    registrar() só guarda o estado; chamadas repetidas para a mesma iteração
+    substituem o estado anterior (a imagem final mostra o último estado, como antes).
+    Quando a iteração muda, o estado pendente vira uma tarefa (4 PNGs) no pool de processos.
+    aguardar() envia o que estiver pendente e espera todos os PNGs.
+    """
+
+    def __init__(self, pasta="visualizacoes", max_workers=None):
+        self.pasta = pasta
+        self.max_workers = max_workers
+        self._executor = None
+        self._pendente = None  # (iteracao, EstadoGrafo)
+        self._futuros = []
+
+    def registrar(self, iteracao, estado):
+        if self._pendente is not None and self._pendente[0] != iteracao:
+            self.descarregar()
+        self._pendente = (iteracao, estado)
+
+    def descarregar(self):
+        """Envia o estado pendente para o pool sem esperar a renderização"""
+        if self._pendente is None:
+            return
+        iteracao, estado = self._pendente
+        self._pendente = None
+
+        if self._executor is None:
+            os.makedirs(self.pasta, exist_ok=True)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        # uma tarefa por iteração: o trabalhador reaproveita figura e layout nos 4 PNGs
+        self._futuros.append(self._executor.submit(desenhar_grupos, estado, iteracao, self.pasta))
+
+    def aguardar(self):
+        """Espera todas as visualizações enviadas e devolve os arquivos salvos"""
+        self.descarregar()
+        futuros, self._futuros = self._futuros, []
+        return [arquivo for f in futuros for arquivo in f.result()]
+
+    def encerrar(self):
+        """aguardar() e fecha o pool de processos (um registrar() posterior abre outro)"""
+        arquivos = self.aguardar()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        return arquivos
@@ -0,0 +1,216 @@
+"""
+Serviço local de emparelhamento (HTTP em localhost).
+
+Lê a entrada e monta o grafo uma única vez; as requisições reaproveitam os
+dados, os índices e o motor que ficam em memória:
+
+    GET  /estado                 resumo da última execução publicada
+    GET  /estatisticas           Estatisticas da última execução (JSON)
+    GET  /alunos/<codigo>        projeto, escolha e nota do aluno
+    GET  /projetos/<codigo>      vagas, ocupação e alunos alocados no projeto
+    POST /emparelhar             reemparelha; corpo JSON opcional:
+                                   {"motor": "vetorial",
+                                    "fase2": "gulosa",
+                                    "ajustes": [...],      mesmo formato dos cenários
+                                    "publicar": false}     com ajustes, padrão = não publicar
+
+Leituras usam só o último Resultado publicado (objeto imutável trocado por
+referência), então são atendidas em paralelo sem trava, inclusive enquanto
+um novo emparelhamento roda. Emparelhamentos são serializados por uma trava.
+"""
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from urllib.parse import unquote, urlsplit
+
+from entidades.cenarios import aplicar_ajustes
+from entidades.estatisticas import calcular_estatisticas
+from entidades.grafo import Grafo, FASES2
+
+MOTORES = ("objetos", "vetorial", "particionado")
+
+
+def _json(dados):
+    return json.dumps(dados, ensure_ascii=False).encode("utf-8")
+
+
+class Resultado:
+    """Instantâneo somente leitura de uma execução (o que as requisições GET enxergam)"""
+
+    def __init__(self, numero, motor, ajustes, alunos, matches, est):
+        self.numero = numero
+        self.motor = motor
+        self.ajustes = ajustes
+        self.data = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.estatisticas = est
+
+        projeto_de = {}
+        for projeto_cod, alocados in matches.items():
+            for aluno in alocados:
+                projeto_de.setdefault(aluno.getCodigo(), projeto_cod)
+
+        self.alunos = {}
+        for aluno in alunos:
+            cod = aluno.getCodigo()
+            if cod in self.alunos:
+                continue
+            projeto_cod = projeto_de.get(cod)
+            prefs = aluno.getPreferenciasProjetos()
+            self.alunos[cod] = {
+                "aluno": cod,
+                "nota": aluno.getNota(),
+                "projeto": projeto_cod,
+                "escolha": prefs.index(projeto_cod) + 1 if projeto_cod in prefs else None,
+            }
+
+        self.resumo = {
+            "execucao": numero,
+            "data": self.data,
+            "motor": motor,
+            "ajustes": ajustes,
+            "total_alunos": est.total_alunos,
+            "alunos_alocados": est.alunos_alocados,
+            "total_vagas": est.total_vagas,
+            "vagas_ocupadas": est.vagas_ocupadas,
+            "projetos_vazios": len(est.projetos_vazios),
+        }
+        # a resposta mais pesada é serializada uma vez por execução, não por requisição
+        self.estatisticas_json = est.para_json().encode("utf-8")
+
+    def projeto(self, codigo):
+        projeto = self.estatisticas.projetos.get(codigo)
+        if projeto is None:
+            return None
+        return {**vars(projeto), "alunos": self.estatisticas.emparelhamento.get(codigo, [])}
+
+
+class ServicoEmparelhamento:
+
+    def __init__(self, caminho_alunos=None, caminho_projetos=None, motor="vetorial", ranking=None,
+                 fase2="gulosa", validar=True):
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de emparelhamento desconhecido: {motor}")
+        if fase2 not in FASES2:
+            raise ValueError(f"Fase 2 desconhecida: {fase2}")
+        self.motor = motor
+        self.fase2 = fase2
+        # silencioso em vez de redirect_stdout: as requisições rodam em threads
+        self.grafo = Grafo(visualizacoes=False, ranking=ranking, validar=validar, silencioso=True)
+        self.grafo.iniciar(caminho_alunos, caminho_projetos)
+        self.resultado = None          # último Resultado publicado
+        self._execucoes = 0
+        self._trava = threading.Lock()
+
+    def emparelhar(self, motor=None, ajustes=None, publicar=None, fase2=None):
+        """
+        Roda o emparelhamento e devolve o Resultado.
+
+        Sem ajustes usa o grafo residente; com ajustes monta um grafo com os
+        projetos ajustados (a entrada base não muda) e, por padrão, não publica.
+        """
+        motor = motor or self.motor
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de emparelhamento desconhecido: {motor}")
+        fase2 = fase2 or self.fase2
+        if fase2 not in FASES2:
+            raise ValueError(f"Fase 2 desconhecida: {fase2}")
+        ajustes = list(ajustes or [])
+        if publicar is None:
+            publicar = not ajustes
+
+        with self._trava:
+            grafo = self.grafo
+            if ajustes:
+                grafo = Grafo(visualizacoes=False, ranking=self.grafo.ranking,
+                              validar=self.grafo.validar, silencioso=True)
+                grafo.carregar(self.grafo.alunos, aplicar_ajustes(self.grafo.projetos, ajustes))
+            matches = grafo.emparelhar(motor=motor, fase2=fase2)
+            est = grafo.estatisticas or calcular_estatisticas(grafo.alunos, grafo.projetos, matches)
+            self._execucoes += 1
+            resultado = Resultado(self._execucoes, motor, ajustes, grafo.alunos, matches, est)
+            if publicar:
+                self.resultado = resultado
+        return resultado
+
+
+# ---------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------
+class _Manipulador(BaseHTTPRequestHandler):
+    server_version = "ProjTAG/1.0"
+
+    def _responder(self, status, corpo):
+        if not isinstance(corpo, bytes):
+            corpo = _json(corpo)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _erro(self, status, mensagem):
+        self._responder(status, {"erro": mensagem})
+
+    def do_GET(self):
+        partes = [unquote(p) for p in urlsplit(self.path).path.split("/") if p]
+        resultado = self.server.servico.resultado
+        if resultado is None:
+            return self._erro(503, "Nenhum emparelhamento publicado ainda")
+
+        if partes == ["estado"]:
+            return self._responder(200, resultado.resumo)
+        if partes == ["estatisticas"]:
+            return self._responder(200, resultado.estatisticas_json)
+        if len(partes) == 2 and partes[0] == "alunos":
+            aluno = resultado.alunos.get(partes[1])
+            if aluno is None:
+                return self._erro(404, f"Aluno não encontrado: {partes[1]}")
+            return self._responder(200, {"execucao": resultado.numero, **aluno})
+        if len(partes) == 2 and partes[0] == "projetos":
+            projeto = resultado.projeto(partes[1])
+            if projeto is None:
+                return self._erro(404, f"Projeto não encontrado: {partes[1]}")
+            return self._responder(200, {"execucao": resultado.numero, **projeto})
+        return self._erro(404, f"Rota desconhecida: {self.path}")
+
+    def do_POST(self):
+        if urlsplit(self.path).path.rstrip("/") != "/emparelhar":
+            return self._erro(404, f"Rota desconhecida: {self.path}")
+        try:
+            tamanho = int(self.headers.get("Content-Length") or 0)
+            pedido = json.loads(self.rfile.read(tamanho) or b"{}")
+            if not isinstance(pedido, dict):
+                raise ValueError("o corpo deve ser um objeto JSON")
+            resultado = self.server.servico.emparelhar(
+                motor=pedido.get("motor"), ajustes=pedido.get("ajustes"), publicar=pedido.get("publicar"),
+                fase2=pedido.get("fase2"))
+        except (ValueError, TypeError, AttributeError) as e:  # JSON inválido, motor ou ajuste malformado
+            return self._erro(400, str(e))
+        self._responder(200, {**resultado.resumo, "publicado": resultado is self.server.servico.resultado})
+
+    def log_message(self, formato, *args):
+        if self.server.verboso:
+            super().log_message(formato, *args)
+
+
+def criar_servidor(servico, host="127.0.0.1", porta=8765, verboso=False):
+    """ThreadingHTTPServer pronto para serve_forever() (uma thread por conexão)"""
+    servidor = ThreadingHTTPServer((host, porta), _Manipulador)
+    servidor.daemon_threads = True
+    servidor.servico = servico
+    servidor.verboso = verboso
+    return servidor
+
+
+def servir(servico, host="127.0.0.1", porta=8765, verboso=False):
+    """Publica o primeiro emparelhamento e atende até Ctrl+C"""
+    servico.emparelhar()
+    servidor = criar_servidor(servico, host, porta, verboso)
+    print(f"Servidor de emparelhamento em http://{host}:{servidor.server_address[1]} (Ctrl+C para sair)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
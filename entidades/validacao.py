@@ -0,0 +1,163 @@
+"""
+Validação e normalização das preferências, entre a leitura e a montagem do grafo.
+
+Em uma passada pelos alunos, cada lista de preferências vira uma lista efetiva
+(tupla, na ordem original) sem:
+
+    "projeto_inexistente"  código que não está nos projetos
+    "duplicada"            projeto repetido (vale a primeira ocorrência)
+    "requisito"            projeto cujo requisito é maior que a nota do aluno
+
+Nenhuma dessas propostas pode resultar em alocação na fase 1, então tirá-las
+antes não muda o emparelhamento estável; só evita voltas na fila e arestas
+mortas. As listas originais dos Alunos não são alteradas: estatísticas (posição
+da escolha atendida, interessados) continuam usando o que o aluno escreveu.
+
+O relatório (RelatorioValidacao) é serializável em JSON.
+"""
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+import json
+
+MOTIVOS = ("projeto_inexistente", "duplicada", "requisito")
+
+
+@dataclass
+class PreferenciaPodada:
+    aluno: str
+    projeto: str
+    posicao: int   # posição na lista original (1 = primeira escolha)
+    motivo: str    # um de MOTIVOS
+
+
+@dataclass
+class RelatorioValidacao:
+    total_alunos: int = 0          # alunos validados (códigos repetidos contam uma vez)
+    total_preferencias: int = 0
+    preferencias_efetivas: int = 0
+    alunos_duplicados: list = field(default_factory=list)      # códigos repetidos na entrada
+    projetos_duplicados: list = field(default_factory=list)
+    # por aluno, para que descartar() custe só o que o aluno tem
+    _podadas: dict = field(default_factory=dict, repr=False)            # cod_aluno -> [PreferenciaPodada]
+    _sem_preferencias: dict = field(default_factory=dict, repr=False)   # cod_aluno -> None (conjunto ordenado)
+
+    @property
+    def podadas(self):
+        """[PreferenciaPodada] de todos os alunos"""
+        return [p for podadas in self._podadas.values() for p in podadas]
+
+    @property
+    def alunos_sem_preferencias(self):
+        """Códigos dos alunos sem nenhuma preferência efetiva"""
+        return list(self._sem_preferencias)
+
+    def registrar(self, aluno, efetivas, podadas):
+        """Soma o resultado de preferencias_efetivas() de um aluno ao relatório"""
+        cod = aluno.getCodigo()
+        self.total_alunos += 1
+        self.total_preferencias += len(aluno.getPreferenciasProjetos())
+        self.preferencias_efetivas += len(efetivas)
+        if podadas:
+            self._podadas.setdefault(cod, []).extend(podadas)
+        if not efetivas:
+            self._sem_preferencias[cod] = None
+
+    def descartar(self, aluno, efetivas):
+        """Desfaz registrar() (aluno removido ou revalidado)"""
+        cod = aluno.getCodigo()
+        self.total_alunos -= 1
+        self.total_preferencias -= len(aluno.getPreferenciasProjetos())
+        self.preferencias_efetivas -= len(efetivas)
+        self._podadas.pop(cod, None)
+        self._sem_preferencias.pop(cod, None)
+
+    def por_motivo(self):
+        contagem = Counter(p.motivo for podadas in self._podadas.values() for p in podadas)
+        return {motivo: contagem[motivo] for motivo in MOTIVOS}
+
+    def resumo(self):
+        partes = ", ".join(f"{n} {motivo}" for motivo, n in self.por_motivo().items() if n)
+        podadas = sum(map(len, self._podadas.values()))
+        return (f"{podadas} de {self.total_preferencias} preferências podadas ({partes}); "
+                f"{len(self._sem_preferencias)} alunos sem preferência efetiva")
+
+    def para_dict(self):
+        return {
+            "total_alunos": self.total_alunos,
+            "total_preferencias": self.total_preferencias,
+            "preferencias_efetivas": self.preferencias_efetivas,
+            "podadas": [asdict(p) for p in self.podadas],
+            "alunos_duplicados": self.alunos_duplicados,
+            "projetos_duplicados": self.projetos_duplicados,
+            "alunos_sem_preferencias": self.alunos_sem_preferencias,
+            "por_motivo": self.por_motivo(),
+        }
+
+    def para_json(self, **kwargs):
+        return json.dumps(self.para_dict(), ensure_ascii=False, **kwargs)
+
+
+def preferencias_efetivas(aluno, projetos):
+    """
+    Args:
+        aluno: Aluno
+        projetos: dict código -> Projeto
+
+    Returns:
+        (tupla de códigos efetivos, [PreferenciaPodada])
+    """
+    cod = aluno.getCodigo()
+    nota = aluno.getNota()
+    efetivas = []
+    vistos = set()
+    podadas = []
+    for posicao, projeto_cod in enumerate(aluno.getPreferenciasProjetos(), start=1):
+        projeto = projetos.get(projeto_cod)
+        if projeto is None:
+            motivo = "projeto_inexistente"
+        elif projeto_cod in vistos:
+            motivo = "duplicada"
+        elif nota < projeto.getRequisitoNotas():
+            motivo = "requisito"
+            vistos.add(projeto_cod)
+        else:
+            vistos.add(projeto_cod)
+            efetivas.append(projeto_cod)
+            continue
+        podadas.append(PreferenciaPodada(cod, projeto_cod, posicao, motivo))
+    return tuple(efetivas), podadas
+
+
+def validar(alunos, projetos):
+    """
+    Args:
+        alunos: lista de Aluno
+        projetos: lista de Projeto ou dict código -> Projeto (ex.: Registro.projetos)
+
+    Returns:
+        (preferencias, relatorio): preferencias = {cod_aluno: tupla efetiva}
+        (com código de aluno repetido vale o primeiro)
+    """
+    relatorio = RelatorioValidacao()
+
+    if not isinstance(projetos, dict):
+        por_codigo = {}
+        for projeto in projetos:
+            cod = projeto.getCodigo()
+            if cod in por_codigo and cod not in relatorio.projetos_duplicados:
+                relatorio.projetos_duplicados.append(cod)
+            por_codigo.setdefault(cod, projeto)  # como no Registro: vale o primeiro
+        projetos = por_codigo
+
+    preferencias = {}
+    for aluno in alunos:
+        cod = aluno.getCodigo()
+        if cod in preferencias:
+            if cod not in relatorio.alunos_duplicados:
+                relatorio.alunos_duplicados.append(cod)
+            continue
+        efetivas, podadas = preferencias_efetivas(aluno, projetos)
+        preferencias[cod] = efetivas
+        relatorio.registrar(aluno, efetivas, podadas)
+
+    return preferencias, relatorio
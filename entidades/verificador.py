@@ -0,0 +1,193 @@
+"""
+Verificação de um resultado de emparelhamento ({cod_projeto: [Aluno]}) contra a entrada.
+
+Aponta, de forma estruturada (RelatorioVerificacao, serializável em JSON):
+
+  violações
+    "projeto_inexistente"    chave de matches que não é um projeto
+    "aluno_inexistente"      aluno alocado que não está na entrada
+    "alocacao_duplicada"     aluno em mais de uma vaga (mesmo projeto ou não)
+    "capacidade"             projeto com mais alocados que vagas
+    "requisito"              alocado com nota abaixo do requisito (fase 2 relaxada)
+    "fora_das_preferencias"  alocado em projeto que não listou (fase 2 forçada)
+
+  pares bloqueantes
+    (aluno, projeto) em que o aluno listou o projeto antes do seu (ou está livre),
+    atende o requisito e o projeto tem vaga ou prefere o aluno ao pior alocado.
+
+  cobertura
+    projetos com vaga e nenhum alocado (projetos_vazios). Não é violação: um
+    resultado estável da fase 1 pode deixar projetos vazios.
+
+O custo é O(E) sobre as preferências, com índices de posição (projeto -> posição
+na lista do aluno) e de rank (o mesmo Ranks da PoliticaRanking usado pelos
+motores): cada aluno olha só as preferências antes do projeto em que está, e o
+pior alocado de cada projeto é calculado uma vez.
+"""
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+import json
+
+from entidades.ranking import PoliticaRanking
+
+TIPOS = (
+    "projeto_inexistente",
+    "aluno_inexistente",
+    "alocacao_duplicada",
+    "capacidade",
+    "requisito",
+    "fora_das_preferencias",
+)
+
+PIOR = float("-inf")  # rank de quem não está na tabela do projeto
+
+
+@dataclass
+class Violacao:
+    tipo: str      # um de TIPOS
+    projeto: str
+    aluno: str = None
+    detalhe: str = ""
+
+
+@dataclass
+class ParBloqueante:
+    aluno: str
+    projeto: str
+    posicao: int          # posição do projeto na lista do aluno (1 = primeira escolha)
+    posicao_atual: int    # posição do projeto atual (None = livre ou fora das preferências)
+    motivo: str           # "vaga_livre" ou "preferido" (projeto cheio, mas o aluno supera o pior alocado)
+
+
+@dataclass
+class RelatorioVerificacao:
+    alunos: int = 0
+    alocados: int = 0
+    violacoes: list = field(default_factory=list)   # [Violacao]
+    bloqueantes: list = field(default_factory=list)  # [ParBloqueante]
+    projetos_vazios: list = field(default_factory=list)  # códigos dos projetos com vaga e sem alocados
+
+    @property
+    def valido(self):
+        return not self.violacoes
+
+    @property
+    def estavel(self):
+        return not self.bloqueantes
+
+    def por_tipo(self):
+        contagem = Counter(v.tipo for v in self.violacoes)
+        return {tipo: contagem[tipo] for tipo in TIPOS}
+
+    def resumo(self):
+        partes = ", ".join(f"{n} {tipo}" for tipo, n in self.por_tipo().items() if n)
+        return (f"{len(self.violacoes)} violações" + (f" ({partes})" if partes else "") +
+                f"; {len(self.bloqueantes)} pares bloqueantes; {len(self.projetos_vazios)} projetos vazios")
+
+    def para_dict(self):
+        return {**asdict(self), "valido": self.valido, "estavel": self.estavel, "por_tipo": self.por_tipo()}
+
+    def para_json(self, **kwargs):
+        return json.dumps(self.para_dict(), ensure_ascii=False, **kwargs)
+
+
+def verificar(alunos, projetos, matches, ranking=None, ranks=None):
+    """
+    Args:
+        alunos: lista de Aluno (com código repetido vale o primeiro, como nos motores)
+        projetos: lista de Projeto ou dict código -> Projeto (ex.: Registro.projetos)
+        matches: {cod_projeto: [Aluno]}
+        ranking: PoliticaRanking usada no emparelhamento (padrão: PoliticaRanking())
+        ranks: Ranks já calculados (ex.: GaleShapley.ranks); dispensa `ranking`
+
+    Returns:
+        RelatorioVerificacao
+    """
+    if not isinstance(projetos, dict):
+        por_codigo_projeto = {}
+        for projeto in projetos:
+            por_codigo_projeto.setdefault(projeto.getCodigo(), projeto)  # como no Registro: vale o primeiro
+        projetos = por_codigo_projeto
+
+    por_codigo = {}
+    for aluno in alunos:
+        por_codigo.setdefault(aluno.getCodigo(), aluno)
+    if ranks is None:
+        ranks = (ranking if ranking is not None else PoliticaRanking()).calcular(alunos)
+
+    relatorio = RelatorioVerificacao(alunos=len(por_codigo))
+    violacoes = relatorio.violacoes
+
+    # ---------------------------------------------------------
+    # RESTRIÇÕES (uma passada pelas alocações)
+    # ---------------------------------------------------------
+    projeto_de = {}  # cod_aluno -> primeiro projeto em que aparece
+    pior = {}        # cod_projeto -> menor rank entre os alocados
+    for projeto_cod, alocados in matches.items():
+        projeto = projetos.get(projeto_cod)
+        if projeto is None:
+            violacoes.append(Violacao("projeto_inexistente", projeto_cod, detalhe=f"{len(alocados)} alocados"))
+            continue
+
+        vagas = projeto.getNumeroVagas()
+        if len(alocados) > vagas:
+            violacoes.append(Violacao("capacidade", projeto_cod, detalhe=f"{len(alocados)} alocados, {vagas} vagas"))
+        elif not alocados and vagas > 0:
+            relatorio.projetos_vazios.append(projeto_cod)
+
+        requisito = projeto.getRequisitoNotas()
+        tabela = ranks.tabela(projeto_cod)
+        menor = None
+        for aluno in alocados:
+            cod = aluno.getCodigo()
+            relatorio.alocados += 1
+            if cod not in por_codigo:
+                violacoes.append(Violacao("aluno_inexistente", projeto_cod, cod))
+            if cod in projeto_de:
+                violacoes.append(Violacao("alocacao_duplicada", projeto_cod, cod, f"também em {projeto_de[cod]}"))
+            else:
+                projeto_de[cod] = projeto_cod
+            if aluno.getNota() < requisito:
+                violacoes.append(Violacao("requisito", projeto_cod, cod, f"nota {aluno.getNota()} < {requisito}"))
+            if projeto_cod not in aluno.getPreferenciasProjetos():
+                violacoes.append(Violacao("fora_das_preferencias", projeto_cod, cod))
+
+            rank = tabela.get(cod, PIOR)  # fora da lista própria do projeto: pior que todos
+            if menor is None or rank < menor:
+                menor = rank
+        pior[projeto_cod] = menor
+
+    for projeto_cod, projeto in projetos.items():
+        if projeto_cod not in matches and projeto.getNumeroVagas() > 0:
+            relatorio.projetos_vazios.append(projeto_cod)
+
+    # ---------------------------------------------------------
+    # PARES BLOQUEANTES (cada aluno só até o projeto atual)
+    # ---------------------------------------------------------
+    for cod, aluno in por_codigo.items():
+        atual = projeto_de.get(cod)
+        prefs = aluno.getPreferenciasProjetos()
+        posicao_atual = prefs.index(atual) + 1 if atual in prefs else None
+        nota = aluno.getNota()
+        vistos = set()
+        for posicao, projeto_cod in enumerate(prefs, start=1):
+            if projeto_cod == atual:
+                break
+            if projeto_cod in vistos:
+                continue  # preferência repetida: vale a primeira ocorrência
+            vistos.add(projeto_cod)
+
+            projeto = projetos.get(projeto_cod)
+            if projeto is None or nota < projeto.getRequisitoNotas() or projeto.getNumeroVagas() == 0:
+                continue
+
+            ocupados = len(matches.get(projeto_cod, ()))
+            if ocupados < projeto.getNumeroVagas():
+                motivo = "vaga_livre"
+            elif ranks.tabela(projeto_cod).get(cod, PIOR) > pior[projeto_cod]:
+                motivo = "preferido"
+            else:
+                continue
+            relatorio.bloqueantes.append(ParBloqueante(cod, projeto_cod, posicao, posicao_atual, motivo))
+
+    return relatorio
@@ -1,18 +1,180 @@
+import argparse
+import json
 from entidades.grafo import Grafo
 
+def executar_cenarios(args):
+    from entidades.cenarios import executar_cenarios, formatar_tabela
+
+    with open(args.cenarios, "r", encoding="utf-8") as arq:
+        cenarios = json.load(arq)
+
+    grafo = Grafo(visualizacoes=False)
+    grafo.iniciar()
+
+    resultados = executar_cenarios(grafo.alunos, grafo.projetos, cenarios, max_workers=args.workers)
+    print(formatar_tabela(resultados))
+
+def reproduzir_rastro(args):
+    from entidades.rastro import Rastro
+
+    rastro = Rastro.carregar(args.reproduzir)
+    if args.linha_tempo:
+        exportar_linha_tempo(rastro, args.linha_tempo)
+        return
+    rastro.gerar_visualizacoes(args.iteracoes)
+
+def exportar_linha_tempo(rastro, caminho):
+    from entidades.linha_tempo import exportar_html, exportar_linha_tempo
+
+    if caminho.endswith(".html"):
+        exportar_html(rastro, caminho)
+    else:
+        exportar_linha_tempo(rastro, caminho)
+    print(f"-> Linha do tempo salva: {caminho}")
+
+def consultar_banco(args):
+    from entidades.banco import BancoExecucoes
+
+    with BancoExecucoes(args.banco) as banco:
+        if args.historico_aluno:
+            print(f"Histórico do aluno {args.historico_aluno}:")
+            for r in banco.historico_aluno(args.historico_aluno):
+                destino = f"{r['projeto']} ({r['escolha'] or '-'}ª escolha)" if r["projeto"] else "não alocado"
+                print(f"  execução {r['execucao_id']} [{r['data']}] nota {r['nota']}: {destino}")
+        if args.ocupacao_projeto:
+            print(f"Ocupação do projeto {args.ocupacao_projeto}:")
+            for r in banco.ocupacao_projeto(args.ocupacao_projeto):
+                taxa = f"{r['taxa']*100:.1f}%" if r["taxa"] is not None else "-"
+                print(f"  execução {r['execucao_id']} [{r['data']}] {r['ocupadas']}/{r['vagas']} vagas ({taxa})")
+
+def politica_ranking(args):
+    from entidades.ranking import PoliticaRanking
+
+    listas = None
+    if args.listas_ranking:
+        with open(args.listas_ranking, "r", encoding="utf-8") as arq:
+            listas = json.load(arq)
+    return PoliticaRanking(args.desempate, semente=args.semente, listas=listas)
+
 def main():
-    grafo = Grafo()
+    parser = argparse.ArgumentParser(description="Emparelhamento estável entre alunos e projetos")
+    parser.add_argument("--cenarios", metavar="ARQUIVO",
+                        help="JSON com uma lista de cenários what-if para comparar em paralelo")
+    parser.add_argument("--motor", default=None, choices=["objetos", "vetorial", "particionado"],
+                        help="motor da fase 1 (padrão: objetos; vetorial com --servidor; "
+                             "particionado: componentes conexos em paralelo)")
+    parser.add_argument("--fase2", default="gulosa", choices=["gulosa", "hopcroft_karp"],
+                        help="fase 2 (hopcroft_karp: máximo de projetos cobertos e alunos alocados, sem relaxar requisito)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="número de processos para --cenarios e --motor particionado (padrão: núcleos da máquina)")
+    parser.add_argument("--rastro", metavar="ARQUIVO",
+                        help="grava o rastro de eventos do emparelhamento em um .npz")
+    parser.add_argument("--reproduzir", metavar="ARQUIVO",
+                        help="gera as visualizações a partir de um rastro .npz salvo, sem reemparelhar")
+    parser.add_argument("--iteracoes", type=int, nargs="+", default=None,
+                        help="iterações a gerar com --reproduzir (padrão: todas)")
+    parser.add_argument("--headless", action="store_true",
+                        help="só emparelhamento e estatísticas: sem imagens e sem importar networkx/matplotlib")
+    parser.add_argument("--profile", metavar="ARQUIVO.json", nargs="?", const="-",
+                        help="mede tempo por fase e contadores; imprime a tabela ou, com arquivo, grava JSON")
+    parser.add_argument("--desempate", default="ordem", choices=["ordem", "codigo", "aleatorio"],
+                        help="desempate entre notas iguais do lado dos projetos (padrão: ordem de entrada)")
+    parser.add_argument("--semente", type=int, default=0,
+                        help="semente do desempate aleatório")
+    parser.add_argument("--listas-ranking", metavar="ARQUIVO",
+                        help='JSON {"P1": ["A3", "A1", ...]} com o ranking próprio de alguns projetos')
+    parser.add_argument("--linha-tempo", metavar="ARQUIVO",
+                        help="exporta a linha do tempo (.json, .json.gz ou visualizador .html) no lugar dos PNGs")
+    parser.add_argument("--estatisticas", metavar="ARQUIVO",
+                        help="salva as estatísticas do emparelhamento em JSON")
+    parser.add_argument("--validacao", metavar="ARQUIVO",
+                        help="salva em JSON o relatório da validação das preferências (podadas e motivos)")
+    parser.add_argument("--sem-validacao", action="store_true",
+                        help="não poda preferências inexistentes, repetidas ou com requisito acima da nota")
+    parser.add_argument("--verificar", metavar="ARQUIVO.json", nargs="?", const="-",
+                        help="verifica restrições e pares bloqueantes do resultado; imprime o resumo ou, com arquivo, grava JSON")
+    parser.add_argument("--banco", metavar="ARQUIVO.db",
+                        help="registra a execução (entradas, alocações e métricas) em um banco SQLite")
+    parser.add_argument("--historico-aluno", metavar="CODIGO",
+                        help="com --banco: mostra onde o aluno ficou em cada execução registrada, sem emparelhar")
+    parser.add_argument("--ocupacao-projeto", metavar="CODIGO",
+                        help="com --banco: mostra a ocupação do projeto em cada execução registrada, sem emparelhar")
+    parser.add_argument("--servidor", action="store_true",
+                        help="serviço HTTP local que mantém a entrada em memória (veja entidades/servidor.py)")
+    parser.add_argument("--porta", type=int, default=8765,
+                        help="porta do --servidor (só em 127.0.0.1)")
+    args = parser.parse_args()
+
+    if (args.historico_aluno or args.ocupacao_projeto) and not args.banco:
+        parser.error("--historico-aluno e --ocupacao-projeto exigem --banco")
+    if (args.rastro or args.linha_tempo) and not args.reproduzir and args.motor not in (None, "objetos"):
+        parser.error("--rastro e --linha-tempo registram a fase 1 só com --motor objetos")
+
+    if args.cenarios:
+        executar_cenarios(args)
+        return
+    if args.reproduzir:
+        reproduzir_rastro(args)
+        return
+    if args.historico_aluno or args.ocupacao_projeto:
+        consultar_banco(args)
+        return
+    if args.servidor:
+        from entidades.servidor import ServicoEmparelhamento, servir
+
+        servico = ServicoEmparelhamento(motor=args.motor or "vetorial", ranking=politica_ranking(args),
+                                        fase2=args.fase2, validar=not args.sem_validacao)
+        servir(servico, porta=args.porta)
+        return
+    args.motor = args.motor or "objetos"
+
+    # com --linha-tempo as imagens saem do rastro: nada de PNG nem matplotlib
+    sem_imagens = args.headless or bool(args.linha_tempo)
+    grafo = Grafo(visualizacoes=not sem_imagens, rastro=bool(args.rastro or args.linha_tempo),
+                  perfil=args.profile is not None, ranking=politica_ranking(args),
+                  validar=not args.sem_validacao)
     grafo.iniciar()
     grafo.imprimir()
     grafo.imprimir_arestas()
-    
-    grafo.emparelhar()
+
+    grafo.emparelhar(motor=args.motor, max_workers=args.workers, fase2=args.fase2)
+    grafo.aguardar_visualizacoes()
+    if args.rastro:
+        grafo.rastro.salvar(args.rastro)
+    if args.linha_tempo:
+        exportar_linha_tempo(grafo.rastro, args.linha_tempo)
+    if args.estatisticas:
+        with open(args.estatisticas, "w", encoding="utf-8") as arq:
+            arq.write(grafo.estatisticas.para_json(indent=2))
+    if args.validacao and grafo.validacao is not None:
+        with open(args.validacao, "w", encoding="utf-8") as arq:
+            arq.write(grafo.validacao.para_json(indent=2))
+    if args.banco:
+        from entidades.banco import BancoExecucoes
+
+        with BancoExecucoes(args.banco) as banco:
+            execucao_id = banco.registrar(grafo, motor=args.motor)
+        print(f"-> Execução {execucao_id} registrada em {args.banco}")
+    if args.verificar:
+        verificacao = grafo.verificar()
+        print(f"\n🔎 VERIFICAÇÃO: {verificacao.resumo()}")
+        if args.verificar != "-":
+            with open(args.verificar, "w", encoding="utf-8") as arq:
+                arq.write(verificacao.para_json(indent=2))
+    if args.profile == "-":
+        print(grafo.perfil.formatar())
+    elif args.profile:
+        with open(args.profile, "w", encoding="utf-8") as arq:
+            arq.write(grafo.perfil.para_json(indent=2))
+
+    if sem_imagens:
+        return
 
     # Visualizar alocação final (arestas laranja)
     grafo.visualizar("Emparelhamento final", mostrar_cores=['orange'])
-    
+
     # para ver tudo:
     # grafo.visualizar("Grafo Completo")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()